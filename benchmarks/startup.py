@@ -0,0 +1,233 @@
+"""
+Startup latency benchmarks for rya.
+
+Measures the ``python -X importtime`` cost of importing each public layer and the
+wall-clock time of end-to-end CLI runs with a number of synthetic external plugins.
+Every measurement is run in a fresh interpreter, once "cold" (with an empty bytecode
+cache) and several times "warm" (the median is reported). The script exits with
+status 1 if a warm measurement exceeds its budget from budgets.toml.
+
+Run with: python benchmarks/startup.py [--repeat N] [--json] [--budgets FILE]
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import tomllib
+from pathlib import Path
+from typing import NamedTuple, Optional
+
+LAYERS: tuple[str, ...] = (
+    "kernel",
+    "names",
+    "loggers",
+    "pre_init",
+    "utils",
+    "styles",
+    "config",
+    "plugins",
+    "cli",
+)
+COMMANDS: tuple[tuple[str, ...], ...] = (
+    ("--help",),
+    ("version",),
+    ("config", "show"),
+)
+PLUGIN_COUNTS: tuple[int, ...] = (0, 10, 100)
+DEFAULT_BUDGETS_FILE: Path = Path(__file__).parent / "budgets.toml"
+SYNTHETIC_PLUGIN_SCRIPT: str = '''import typer
+
+app = typer.Typer(help="Synthetic benchmark plugin {index}.")
+
+
+@app.command()
+def run() -> None:
+    print("{index}")
+'''
+
+
+class Measurement(NamedTuple):
+    group: str
+    name: str
+    cold_ms: float
+    warm_ms: float
+    budget_ms: Optional[float]
+
+    @property
+    def over_budget(self) -> bool:
+        return self.budget_ms is not None and self.warm_ms > self.budget_ms
+
+
+def _get_isolated_env(home: Path, pycache_prefix: Path) -> dict[str, str]:
+    env = {
+        key: value
+        for key, value in os.environ.items()
+        if not key.startswith(("XDG_", "RYA_"))
+    }
+    # platformdirs resolves the config, data, cache and log directories from HOME,
+    # so the benchmark never touches the user's own rya files.
+    env["HOME"] = str(home)
+    env["PYTHONPYCACHEPREFIX"] = str(pycache_prefix)
+    env.pop("PYTHONDONTWRITEBYTECODE", None)
+    return env
+
+
+def _parse_importtime_ms(stderr: str) -> float:
+    total_us = 0
+    for line in stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        _, cumulative, name = line.split("|", 2)
+        # Top-level imports have a single space before their name;
+        # nested imports are indented and already counted in their parent.
+        if name.startswith(" ") and not name.startswith("  "):
+            try:
+                total_us += int(cumulative)
+            except ValueError:  # Header line
+                continue
+    return total_us / 1000
+
+
+def _measure_import(layer: str, env: dict[str, str]) -> float:
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import rya.{layer}"],
+        env=env,
+        capture_output=True,
+        encoding="utf-8",
+        check=True,
+    )
+    return _parse_importtime_ms(result.stderr)
+
+
+def _measure_command(command: tuple[str, ...], env: dict[str, str]) -> float:
+    start = time.perf_counter()
+    # Exit codes are ignored: e.g., "config show" exits with 1 when
+    # there is nothing to show, which is still a valid startup path.
+    subprocess.run(
+        [sys.executable, "-m", "rya.cli", *command],
+        env=env,
+        capture_output=True,
+    )
+    return (time.perf_counter() - start) * 1000
+
+
+def _add_synthetic_plugins(home: Path, count: int) -> None:
+    # Linux platformdirs layout for user_data_dir
+    plugins_dir = home / ".local" / "share" / "rya" / "plugins"
+    if sys.platform == "darwin":
+        plugins_dir = home / "Library" / "Application Support" / "rya" / "plugins"
+    for index in range(count):
+        plugin_dir = plugins_dir / f"bench_plugin_{index}"
+        plugin_dir.mkdir(parents=True)
+        (plugin_dir / "cli.py").write_text(
+            SYNTHETIC_PLUGIN_SCRIPT.format(index=index), encoding="utf-8"
+        )
+
+
+def _measure(measure, *args, env: dict[str, str], repeat: int) -> tuple[float, float]:
+    with tempfile.TemporaryDirectory(prefix="rya-bench-pycache-") as cold_pycache:
+        cold = measure(*args, {**env, "PYTHONPYCACHEPREFIX": cold_pycache})
+    measure(*args, env)  # Fills the shared bytecode cache for the warm runs
+    warm = statistics.median(measure(*args, env) for _ in range(repeat))
+    return cold, warm
+
+
+def run_benchmarks(budgets: dict, repeat: int) -> list[Measurement]:
+    measurements: list[Measurement] = []
+    layer_budgets: dict = budgets.get("layers", {})
+    with tempfile.TemporaryDirectory(prefix="rya-bench-") as tmp:
+        env = _get_isolated_env(Path(tmp) / "home", Path(tmp) / "pycache")
+        for layer in LAYERS:
+            cold, warm = _measure(_measure_import, layer, env=env, repeat=repeat)
+            measurements.append(
+                Measurement(
+                    "import", f"rya.{layer}", cold, warm, layer_budgets.get(layer)
+                )
+            )
+    for plugin_count in PLUGIN_COUNTS:
+        command_budgets: dict = budgets.get("commands", {}).get(
+            f"plugins_{plugin_count}", {}
+        )
+        with tempfile.TemporaryDirectory(prefix="rya-bench-") as tmp:
+            home = Path(tmp) / "home"
+            _add_synthetic_plugins(home, plugin_count)
+            env = _get_isolated_env(home, Path(tmp) / "pycache")
+            for command in COMMANDS:
+                command_name = " ".join(command)
+                cold, warm = _measure(
+                    _measure_command, command, env=env, repeat=repeat
+                )
+                measurements.append(
+                    Measurement(
+                        f"rya ({plugin_count} plugins)",
+                        f"rya {command_name}",
+                        cold,
+                        warm,
+                        command_budgets.get(command_name),
+                    )
+                )
+    return measurements
+
+
+def print_table(measurements: list[Measurement]) -> None:
+    header = ("Group", "Benchmark", "Cold (ms)", "Warm (ms)", "Budget (ms)", "")
+    rows = [
+        (
+            m.group,
+            m.name,
+            f"{m.cold_ms:.1f}",
+            f"{m.warm_ms:.1f}",
+            "-" if m.budget_ms is None else f"{m.budget_ms:.1f}",
+            "OVER BUDGET" if m.over_budget else "",
+        )
+        for m in measurements
+    ]
+    widths = [max(len(row[i]) for row in (header, *rows)) for i in range(len(header))]
+    for row in (header, *rows):
+        print("  ".join(cell.ljust(width) for cell, width in zip(row, widths)))
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark rya startup latency.")
+    parser.add_argument(
+        "--repeat", type=int, default=5, help="Number of warm runs (median is used)."
+    )
+    parser.add_argument(
+        "--budgets",
+        type=Path,
+        default=DEFAULT_BUDGETS_FILE,
+        help="TOML file with the warm time budgets in milliseconds.",
+    )
+    parser.add_argument(
+        "--json", action="store_true", help="Print the results as JSON."
+    )
+    args = parser.parse_args()
+    with args.budgets.open("rb") as f:
+        budgets = tomllib.load(f)
+    measurements = run_benchmarks(budgets, max(args.repeat, 1))
+    if args.json:
+        print(
+            json.dumps(
+                [{**m._asdict(), "over_budget": m.over_budget} for m in measurements],
+                indent=4,
+            )
+        )
+    else:
+        print_table(measurements)
+    if over_budget := [m for m in measurements if m.over_budget]:
+        print(
+            f"\n{len(over_budget)} benchmark(s) exceeded their budget: "
+            f"{', '.join(f'{m.name} [{m.group}]' for m in over_budget)}",
+            file=sys.stderr,
+        )
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,128 @@
+"""
+Keeps the ``if TYPE_CHECKING:`` imports of the layer ``__init__`` modules in sync
+with their ``get_lazy_exports`` tables.
+
+The export table is the source of truth: the ``TYPE_CHECKING`` block (which is only
+there for type checkers and IDEs) is generated from it. Every lazily exported name
+must also be listed in the module's ``__all__``.
+
+Run with: python scripts/lazy_exports.py [--check]
+"""
+
+import argparse
+import ast
+import sys
+from pathlib import Path
+
+SOURCE_DIR: Path = Path(__file__).parent.parent / "src" / "rya"
+LINE_LENGTH: int = 88
+INDENT: str = "    "
+
+
+def _get_export_table(tree: ast.Module) -> dict[str, list[str]] | None:
+    for node in ast.walk(tree):
+        if (
+            isinstance(node, ast.Call)
+            and isinstance(node.func, ast.Name)
+            and node.func.id == "get_lazy_exports"
+        ):
+            table = node.args[2] if len(node.args) > 2 else node.keywords[0].value
+            return {
+                module_name: list(names)
+                for module_name, names in ast.literal_eval(table).items()
+            }
+    return None
+
+
+def _get_type_checking_block(tree: ast.Module) -> ast.If | None:
+    for node in tree.body:
+        if (
+            isinstance(node, ast.If)
+            and isinstance(node.test, ast.Name)
+            and node.test.id == "TYPE_CHECKING"
+        ):
+            return node
+    return None
+
+
+def _get_all(tree: ast.Module) -> list[str]:
+    for node in tree.body:
+        if isinstance(node, ast.Assign) and any(
+            isinstance(target, ast.Name) and target.id == "__all__"
+            for target in node.targets
+        ):
+            return list(ast.literal_eval(node.value))
+    return []
+
+
+def _format_import(module_name: str, names: list[str]) -> list[str]:
+    line = f"{INDENT}from {module_name} import {', '.join(names)}"
+    if len(line) <= LINE_LENGTH:
+        return [line]
+    return [
+        f"{INDENT}from {module_name} import (",
+        *(f"{INDENT * 2}{name}," for name in names),
+        f"{INDENT})",
+    ]
+
+
+def sync_module(path: Path, check: bool) -> list[str]:
+    source = path.read_text(encoding="utf-8")
+    tree = ast.parse(source)
+    if (export_table := _get_export_table(tree)) is None:
+        return []
+    problems: list[str] = []
+    all_names = _get_all(tree)
+    for names in export_table.values():
+        problems.extend(
+            f"{path}: '{name}' is lazily exported but not in __all__"
+            for name in names
+            if name not in all_names
+        )
+    if (block := _get_type_checking_block(tree)) is None or block.end_lineno is None:
+        problems.append(f"{path}: no 'if TYPE_CHECKING:' block found")
+        return problems
+    lines = source.splitlines(keepends=True)
+    generated = [
+        "if TYPE_CHECKING:\n",
+        *(
+            f"{line}\n"
+            for module_name, names in export_table.items()
+            for line in _format_import(module_name, names)
+        ),
+    ]
+    current = lines[block.lineno - 1 : block.end_lineno]
+    if current != generated:
+        if check:
+            problems.append(
+                f"{path}: TYPE_CHECKING imports are out of sync with the export table"
+            )
+        else:
+            lines[block.lineno - 1 : block.end_lineno] = generated
+            path.write_text("".join(lines), encoding="utf-8")
+            print(f"Updated {path}")
+    return problems
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(
+        description="Generate the TYPE_CHECKING imports from the lazy export tables."
+    )
+    parser.add_argument(
+        "--check",
+        action="store_true",
+        help="Only report modules that are out of sync (exit status 1).",
+    )
+    args = parser.parse_args()
+    problems: list[str] = []
+    for path in sorted(SOURCE_DIR.rglob("__init__.py")):
+        if "_vendor" in path.parts:
+            continue
+        problems.extend(sync_module(path, args.check))
+    for problem in problems:
+        print(problem, file=sys.stderr)
+    return 1 if problems else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,4 +1,16 @@
-from ._cli_handler import initiate_cli_startup
+from typing import TYPE_CHECKING
+
+from ..kernel import get_lazy_exports
+
+# Imported eagerly: "app" is also the name of a submodule, and importing the
+# submodule would otherwise bind the module object to this package attribute.
 from .app import app
 
+if TYPE_CHECKING:
+    from ._cli_handler import initiate_cli_startup
+
+__getattr__, __dir__ = get_lazy_exports(
+    __name__, globals(), {"._cli_handler": ("initiate_cli_startup",)}
+)
+
 __all__ = ["app", "initiate_cli_startup"]
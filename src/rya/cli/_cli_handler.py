@@ -18,11 +18,12 @@ from ._cli_handler_utils import (
 )
 from ._click_help import apply_click_typer_help_patch
 from ._message_panel import messages_panel
+from ._plugin_handler import PluginLoaderEnvVars
 from ._plugin_loader import PluginLoader
 from .doc import MainAppCLIDoc
 from ..config import AppConfig, ConfigMaker
 # noinspection PyProtectedMember
-from ..kernel import ConfigFileModel, DebugMode, Exit
+from ..kernel import ConfigFileModel, DebugMode, Exit, StartupProfiler
 from ..loggers import get_logger
 from ..names import AppIdentity, run_early_list, app_locations
 from ..plugins.commons import Typer
@@ -44,7 +45,10 @@ logger = get_logger()
 
 
 def initiate_cli_startup(app: Typer):
-    DebugMode(AppIdentity.app_name).load(reload=True, verbose=False)
+    StartupProfiler(AppIdentity.app_name).load()
+    with StartupProfiler.span("DebugMode.load"):
+        DebugMode(AppIdentity.app_name).load(reload=True, verbose=False)
+    PluginLoaderEnvVars(AppIdentity.app_name).load()
     # noinspection PyPep8Naming
     CLIConfigFileType = Annotated[
         Optional[str],
@@ -64,10 +68,12 @@ def initiate_cli_startup(app: Typer):
         if is_run_with_help_arg(ctx) or should_skip:
             return
         global_options = {"global_options": {"config_file": config_file}}
-        user_callback(**global_options)
+        with StartupProfiler.span("user_callback"):
+            user_callback(**global_options)
         # GlobalCLICallback is run before configuration validation
         logger.debug("Running global callbacks at the CLI startup.")
-        global_cli_super_startup_callback.call_callbacks()
+        with StartupProfiler.span("global_cli_super_startup_callback"):
+            global_cli_super_startup_callback.call_callbacks()
 
         def show_aggressive_log_message():
             for log_data in messages_list:
@@ -121,10 +127,12 @@ def initiate_cli_startup(app: Typer):
                     "run_early_list is not empty. run_early_list functions did "
                     "not get the latest validated configuration model."
                 )
-            validate_configuration()
+            with StartupProfiler.span("validate_configuration"):
+                validate_configuration()
         show_aggressive_log_message()
         logger.debug("Running global callbacks after configuration validation.")
-        global_cli_graceful_callback.call_callbacks()
+        with StartupProfiler.span("global_cli_graceful_callback"):
+            global_cli_graceful_callback.call_callbacks()
         if calling_sub_command_name is None:
             # This is where we know that the app is run with no sub-commands or options
             if no_arg_cmd := getattr(app, "no_arg_command", None):
@@ -156,17 +164,20 @@ def initiate_cli_startup(app: Typer):
             f"callback log container."
         )
         return
-    apply_click_typer_help_patch(app, messages_panel)
-    call_run_early_list()
-    load_plugins(
-        PluginLoader(
-            typer_app=app,
-            internal_plugins_panel_name=TyperRichPanelNames.internal_plugins,
-            external_plugins_panel_name=TyperRichPanelNames.external_plugins,
-        ),
-        cli_startup_for_plugins,
-        cli_cleanup_for_external_plugins,
-    )
+    with StartupProfiler.span("apply_click_typer_help_patch"):
+        apply_click_typer_help_patch(app, messages_panel)
+    with StartupProfiler.span("call_run_early_list"):
+        call_run_early_list()
+    with StartupProfiler.span("load_plugins"):
+        load_plugins(
+            PluginLoader(
+                typer_app=app,
+                internal_plugins_panel_name=TyperRichPanelNames.internal_plugins,
+                external_plugins_panel_name=TyperRichPanelNames.external_plugins,
+            ),
+            cli_startup_for_plugins,
+            cli_cleanup_for_external_plugins,
+        )
     # Must be run after all plugins are loaded as they are given
     # a chance to modify ResultCallbackHandler.is_store_okay
     check_result_callback_log_container()
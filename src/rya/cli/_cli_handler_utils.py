@@ -5,23 +5,34 @@ import click
 from click import Context
 from pydantic import BaseModel
 
-from ._plugin_handler import ext_plugin_def
+from ._plugin_handler import (
+    ExternalPluginHandler,
+    InternalPluginHandler,
+    ext_plugin_def,
+)
 from ._plugin_loader import PluginLoader
-from ._venv_state_manager import switch_venv_state
+from ._venv_state_manager import get_site_packages_index, switch_venv_state
 from ..config import AppConfig
 # noinspection PyProtectedMember
 from ..config._model_handler import NoConfigModelRegistrationFound
-from ..kernel import ResultCallbackHandler, global_log_record_container
+from ..kernel import (
+    ResultCallbackHandler,
+    StartupProfiler,
+    global_log_record_container,
+)
 from ..loggers import get_logger
 from ..names import run_early_list
 from ..plugins.commons import Typer
 from ..pre_init import get_cached_data, update_meta_cache
+from ..utils import get_python_version_index
 
 logger = get_logger()
 
 
 def validate_configuration() -> BaseModel:
-    validated_config = AppConfig.validate(errors="ignore+", reload=True)
+    validated_config = AppConfig.validate(
+        errors="ignore+", reload=True, use_session=True
+    )
     if AppConfig.exceptions:
         for exc in AppConfig.exceptions:
             if not isinstance(exc, NoConfigModelRegistrationFound):
@@ -45,7 +56,8 @@ def load_plugins(
     cli_startup_for_plugins: Callable,
     cli_cleanup_for_plugins: Callable,
 ) -> None:
-    plugin_loader.add_internal_plugins(callback=cli_startup_for_plugins)
+    with StartupProfiler.span("add_internal_plugins"):
+        plugin_loader.add_internal_plugins(callback=cli_startup_for_plugins)
     PluginLoader._internal_plugins_loaded = True
     # The caching here is mainly for the "config meta command" for now
     cache = get_cached_data()
@@ -59,24 +71,27 @@ def load_plugins(
             internal_plugins=list(
                 PluginLoader.loaded_internal_plugins.keys(),
             ),
+            internal_plugins_index=InternalPluginHandler.get_plugin_index(),
         )
         return
-    plugin_loader.add_external_plugins(
-        callback=cli_startup_for_plugins,
-        result_callback=cli_cleanup_for_plugins,
-    )
+    with StartupProfiler.span("add_external_plugins"):
+        plugin_loader.add_external_plugins(
+            callback=cli_startup_for_plugins,
+            result_callback=cli_cleanup_for_plugins,
+        )
     PluginLoader._external_plugins_loaded = True
-    cache.app_meta.external_plugins = list(
-        PluginLoader.loaded_external_plugins.keys(),
-    )
     update_meta_cache(
         cache,
         internal_plugins=list(
             PluginLoader.loaded_internal_plugins.keys(),
         ),
+        internal_plugins_index=InternalPluginHandler.get_plugin_index(),
         external_plugins=list(
             PluginLoader.loaded_external_plugins.keys(),
         ),
+        external_plugins_index=ExternalPluginHandler.get_plugin_index(),
+        external_python_versions=get_python_version_index(),
+        venv_site_packages=get_site_packages_index(),
     )
 
 
@@ -33,9 +33,12 @@ def apply_click_typer_help_patch(app: Typer, messages_panel: Callable) -> None:
                 result_callback=Typer.get_cli_help_result_callbacks(),
             )
         case _:
+            import typer.rich_utils
+
             Typer.add_cli_help_result_callback(messages_panel)
             typer.rich_utils.rich_format_help = partial(
                 rich_format_help_with_callback,
+                original_rich_format_help=typer.rich_utils.rich_format_help,
                 callback=Typer.get_cli_help_callbacks(),
                 result_callback=Typer.get_cli_help_result_callbacks(),
             )
@@ -0,0 +1,59 @@
+from collections.abc import Callable
+from typing import ClassVar
+
+import click
+import typer
+
+from ..loggers import get_logger
+
+# Importing plugins.commons makes sure rich-click's patch_typer
+# (if enabled) has already replaced typer.core.TyperGroup
+from ..plugins.commons import Typer
+
+logger = get_logger()
+
+
+class LazyTyperGroup(typer.core.TyperGroup):
+    # Keyed by the lowercase command name, since plugin names are
+    # compared case-insensitively (e.g., when a plugin is disabled)
+    _lazy_loaders: ClassVar[dict[str, Callable[[], click.Command]]] = {}
+
+    @classmethod
+    def add_lazy_command(cls, name: str, loader: Callable[[], click.Command]) -> None:
+        cls._lazy_loaders[name.lower()] = loader
+
+    @classmethod
+    def remove_lazy_command(cls, name: str) -> None:
+        cls._lazy_loaders.pop(name.lower(), None)
+
+    @classmethod
+    def is_lazy_command(cls, name: str) -> bool:
+        return name.lower() in cls._lazy_loaders
+
+    @classmethod
+    def enable_for(cls, typer_app: Typer) -> bool:
+        group_cls = typer_app.info.cls
+        if group_cls is None or isinstance(group_cls, typer.models.DefaultPlaceholder):
+            typer_app.info.cls = cls
+            return True
+        if isinstance(group_cls, type) and issubclass(group_cls, cls):
+            return True
+        logger.debug(
+            f"Typer app uses a custom group class {group_cls} that is not a "
+            f"subclass of {cls.__name__}. Plugins will not be loaded lazily."
+        )
+        return False
+
+    def resolve_command(
+        self, ctx: click.Context, args: list[str]
+    ) -> tuple[str | None, click.Command | None, list[str]]:
+        # Lazy commands are registered as placeholder groups, which is enough
+        # for listing them in help pages. The placeholder is swapped for the
+        # real command only when Click resolves the command for invocation
+        # (or completion), so the command order in self.commands is kept.
+        if args:
+            cmd_name = click.utils.make_str(args[0])
+            if cmd_name in self.commands and self.is_lazy_command(cmd_name):
+                logger.debug(f"Lazily loading command '{cmd_name}'.")
+                self.commands[cmd_name] = self._lazy_loaders.pop(cmd_name.lower())()
+        return super().resolve_command(ctx, args)
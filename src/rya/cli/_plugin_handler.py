@@ -1,16 +1,24 @@
+import hashlib
 import importlib.util
 import logging
 import os
 import sys
+import tomllib
 from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import ExitStack
+from functools import partial
 from pathlib import Path
-from typing import Generator, List, Optional, Tuple
+from typing import Callable, ClassVar, Generator, List, Optional, Tuple
 
 import typer
 from dynaconf.vendor.ruamel.yaml.scanner import ScannerError
 from dynaconf.vendor.tomllib import TOMLDecodeError
 from properpath import P
-from pydantic import ValidationError
+from pydantic import BaseModel, ValidationError
+from pydantic.experimental.missing_sentinel import MISSING
+from typer.main import solve_typer_info_help
+from typer.models import TyperInfo
 
 from ..config import get_dynaconf_settings
 
@@ -20,10 +28,19 @@ from ..config._names import (
     ExternalPluginLoaderDefinitions,
     ExternalPluginMetadataDefinitions,
     InternalPluginLoaderDefinitions,
+    PluginDefinitions,
+)
+from ..kernel import (
+    ExternalPluginIndexCacheModel,
+    LayerLoader,
+    PluginTyperAppCacheModel,
+    StartupProfiler,
+    get_path_fingerprint,
+    is_missing,
 )
-from ..kernel import LayerLoader, SafeCWD
 from ..loggers import get_logger
 from ..names import AppIdentity
+from ..pre_init import get_cached_data
 from ..utils import add_message, get_dynaconf_core_loader
 from ._venv_state_manager import switch_venv_state
 
@@ -35,7 +52,9 @@ PluginInfo = namedtuple(
         "path",
         "venv",
         "project_dir",
+        "lazy_loader",
     ],
+    defaults=[None],
 )
 
 
@@ -44,8 +63,81 @@ ext_plugin_def = ExternalPluginLoaderDefinitions()
 ext_plugin_meta = ExternalPluginMetadataDefinitions()
 
 
+class PluginLoaderEnvVars:
+    # <PREFIX>_LAZY_PLUGINS opts in to lazy plugin loading: "internal",
+    # "external", "internal,external", or "all" (also "1", "true", "on").
+    lazy_load_envvar_suffix: ClassVar[str] = "LAZY_PLUGINS"
+    lazy_load_all_values: ClassVar[tuple[str, ...]] = ("1", "true", "on", "all")
+    lazy_load_none_values: ClassVar[tuple[str, ...]] = ("", "0", "false", "off")
+    # <PREFIX>_PLUGIN_DISCOVERY_WORKERS sets the number of threads that
+    # validate external plugin directories (see discovery_max_workers).
+    discovery_workers_envvar_suffix: ClassVar[str] = "PLUGIN_DISCOVERY_WORKERS"
+
+    def __init__(self, envvar_prefix: str) -> None:
+        self.envvar_prefix = envvar_prefix.upper()
+
+    def load(self) -> None:
+        lazy_load_envvar = f"{self.envvar_prefix}_{self.lazy_load_envvar_suffix}"
+        if (value := os.getenv(lazy_load_envvar)) is not None:
+            self._load_lazy_load(lazy_load_envvar, value.strip().lower())
+        discovery_workers_envvar = (
+            f"{self.envvar_prefix}_{self.discovery_workers_envvar_suffix}"
+        )
+        if (value := os.getenv(discovery_workers_envvar)) is not None:
+            self._load_discovery_workers(discovery_workers_envvar, value.strip())
+
+    def _load_lazy_load(self, envvar: str, value: str) -> None:
+        plugin_defs: dict[str, PluginDefinitions] = {
+            int_plugin_def.name: int_plugin_def,
+            ext_plugin_def.name: ext_plugin_def,
+        }
+        if value in self.lazy_load_all_values:
+            lazy_names = set(plugin_defs)
+        elif value in self.lazy_load_none_values:
+            lazy_names = set()
+        elif not (lazy_names := set(map(str.strip, value.split(",")))) <= (
+            plugin_defs.keys()
+        ):
+            logger.warning(
+                f"Environment variable value '{value}' for '{envvar}' is not "
+                f"recognized. Supported values are: "
+                f"{', '.join((*plugin_defs, self.lazy_load_all_values[-1]))}. "
+                f"Plugins are loaded as configured."
+            )
+            return
+        for name, plugin_def in plugin_defs.items():
+            plugin_def.lazy_load = name in lazy_names
+
+    @staticmethod
+    def _load_discovery_workers(envvar: str, value: str) -> None:
+        try:
+            workers = int(value)
+        except ValueError:
+            workers = 0
+        if workers < 1:
+            logger.warning(
+                f"Environment variable value '{value}' for '{envvar}' must be "
+                f"a positive integer. {ext_plugin_def.discovery_max_workers} "
+                f"workers will be used for plugin discovery."
+            )
+            return
+        ext_plugin_def.discovery_max_workers = workers
+
+
+def get_typer_app_index(
+    typer_app: typer.Typer, cli_script: Path
+) -> PluginTyperAppCacheModel:
+    return PluginTyperAppCacheModel(
+        fingerprint=get_path_fingerprint(cli_script),
+        name=typer_app.info.name,
+        help=solve_typer_info_help(TyperInfo(typer_app)) or None,
+        rich_help_panel=typer_app.rich_help_panel or None,
+    )
+
+
 class InternalPluginHandler:
     _current_layer_name: str = P(__file__).parent.name
+    _plugin_index: ClassVar[Optional[dict[str, PluginTyperAppCacheModel]]] = None
 
     @classmethod
     def get_plugin_locations(cls) -> List[Tuple[str, Path]]:
@@ -59,29 +151,85 @@ class InternalPluginHandler:
         return _paths
 
     @classmethod
-    def get_typer_apps(cls) -> Generator[typer.Typer | None, None, None]:
-        for plugin_name, path in cls.get_plugin_locations():
-            spec = importlib.util.spec_from_file_location(
-                plugin_name,
-                path / int_plugin_def.typer_app_file_name,
+    def get_plugin_index(cls) -> dict[str, PluginTyperAppCacheModel]:
+        if cls._plugin_index is None:
+            cached_plugin_index = getattr(
+                get_cached_data().app_meta, "internal_plugins_index", MISSING
             )
-            module = importlib.util.module_from_spec(spec)
-            sys.modules[spec.name] = module
-            # noinspection PyProtectedMember
-            module.__package__ = f"{
-                __package__.replace(
-                    LayerLoader._self_app_name, AppIdentity.app_name, 1
-                ).replace(cls._current_layer_name, int_plugin_def.directory_name, 1)
-            }.{plugin_name}"
-            # Since we use relative imports, Python will try to find the module
-            # relative to the __package__ path. Without this module.__package__
-            # modification, Python will throw an ImportError:
-            # ImportError: attempted relative import with no known parent package
+            cls._plugin_index = (
+                {} if is_missing(cached_plugin_index) else dict(cached_plugin_index)
+            )
+        return cls._plugin_index
+
+    @classmethod
+    def load_typer_app(cls, plugin_name: str, path: Path) -> Optional[typer.Typer]:
+        spec = importlib.util.spec_from_file_location(
+            plugin_name,
+            path / int_plugin_def.typer_app_file_name,
+        )
+        module = importlib.util.module_from_spec(spec)
+        sys.modules[spec.name] = module
+        # noinspection PyProtectedMember
+        module.__package__ = f"{
+            __package__.replace(
+                LayerLoader._self_app_name, AppIdentity.app_name, 1
+            ).replace(cls._current_layer_name, int_plugin_def.directory_name, 1)
+        }.{plugin_name}"
+        # Since we use relative imports, Python will try to find the module
+        # relative to the __package__ path. Without this module.__package__
+        # modification, Python will throw an ImportError:
+        # ImportError: attempted relative import with no known parent package
+        with StartupProfiler.span(plugin_name, category="plugin_import"):
             spec.loader.exec_module(module)
-            try:
-                yield getattr(module, int_plugin_def.typer_app_var_name)
-            except AttributeError:
-                yield None
+        return getattr(module, int_plugin_def.typer_app_var_name, None)
+
+    @classmethod
+    def get_typer_apps(
+        cls, lazy: bool = False
+    ) -> Generator[Optional[PluginInfo], None, None]:
+        plugin_index = cls.get_plugin_index()
+        plugin_locations = cls.get_plugin_locations()
+        for stale_plugin_name in plugin_index.keys() - {
+            plugin_name for plugin_name, _ in plugin_locations
+        }:
+            plugin_index.pop(stale_plugin_name)
+        for plugin_name, path in plugin_locations:
+            cli_script = path / int_plugin_def.typer_app_file_name
+            indexed_app = plugin_index.get(plugin_name)
+            if (
+                lazy
+                and indexed_app is not None
+                and indexed_app.fingerprint == get_path_fingerprint(cli_script)
+            ):
+                yield PluginInfo(
+                    typer.Typer(
+                        name=indexed_app.name,
+                        help=indexed_app.help,
+                        rich_help_panel=indexed_app.rich_help_panel,
+                    ),
+                    path,
+                    None,
+                    None,
+                    partial(cls.load_typer_app, plugin_name, path),
+                )
+                continue
+            typer_app = cls.load_typer_app(plugin_name, path)
+            if typer_app is None:
+                plugin_index.pop(plugin_name, None)
+                yield
+                continue
+            plugin_index[plugin_name] = get_typer_app_index(typer_app, cli_script)
+            yield PluginInfo(typer_app, path, None, None)
+
+
+class InvalidPluginMetadata(Exception): ...
+
+
+class ExternalPluginMetadataModel(BaseModel):
+    plugin_name: Optional[str] = None
+    cli_script: Optional[P] = None
+    venv_dir: Optional[P] = None
+    project_dir: Optional[P] = None
 
 
 class ExternalPluginLocationValidator:
@@ -105,7 +253,23 @@ class ExternalPluginLocationValidator:
         self._location = value
 
     @staticmethod
-    def _get_validated_metadata(location: P | Path, /):
+    def _read_metadata_file(plugin_metadata_file: Path, /) -> dict:
+        if ext_plugin_def.dynaconf_metadata_reader is True:
+            plugin_settings_args = DynaConfArgs(
+                settings_files=[str(plugin_metadata_file)],
+                core_loaders=list(get_dynaconf_core_loader(ext_plugin_def.file_ext)),
+            )
+            plugin_settings = get_dynaconf_settings(plugin_settings_args)
+            plugin_settings.reload()
+            raw_metadata = plugin_settings.as_dict()
+        else:
+            with plugin_metadata_file.open("rb") as f:
+                raw_metadata = tomllib.load(f)
+        # Dynaconf keys are case-insensitive, so the same is kept for tomllib.
+        return {str(key).lower(): value for key, value in raw_metadata.items()}
+
+    @classmethod
+    def _get_validated_metadata(cls, location: P | Path, /):
         parsed_metadata: dict = {
             ext_plugin_meta.file_exists: None,
             ext_plugin_meta.cli_script_path: None,
@@ -113,119 +277,82 @@ class ExternalPluginLocationValidator:
         }
         if (plugin_metadata_file := (location / ext_plugin_def.file_name)).exists():
             parsed_metadata[ext_plugin_meta.file_exists] = True
-            plugin_settings_args = DynaConfArgs(
-                settings_files=[str(plugin_metadata_file)],
-                core_loaders=list(get_dynaconf_core_loader(ext_plugin_def.file_ext)),
-            )
-            plugin_settings = get_dynaconf_settings(plugin_settings_args)
             try:
-                plugin_settings.reload()
-            except (ScannerError, TOMLDecodeError) as e:
-                raise ValidationError(
+                raw_metadata = cls._read_metadata_file(plugin_metadata_file)
+            except (ScannerError, TOMLDecodeError, tomllib.TOMLDecodeError) as e:
+                raise InvalidPluginMetadata(
                     f"Plugin metadata file {plugin_metadata_file} exists, "
                     f"but it couldn't be parsed. Exception details: {e}"
+                ) from e
+            try:
+                plugin_metadata = ExternalPluginMetadataModel.model_validate(
+                    raw_metadata
                 )
-            else:
-                try:
-                    cli_script_path = plugin_settings[ext_plugin_meta.cli_script_path]
-                except KeyError:
-                    if (
-                        typer_app_file := (
-                            location / ext_plugin_def.typer_app_file_name
-                        )
-                    ).exists():
-                        parsed_metadata[ext_plugin_meta.cli_script_path] = (
-                            typer_app_file
-                        )
-                    else:
-                        raise ValidationError(
-                            f"{location} has the plugin metadata file, but no "
-                            f"'{ext_plugin_meta.cli_script_path}' path is "
-                            f"defined inside. No "
-                            f"{ext_plugin_def.typer_app_file_name} script is found as well."
-                        )
-                else:
-                    try:
-                        cli_script_path = P(cli_script_path)
-                    except (TypeError, ValueError):
-                        raise ValidationError(
-                            f"Key '{ext_plugin_meta.cli_script_path}' "
-                            f"exists in {plugin_metadata_file}, but its assigned "
-                            f"value '{cli_script_path}' is invalid."
-                        )
-                    else:
-                        if cli_script_path.exists():
-                            parsed_metadata[ext_plugin_meta.cli_script_path] = (
-                                cli_script_path.absolute()
-                            )
-                        else:
-                            raise ValidationError(
-                                f"Key '{ext_plugin_meta.cli_script_path}' "
-                                f"exists in {plugin_metadata_file}, but the path "
-                                f"'{cli_script_path}' does not exist."
-                            )
-                try:
-                    venv_path = plugin_settings[ext_plugin_meta.venv_path]
-                except KeyError:
-                    parsed_metadata[ext_plugin_meta.venv_path] = None
-                else:
-                    try:
-                        venv_path = P(venv_path)
-                    except (TypeError, ValueError):
-                        raise ValidationError(
-                            f"Key '{ext_plugin_meta.venv_path}' "
-                            f"exists in {plugin_metadata_file}, but its assigned "
-                            f"value '{venv_path}' is invalid."
-                        )
-                    else:
-                        if venv_path.exists():
-                            parsed_metadata[ext_plugin_meta.venv_path] = (
-                                venv_path.absolute()
-                            )
-                        else:
-                            raise ValidationError(
-                                f"Key '{ext_plugin_meta.venv_path}' "
-                                f"exists in {plugin_metadata_file}, but the path "
-                                f"'{venv_path}' does not exist."
-                            )
-                try:
-                    project_path = plugin_settings[ext_plugin_meta.project_path]
-                except KeyError:
-                    parsed_metadata[ext_plugin_meta.project_path] = parsed_metadata[
-                        ext_plugin_meta.cli_script_path
-                    ].parent
-                else:
-                    try:
-                        project_path = P(project_path)
-                    except (TypeError, ValueError):
-                        raise ValidationError(
-                            f"Key '{ext_plugin_meta.project_path}' "
-                            f"exists in {plugin_metadata_file}, but its assigned "
-                            f"value '{project_path}' is invalid."
-                        )
-                    else:
-                        if project_path.exists():
-                            parsed_metadata[ext_plugin_meta.project_path] = (
-                                project_path.absolute()
-                            )
-                        else:
-                            raise ValidationError(
-                                f"Key '{ext_plugin_meta.project_path}' "
-                                f"exists in {plugin_metadata_file}, but the path "
-                                f"'{project_path}' does not exist."
-                            )
-                try:
-                    plugin_name = plugin_settings[ext_plugin_meta.plugin_name]
-                except KeyError:
-                    parsed_metadata[ext_plugin_meta.plugin_name] = location.name
+            except ValidationError as e:
+                error = e.errors()[0]
+                raise InvalidPluginMetadata(
+                    f"Key '{error['loc'][0]}' "
+                    f"exists in {plugin_metadata_file}, but its assigned "
+                    f"value '{error['input']}' is invalid."
+                ) from e
+            if (cli_script_path := plugin_metadata.cli_script) is None:
+                if (
+                    typer_app_file := (location / ext_plugin_def.typer_app_file_name)
+                ).exists():
+                    parsed_metadata[ext_plugin_meta.cli_script_path] = typer_app_file
                 else:
-                    if location.name != plugin_name:
-                        raise ValidationError(
-                            f"Key '{ext_plugin_meta.plugin_name}' "
-                            f"exists in {plugin_metadata_file}, but it must be the same "
-                            f"name as the directory name the metadata file is in."
-                        )
-                    parsed_metadata[ext_plugin_meta.plugin_name] = plugin_name
+                    raise InvalidPluginMetadata(
+                        f"{location} has the plugin metadata file, but no "
+                        f"'{ext_plugin_meta.cli_script_path}' path is "
+                        f"defined inside. No "
+                        f"{ext_plugin_def.typer_app_file_name} script is found as well."
+                    )
+            elif (location / cli_script_path).exists():
+                parsed_metadata[ext_plugin_meta.cli_script_path] = (
+                    location / cli_script_path
+                ).absolute()
+            else:
+                raise InvalidPluginMetadata(
+                    f"Key '{ext_plugin_meta.cli_script_path}' "
+                    f"exists in {plugin_metadata_file}, but the path "
+                    f"'{cli_script_path}' does not exist."
+                )
+            if (venv_path := plugin_metadata.venv_dir) is None:
+                parsed_metadata[ext_plugin_meta.venv_path] = None
+            elif (location / venv_path).exists():
+                parsed_metadata[ext_plugin_meta.venv_path] = (
+                    location / venv_path
+                ).absolute()
+            else:
+                raise InvalidPluginMetadata(
+                    f"Key '{ext_plugin_meta.venv_path}' "
+                    f"exists in {plugin_metadata_file}, but the path "
+                    f"'{venv_path}' does not exist."
+                )
+            if (project_path := plugin_metadata.project_dir) is None:
+                parsed_metadata[ext_plugin_meta.project_path] = parsed_metadata[
+                    ext_plugin_meta.cli_script_path
+                ].parent
+            elif (location / project_path).exists():
+                parsed_metadata[ext_plugin_meta.project_path] = (
+                    location / project_path
+                ).absolute()
+            else:
+                raise InvalidPluginMetadata(
+                    f"Key '{ext_plugin_meta.project_path}' "
+                    f"exists in {plugin_metadata_file}, but the path "
+                    f"'{project_path}' does not exist."
+                )
+            if (plugin_name := plugin_metadata.plugin_name) is None:
+                parsed_metadata[ext_plugin_meta.plugin_name] = location.name
+            elif location.name != plugin_name:
+                raise InvalidPluginMetadata(
+                    f"Key '{ext_plugin_meta.plugin_name}' "
+                    f"exists in {plugin_metadata_file}, but it must be the same "
+                    f"name as the directory name the metadata file is in."
+                )
+            else:
+                parsed_metadata[ext_plugin_meta.plugin_name] = plugin_name
         else:
             parsed_metadata[ext_plugin_meta.file_exists] = False
             if (
@@ -242,15 +369,87 @@ class ExternalPluginLocationValidator:
     def validate(self):
         if not self.location.is_dir():
             raise ValueError(f"{self.location} is not a directory.")
-        with SafeCWD():
-            os.chdir(self.location)
-            parsed_metadata = self._get_validated_metadata(self.location)
-        return parsed_metadata
+        # Relative paths in the metadata file are joined to the plugin directory
+        # instead of changing the working directory, so that plugin directories
+        # can be validated concurrently.
+        return self._get_validated_metadata(self.location.absolute())
+
+    def get_fingerprint(self) -> str:
+        # Adding, removing or renaming a file directly inside the plugin directory
+        # changes the directory's mtime. Edits to the metadata file do not,
+        # hence the metadata file content is hashed as well.
+        fingerprint = get_path_fingerprint(self.location)
+        if (plugin_metadata_file := (self.location / ext_plugin_def.file_name)).exists():
+            fingerprint += (
+                f":{hashlib.sha256(plugin_metadata_file.read_bytes()).hexdigest()}"
+            )
+        return fingerprint
 
 
 class ExternalPluginHandler:
+    _plugin_index: ClassVar[Optional[dict[str, ExternalPluginIndexCacheModel]]] = None
+
+    @classmethod
+    def get_plugin_index(cls) -> dict[str, ExternalPluginIndexCacheModel]:
+        if cls._plugin_index is None:
+            cached_plugin_index = getattr(
+                get_cached_data().app_meta, "external_plugins_index", MISSING
+            )
+            cls._plugin_index = (
+                {} if is_missing(cached_plugin_index) else dict(cached_plugin_index)
+            )
+        return cls._plugin_index
+
     @staticmethod
+    def _get_indexed_metadata(
+        plugin_index: Optional[ExternalPluginIndexCacheModel], fingerprint: str
+    ) -> Optional[dict]:
+        if plugin_index is None or plugin_index.fingerprint != fingerprint:
+            return None
+        for path in (
+            plugin_index.cli_script,
+            plugin_index.project_dir,
+            plugin_index.venv_dir,
+        ):
+            # The paths can live outside the plugin directory,
+            # so the fingerprint alone cannot vouch for them.
+            if path is not None and not path.exists():
+                return None
+        return {
+            ext_plugin_meta.file_exists: plugin_index.metadata_file_exists,
+            ext_plugin_meta.cli_script_path: plugin_index.cli_script,
+            ext_plugin_meta.venv_path: plugin_index.venv_dir,
+            ext_plugin_meta.project_path: plugin_index.project_dir,
+            ext_plugin_meta.plugin_name: plugin_index.plugin_name,
+        }
+
+    @staticmethod
+    def _get_metadata_index(
+        metadata: dict, fingerprint: str
+    ) -> ExternalPluginIndexCacheModel:
+        return ExternalPluginIndexCacheModel(
+            fingerprint=fingerprint,
+            plugin_name=metadata[ext_plugin_meta.plugin_name],
+            cli_script=metadata[ext_plugin_meta.cli_script_path],
+            project_dir=metadata[ext_plugin_meta.project_path],
+            venv_dir=metadata.get(ext_plugin_meta.venv_path),
+            metadata_file_exists=metadata[ext_plugin_meta.file_exists],
+        )
+
+    @classmethod
+    def _validate_plugin_location(
+        cls, path: P, indexed_plugin: Optional[ExternalPluginIndexCacheModel]
+    ) -> tuple[dict, str, bool]:
+        validator = ExternalPluginLocationValidator(path)
+        fingerprint = validator.get_fingerprint()
+        metadata = cls._get_indexed_metadata(indexed_plugin, fingerprint)
+        if metadata is None:
+            return validator.validate(), fingerprint, False
+        return metadata, fingerprint, True
+
+    @classmethod
     def get_plugin_metadata(
+        cls,
         loading_errors: bool = False,
     ) -> Generator[Optional[dict], None, None]:
         if ext_plugin_def.dir.exists():
@@ -261,26 +460,74 @@ class ExternalPluginHandler:
             ]
         else:
             plugin_paths = []
-        try:
-            for path in sorted(plugin_paths, key=lambda x: str(x).lower()):
-                try:
-                    metadata = ExternalPluginLocationValidator(path).validate()
-                except ValidationError as e:
-                    logger.debug(str(e))
-                    if loading_errors is True:
-                        raise e
-                    add_message(str(e))
-                    continue
-                except ValueError as e:
-                    logger.debug(str(e))
-                    if loading_errors is True:
-                        raise e
-                    continue
-                else:
-                    metadata[ext_plugin_meta.plugin_root_dir] = path
-                    yield metadata
-        except FileNotFoundError:
-            yield None
+        plugin_paths.sort(key=lambda x: str(x).lower())
+        plugin_index = cls.get_plugin_index()
+        with ExitStack() as executor_stack:
+            validation_results: list[Callable[[], tuple[dict, str, bool]]]
+            if ext_plugin_def.discovery_max_workers > 1 and len(plugin_paths) > 1:
+                # Validation (mostly file system stats and metadata file parsing)
+                # runs in the thread pool, but the results are still consumed
+                # here in the sorted order, so errors and messages are reported
+                # the same way as in sequential discovery.
+                executor = executor_stack.enter_context(
+                    ThreadPoolExecutor(
+                        max_workers=ext_plugin_def.discovery_max_workers,
+                        thread_name_prefix=f"{AppIdentity.app_name}-plugin-discovery",
+                    )
+                )
+                validation_results = [
+                    executor.submit(
+                        cls._validate_plugin_location,
+                        path,
+                        plugin_index.get(str(path)),
+                    ).result
+                    for path in plugin_paths
+                ]
+            else:
+                validation_results = [
+                    partial(
+                        cls._validate_plugin_location,
+                        path,
+                        plugin_index.get(str(path)),
+                    )
+                    for path in plugin_paths
+                ]
+            try:
+                for path, get_validation_result in zip(
+                    plugin_paths, validation_results
+                ):
+                    try:
+                        metadata, fingerprint, is_indexed = get_validation_result()
+                        if is_indexed:
+                            logger.debug(
+                                f"Plugin directory {path} is unchanged. "
+                                f"Indexed plugin metadata will be used."
+                            )
+                        else:
+                            plugin_index[str(path)] = cls._get_metadata_index(
+                                metadata, fingerprint
+                            )
+                    except InvalidPluginMetadata as e:
+                        plugin_index.pop(str(path), None)
+                        logger.debug(str(e))
+                        if loading_errors is True:
+                            raise e
+                        add_message(str(e))
+                        continue
+                    except ValueError as e:
+                        plugin_index.pop(str(path), None)
+                        logger.debug(str(e))
+                        if loading_errors is True:
+                            raise e
+                        continue
+                    else:
+                        metadata[ext_plugin_meta.plugin_root_dir] = path
+                        yield metadata
+            except FileNotFoundError:
+                yield None
+            else:
+                for stale_path in set(plugin_index) - {str(p) for p in plugin_paths}:
+                    plugin_index.pop(stale_path)
 
     @staticmethod
     def load_plugin(plugin_name: str, cli_script: Path, project_dir: Path):
@@ -292,13 +539,42 @@ class ExternalPluginHandler:
         module.__package__ = plugin_name
         # Python will find a module relative to the __package__ path,
         # without this module.__package__ change Python will throw an ImportError.
-        spec.loader.exec_module(module)
+        with StartupProfiler.span(plugin_name, category="plugin_import"):
+            spec.loader.exec_module(module)
         return module
 
+    @classmethod
+    def load_typer_app(
+        cls,
+        plugin_name: str,
+        cli_script: Path,
+        project_dir: Path,
+        venv_dir: Optional[Path] = None,
+    ) -> Optional[typer.Typer]:
+        if venv_dir is not None:
+            switch_venv_state(True, venv_dir, project_dir)
+        try:
+            module = cls.load_plugin(plugin_name, cli_script, project_dir)
+        finally:
+            # The virtual environment must not stay on sys.path, even
+            # if the plugin module fails or does not define a Typer app.
+            if venv_dir is not None:
+                switch_venv_state(False, venv_dir, project_dir)
+        try:
+            typer_app: typer.Typer = getattr(
+                module,
+                ext_plugin_def.typer_app_var_name,
+            )
+        except AttributeError:
+            return None
+        typer_app.info.name = plugin_name
+        return typer_app
+
     @classmethod
     def get_typer_apps(
-        cls, loading_errors: bool = False
+        cls, loading_errors: bool = False, lazy: bool = False
     ) -> Generator[Optional[PluginInfo], None, None]:
+        plugin_index = cls.get_plugin_index()
         for metadata in cls.get_plugin_metadata(loading_errors):
             if metadata is None:
                 break
@@ -306,108 +582,62 @@ class ExternalPluginHandler:
             cli_script: Path = metadata[ext_plugin_meta.cli_script_path]
             plugin_root_dir: Path = metadata[ext_plugin_meta.plugin_root_dir]
             project_dir: Path = metadata[ext_plugin_meta.project_path]
-            if metadata[ext_plugin_meta.file_exists] is False:
-                try:
-                    module = cls.load_plugin(plugin_name, cli_script, project_dir)
-                except (Exception, BaseException) as e:
-                    if loading_errors is True:
-                        raise e
-                    message: str = (
-                        f"An exception occurred while trying to load an external "
-                        f"plugin '{plugin_name}' in path {cli_script}. "
-                        f"Plugin '{plugin_name}' will be ignored. "
-                        f'Exception details: "{e.__class__.__name__}: {e}"'
-                    )
-                    add_message(message, logging.WARNING)
-                    yield
-                else:
-                    try:
-                        typer_app: typer.Typer = getattr(
-                            module,
-                            ext_plugin_def.typer_app_var_name,
-                        )
-                    except AttributeError:
-                        yield
-                    else:
-                        typer_app.info.name = plugin_name
-                        yield PluginInfo(
-                            typer_app,
-                            plugin_root_dir,
-                            None,
+            venv_dir: Optional[Path] = (
+                metadata[ext_plugin_meta.venv_path]
+                if metadata[ext_plugin_meta.file_exists] is True
+                else None
+            )
+            indexed_plugin = plugin_index[str(plugin_root_dir)]
+            if lazy and not is_missing(indexed_plugin.typer_app):
+                if indexed_plugin.typer_app.fingerprint == get_path_fingerprint(
+                    cli_script
+                ):
+                    # The placeholder only carries what is needed for the
+                    # help page; the plugin module is executed on first dispatch.
+                    yield PluginInfo(
+                        typer.Typer(
+                            name=plugin_name,
+                            help=indexed_plugin.typer_app.help,
+                            rich_help_panel=indexed_plugin.typer_app.rich_help_panel,
+                        ),
+                        plugin_root_dir,
+                        venv_dir,
+                        project_dir,
+                        partial(
+                            cls.load_typer_app,
+                            plugin_name,
+                            cli_script,
                             project_dir,
-                        )
+                            venv_dir,
+                        ),
+                    )
+                    continue
+                logger.debug(
+                    f"Plugin '{plugin_name}' script {cli_script} has changed since "
+                    f"it was last indexed. It will be loaded eagerly once."
+                )
+            try:
+                typer_app = cls.load_typer_app(
+                    plugin_name, cli_script, project_dir, venv_dir
+                )
+            except (Exception, BaseException) as e:
+                # Catching all exceptions here is meant for protecting
+                # the main app from failing from external plugins.
+                if loading_errors is True:
+                    raise e
+                message: str = (
+                    f"An exception occurred while trying to load an external "
+                    f"plugin '{plugin_name}'"
+                    f"{f' with virtual environment {venv_dir}' if venv_dir else ''} "
+                    f"in path {cli_script}. "
+                    f"Plugin '{plugin_name}' will be ignored. "
+                    f'Exception details: "{e.__class__.__name__}: {e}"'
+                )
+                add_message(message, logging.WARNING)
+                yield
             else:
-                venv_dir: Path = metadata[ext_plugin_meta.venv_path]
-                if venv_dir is not None:
-                    try:
-                        switch_venv_state(True, venv_dir, project_dir)
-                    except (ValueError, RuntimeError) as e:
-                        message: str = (
-                            f"An exception occurred while trying to load an external "
-                            f"plugin '{plugin_name}' with virtual environment {venv_dir} "
-                            f"in path {cli_script}. "
-                            f"Plugin '{plugin_name}' will be ignored. "
-                            f'Exception details: "{e.__class__.__name__}: {e}"'
-                        )
-                        add_message(message, logging.WARNING)
-                        yield
-                    else:
-                        try:
-                            module = cls.load_plugin(
-                                plugin_name, cli_script, project_dir
-                            )
-                        except (Exception, BaseException) as e:
-                            if loading_errors is True:
-                                raise e
-                            message: str = (
-                                f"An exception occurred while trying to load an external "
-                                f"plugin '{plugin_name}' with virtual environment {venv_dir} "
-                                f"in path {cli_script}. "
-                                f"Plugin '{plugin_name}' will be ignored. "
-                                f'Exception details: "{e.__class__.__name__}: {e}"'
-                            )
-                            add_message(message, logging.WARNING)
-                            yield
-                        else:
-                            try:
-                                typer_app: typer.Typer = getattr(
-                                    module,
-                                    ext_plugin_def.typer_app_var_name,
-                                )
-                            except AttributeError:
-                                yield
-                            else:
-                                switch_venv_state(False, venv_dir, project_dir)
-                                typer_app.info.name = plugin_name
-                                yield PluginInfo(
-                                    typer_app, plugin_root_dir, venv_dir, project_dir
-                                )
-                else:
-                    try:
-                        module = cls.load_plugin(plugin_name, cli_script, project_dir)
-                    except (Exception, BaseException) as e:
-                        # Catching all exceptions here is meant for protecting
-                        # the main app from failing from external plugins.
-                        if loading_errors is True:
-                            raise e
-                        message: str = (
-                            f"An exception occurred while trying to load an external "
-                            f"plugin '{plugin_name}' in path {cli_script}. "
-                            f"Plugin '{plugin_name}' will be ignored. "
-                            f'Exception details: "{e.__class__.__name__}: {e}"'
-                        )
-                        add_message(message, logging.WARNING)
-                        yield
-                    else:
-                        try:
-                            typer_app: typer.Typer = getattr(
-                                module,
-                                ext_plugin_def.typer_app_var_name,
-                            )
-                        except AttributeError:
-                            yield
-                        else:
-                            typer_app.info.name = plugin_name
-                            yield PluginInfo(
-                                typer_app, plugin_root_dir, None, project_dir
-                            )
+                if typer_app is None:
+                    yield
+                    continue
+                indexed_plugin.typer_app = get_typer_app_index(typer_app, cli_script)
+                yield PluginInfo(typer_app, plugin_root_dir, venv_dir, project_dir)
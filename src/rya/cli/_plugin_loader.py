@@ -1,16 +1,22 @@
+import functools
 import logging
 import platform
 from collections.abc import Callable
+from contextlib import suppress
 from typing import ClassVar, Optional
 
+import click
 import typer
 from pydantic import BaseModel, ConfigDict
+from typer.models import TyperInfo
 
+from ..config import ConfigMaker
 from ..kernel import Exit
 from ..loggers import get_logger
 from ..names import AppIdentity
 from ..plugins.commons import Typer
 from ..utils import PythonVersionCheckFailed, add_message, get_external_python_version
+from ._lazy_group import LazyTyperGroup
 from ._plugin_handler import (
     ExternalPluginHandler,
     InternalPluginHandler,
@@ -18,6 +24,7 @@ from ._plugin_handler import (
     ext_plugin_def,
     int_plugin_def,
 )
+from ._venv_state_manager import get_site_packages_dir
 
 logger = get_logger()
 
@@ -39,6 +46,8 @@ def disable_plugin(
             if plugin_name == registered_app.typer_instance.info.name:
                 main_app.registered_groups.pop(i)
                 break
+    LazyTyperGroup.remove_lazy_command(plugin_name)
+    ConfigMaker.remove_deferred_model_loader(plugin_name)
     help_message = (
         f"🚫️ Disabled{' due to ' + short_reason if short_reason is not None else ''}. "
         f"See `--help` or log file to know more."
@@ -67,6 +76,124 @@ class PluginLoader(BaseModel):
     internal_plugins_panel_name: Optional[str]
     external_plugins_panel_name: Optional[str]
 
+    def _get_click_group(self, plugin_app: typer.Typer, **kwargs) -> click.Command:
+        return typer.main.get_group_from_info(
+            TyperInfo(plugin_app, **kwargs),
+            pretty_exceptions_short=self.typer_app.pretty_exceptions_short,
+            rich_markup_mode=self.typer_app.rich_markup_mode,
+            suggest_commands=self.typer_app.suggest_commands,
+        )
+
+    @staticmethod
+    def _get_placeholder_name(plugin_info: PluginInfo) -> str:
+        if (name := plugin_info.plugin_app.info.name) is None:
+            # Placeholders are always created with the plugin name
+            raise ValueError(
+                f"Placeholder Typer app of the plugin from {plugin_info.path} "
+                f"has no name."
+            )
+        return name
+
+    @staticmethod
+    def _get_shared_lazy_loader(
+        plugin_name: str, plugin_info: PluginInfo
+    ) -> Callable[[], Optional[typer.Typer]]:
+        # A lazily loaded plugin's module is executed once: when its command is
+        # invoked, or before that, when every configuration model is needed
+        # (e.g., for "config show"), since plugins register them on import.
+        lazy_loader = functools.cache(plugin_info.lazy_loader)
+
+        def load_config_model() -> None:
+            try:
+                lazy_loader()
+            except (Exception, BaseException) as e:
+                logger.warning(
+                    f"Plugin '{plugin_name}' from {plugin_info.path} could not be "
+                    f"loaded for its configuration model. "
+                    f'Exception details: "{e.__class__.__name__}: {e}"'
+                )
+
+        ConfigMaker.add_deferred_model_loader(plugin_name, load_config_model)
+        return lazy_loader
+
+    def _add_lazy_external_plugin(
+        self,
+        plugin_info: PluginInfo,
+        callback: Callable,
+        result_callback: Callable,
+    ) -> None:
+        placeholder_app: typer.Typer = plugin_info.plugin_app
+        plugin_name: str = self._get_placeholder_name(plugin_info).lower()
+        rich_help_panel = (
+            placeholder_app.rich_help_panel or self.external_plugins_panel_name
+        )
+        lazy_loader = self._get_shared_lazy_loader(plugin_name, plugin_info)
+        if plugin_info.venv is not None:
+            # The virtual environment is only switched to on dispatch, but its
+            # site-packages directory must stay in the index of this run.
+            # A missing site-packages directory is reported when the plugin loads.
+            with suppress(ValueError):
+                get_site_packages_dir(plugin_info.venv)
+
+        def load_plugin_command() -> click.Command:
+            ConfigMaker.remove_deferred_model_loader(plugin_name)
+            try:
+                ext_app_obj = lazy_loader()
+            except (Exception, BaseException) as e:
+                logger.error(
+                    f"An exception occurred while trying to lazily load an external "
+                    f"plugin '{plugin_name}' from {plugin_info.path}. "
+                    f'Exception details: "{e.__class__.__name__}: {e}"'
+                )
+                raise Exit(1) from e
+            if ext_app_obj is None:
+                logger.error(
+                    f"External plugin '{plugin_name}' from {plugin_info.path} "
+                    f"does not define a '{ext_plugin_def.typer_app_var_name}' "
+                    f"Typer app."
+                )
+                raise Exit(1)
+            PluginLoader.loaded_external_plugins[plugin_name] = plugin_info._replace(
+                plugin_app=ext_app_obj
+            )
+            return self._get_click_group(
+                ext_app_obj,
+                rich_help_panel=rich_help_panel,
+                callback=callback,
+                result_callback=result_callback,
+            )
+
+        self.typer_app.add_typer(placeholder_app, rich_help_panel=rich_help_panel)
+        LazyTyperGroup.add_lazy_command(plugin_name, load_plugin_command)
+
+    def _add_lazy_internal_plugin(
+        self, plugin_info: PluginInfo, callback: Callable
+    ) -> None:
+        placeholder_app: typer.Typer = plugin_info.plugin_app
+        plugin_name: str = self._get_placeholder_name(plugin_info)
+        rich_help_panel = (
+            placeholder_app.rich_help_panel or self.internal_plugins_panel_name
+        )
+        lazy_loader = self._get_shared_lazy_loader(plugin_name, plugin_info)
+
+        def load_plugin_command() -> click.Command:
+            ConfigMaker.remove_deferred_model_loader(plugin_name)
+            inter_app_obj = lazy_loader()
+            if inter_app_obj is None:
+                logger.error(
+                    f"{AppIdentity.app_name} {int_plugin_def.name} plugin "
+                    f"'{plugin_name}' from {plugin_info.path} does not define "
+                    f"a '{int_plugin_def.typer_app_var_name}' Typer app."
+                )
+                raise Exit(1)
+            PluginLoader.loaded_internal_plugins[plugin_name] = inter_app_obj
+            return self._get_click_group(
+                inter_app_obj, rich_help_panel=rich_help_panel, callback=callback
+            )
+
+        self.typer_app.add_typer(placeholder_app, rich_help_panel=rich_help_panel)
+        LazyTyperGroup.add_lazy_command(plugin_name, load_plugin_command)
+
     def add_internal_plugins(self, callback: Callable) -> None:
         if PluginLoader._internal_plugins_loaded is True:
             logger.debug(
@@ -76,13 +203,18 @@ class PluginLoader(BaseModel):
             )
             return
         logger.debug(f"{AppIdentity.app_name} will load {int_plugin_def.name} plugins.")
-        for inter_app_obj in InternalPluginHandler.get_typer_apps():
-            if inter_app_obj is not None:
+        lazy_load = int_plugin_def.lazy_load and LazyTyperGroup.enable_for(
+            self.typer_app
+        )
+        for plugin_info in InternalPluginHandler.get_typer_apps(lazy=lazy_load):
+            if plugin_info is not None:
+                inter_app_obj: typer.Typer = plugin_info.plugin_app
                 app_name: str = inter_app_obj.info.name  # type: ignore[assignment]
                 PluginLoader.loaded_internal_plugins[app_name] = inter_app_obj
-                PluginLoader.commands_to_skip_cli_startup.append(
-                    inter_app_obj.info.name
-                )
+                PluginLoader.commands_to_skip_cli_startup.append(app_name)
+                if plugin_info.lazy_loader is not None:
+                    self._add_lazy_internal_plugin(plugin_info, callback)
+                    continue
                 self.typer_app.add_typer(
                     inter_app_obj,
                     rich_help_panel=inter_app_obj.rich_help_panel
@@ -101,11 +233,14 @@ class PluginLoader(BaseModel):
             )
             return
         logger.debug(f"{AppIdentity.app_name} will load {ext_plugin_def.name} plugins.")
+        lazy_load = ext_plugin_def.lazy_load and LazyTyperGroup.enable_for(
+            self.typer_app
+        )
         for plugin_info in ExternalPluginHandler.get_typer_apps(
-            PluginLoader.loading_errors
+            PluginLoader.loading_errors, lazy=lazy_load
         ):
             if plugin_info is not None:
-                ext_app_obj, _path, _venv, _proj_dir = plugin_info
+                ext_app_obj, _path, _venv, _proj_dir, _lazy_loader = plugin_info
             else:
                 continue
             if ext_app_obj is not None:
@@ -212,10 +347,13 @@ class PluginLoader(BaseModel):
                                     short_reason=".venv Python version conflict",
                                 )
                                 continue
-                    PluginLoader.loaded_external_plugins[ext_app_name] = PluginInfo(
-                        ext_app_obj, _path, _venv, _proj_dir
-                    )
+                    PluginLoader.loaded_external_plugins[ext_app_name] = plugin_info
                     PluginLoader.commands_to_skip_cli_startup.append(ext_app_name)
+                    if _lazy_loader is not None:
+                        self._add_lazy_external_plugin(
+                            plugin_info, callback, result_callback
+                        )
+                        continue
                     self.typer_app.add_typer(
                         ext_app_obj,
                         rich_help_panel=ext_app_obj.rich_help_panel
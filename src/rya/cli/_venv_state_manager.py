@@ -1,54 +1,125 @@
 from pathlib import Path
-from typing import Union
+from typing import Optional, Union
 
 from properpath import P
+from pydantic.experimental.missing_sentinel import MISSING
+
+from ..kernel import is_missing
+from ..pre_init import get_cached_data
 
 VENV_INDICATOR_DIR_NAME: str = "site-packages"
+VENV_CONFIG_FILE_NAME: str = "pyvenv.cfg"
+_cached_site_packages_dirs: Optional[dict[str, Path]] = None
+_site_packages_dirs: dict[str, Path] = {}
 
 
-def switch_venv_state(
-    state: bool,
-    /,
-    venv_dir: Path,
-    project_dir: Union[Path, P],
-):
-    import sys
+def _get_cached_site_packages_dirs() -> dict[str, Path]:
+    global _cached_site_packages_dirs
+    if _cached_site_packages_dirs is None:
+        cached_site_packages_dirs = getattr(
+            get_cached_data().app_meta, "venv_site_packages", MISSING
+        )
+        if is_missing(cached_site_packages_dirs):
+            _cached_site_packages_dirs = {}
+        else:
+            _cached_site_packages_dirs = dict(cached_site_packages_dirs)
+    return _cached_site_packages_dirs
 
-    _project_dir: str = str(project_dir)
+
+def _get_venv_python_version(venv_dir: Path) -> Optional[tuple[str, str]]:
+    try:
+        venv_config = (venv_dir / VENV_CONFIG_FILE_NAME).read_text(encoding="utf-8")
+    except (OSError, UnicodeDecodeError):
+        return None
+    for line in venv_config.splitlines():
+        key, sep, value = line.partition("=")
+        # venv writes "version", virtualenv and uv write "version_info"
+        if sep and key.strip() in ("version", "version_info"):
+            major, _, rest = value.strip().partition(".")
+            minor = rest.partition(".")[0]
+            if major.isdigit() and minor.isdigit():
+                return major, minor
+    return None
+
+
+def _resolve_site_packages_dir(venv_dir: Path) -> Path:
+    candidates: list[Path] = []
+    if (python_version := _get_venv_python_version(venv_dir)) is not None:
+        major, minor = python_version
+        candidates.append(
+            venv_dir / "lib" / f"python{major}.{minor}" / VENV_INDICATOR_DIR_NAME
+        )
+    candidates.extend(
+        sorted(
+            venv_dir.glob(f"lib/python*/{VENV_INDICATOR_DIR_NAME}"),
+            key=lambda x: str(x).lower(),
+        )
+    )
+    candidates.append(venv_dir / "Lib" / VENV_INDICATOR_DIR_NAME)  # Windows
+    for candidate in candidates:
+        if candidate.is_dir():
+            return candidate
+    # Fall back to a full walk for unusual virtual environment layouts
     site_packages = sorted(
         venv_dir.rglob(VENV_INDICATOR_DIR_NAME), key=lambda x: str(x).lower()
     )
-
     if not site_packages:
         raise ValueError(
             f"Could not find '{VENV_INDICATOR_DIR_NAME}' directory in "
             "virtual environment path."
         )
-    for unique_dir in site_packages:
-        _unique_dir = str(unique_dir)
-        if state is True:
-            sys.path.insert(1, _unique_dir)
-            sys.path.insert(1, _project_dir)
-            return
+    return site_packages[0]
+
+
+def get_site_packages_dir(venv_dir: Path) -> Path:
+    venv_key = str(venv_dir)
+    try:
+        return _site_packages_dirs[venv_key]
+    except KeyError:
+        site_packages_dir = _get_cached_site_packages_dirs().get(venv_key)
+        if site_packages_dir is None or not site_packages_dir.is_dir():
+            site_packages_dir = _resolve_site_packages_dir(venv_dir)
+        _site_packages_dirs[venv_key] = site_packages_dir
+        return site_packages_dir
+
+
+def get_site_packages_index() -> dict[str, Path]:
+    # Only the virtual environments resolved in this run are returned, so entries
+    # for removed virtual environments are dropped from the cache. Lazily loaded
+    # plugins resolve theirs when they are registered (see PluginLoader).
+    return dict(_site_packages_dirs)
+
+
+def switch_venv_state(
+    state: bool,
+    /,
+    venv_dir: Path,
+    project_dir: Union[Path, P],
+):
+    import sys
+
+    _project_dir: str = str(project_dir)
+    _unique_dir = str(get_site_packages_dir(venv_dir))
+    if state is True:
+        sys.path.insert(1, _unique_dir)
+        sys.path.insert(1, _project_dir)
+    else:
+        if sys.path[1:3] == [_project_dir, _unique_dir]:
+            sys.path.pop(1)
+            sys.path.pop(1)
         else:
-            if sys.path[1:3] == [_project_dir, _unique_dir]:
-                sys.path.pop(1)
-                sys.path.pop(1)
-                return
+            try:
+                sys.path.remove(_unique_dir)
+            except ValueError as e:
+                raise RuntimeError(
+                    f"Virtual environment directory "
+                    f"{_unique_dir} couldn't be removed from sys.path!"
+                ) from e
             else:
                 try:
-                    sys.path.remove(_unique_dir)
+                    sys.path.remove(_project_dir)
                 except ValueError as e:
                     raise RuntimeError(
-                        f"Virtual environment directory "
-                        f"{_unique_dir} couldn't be removed from sys.path!"
+                        f"Project directory {_project_dir} "
+                        f"couldn't be removed from sys.path!"
                     ) from e
-                else:
-                    try:
-                        sys.path.remove(_project_dir)
-                    except ValueError as e:
-                        raise RuntimeError(
-                            f"Project directory {_project_dir} "
-                            f"couldn't be removed from sys.path!"
-                        ) from e
-                    return
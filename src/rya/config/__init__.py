@@ -1,11 +1,33 @@
-from ._model_handler import (
-    AllConfigModelsType,
-    ConfigMaker,
-    FieldsConfigType,
-    PluginConfigType,
+from typing import TYPE_CHECKING
+
+from ..kernel import get_lazy_exports
+
+if TYPE_CHECKING:
+    from ._model_handler import (
+        AllConfigModelsType,
+        ConfigMaker,
+        FieldsConfigType,
+        FlattenedSchemaIndex,
+        PluginConfigType,
+    )
+    from ._validation_handler import AppConfig, get_dynaconf_settings
+    from .exceptions import IncompleteConfigModelAccessError
+
+__getattr__, __dir__ = get_lazy_exports(
+    __name__,
+    globals(),
+    {
+        "._model_handler": (
+            "AllConfigModelsType",
+            "ConfigMaker",
+            "FieldsConfigType",
+            "FlattenedSchemaIndex",
+            "PluginConfigType",
+        ),
+        "._validation_handler": ("AppConfig", "get_dynaconf_settings"),
+        ".exceptions": ("IncompleteConfigModelAccessError",),
+    },
 )
-from ._validation_handler import AppConfig, get_dynaconf_settings
-from .exceptions import IncompleteConfigModelAccessError
 
 __all__ = [
     "AppConfig",
@@ -14,5 +36,6 @@ __all__ = [
     "PluginConfigType",
     "AllConfigModelsType",
     "FieldsConfigType",
+    "FlattenedSchemaIndex",
     "IncompleteConfigModelAccessError",
 ]
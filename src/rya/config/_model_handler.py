@@ -1,7 +1,11 @@
-from typing import TypedDict
+from bisect import bisect_left
+from collections.abc import Callable, Iterable, Mapping
+from types import MappingProxyType
+from typing import Optional, TypedDict
 
 from pydantic import BaseModel
 from pydantic.experimental.missing_sentinel import MISSING
+from pydantic.fields import FieldInfo
 
 from ..loggers import get_logger
 from ._names import PluginDefinitions as Pdf
@@ -26,11 +30,103 @@ class AllConfigModelsType(TypedDict, total=False):
 class NoConfigModelRegistrationFound(KeyError): ...
 
 
+def _flatten_config_fields(
+    fields: FieldsConfigType, origin_key: Optional[str] = None
+) -> dict[str, FieldInfo]:
+    return {
+        f"{f'{origin_key}.' if origin_key else ''}{field_name}": field_val["field_info"]
+        for field_name, field_val in fields.items()
+    }
+
+
+class FlattenedSchemaIndex:
+    # Sorted (case-folded) dotted field names for bisect-based lookups.
+    # Lookup results keep the flattened schema order.
+    def __init__(self, field_names: Iterable[str]) -> None:
+        self._entries: list[tuple[str, int, str]] = sorted(
+            (field_name.casefold(), position, field_name)
+            for position, field_name in enumerate(field_names)
+        )
+        self._folded_names: list[str] = [entry[0] for entry in self._entries]
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _get_prefix_entries(self, prefix: str) -> list[tuple[str, int, str]]:
+        prefix = prefix.casefold()
+        start = end = bisect_left(self._folded_names, prefix)
+        while end < len(self._folded_names) and self._folded_names[end].startswith(
+            prefix
+        ):
+            end += 1
+        return self._entries[start:end]
+
+    @staticmethod
+    def _in_schema_order(entries: Iterable[tuple[str, int, str]]) -> list[str]:
+        return [entry[2] for entry in sorted(entries, key=lambda entry: entry[1])]
+
+    def get_exact(self, field_name: str, /) -> list[str]:
+        folded_field_name = field_name.casefold()
+        return self._in_schema_order(
+            entry
+            for entry in self._get_prefix_entries(field_name)
+            if entry[0] == folded_field_name
+        )
+
+    def get_prefixed(self, prefix: str, /) -> list[str]:
+        return self._in_schema_order(self._get_prefix_entries(prefix))
+
+    def get_by_dotted_name(self, field_name: str, /) -> list[str]:
+        # The field itself, or all fields nested under it (e.g., "plugins.foo")
+        folded_field_name = field_name.casefold()
+        return self._in_schema_order(
+            entry
+            for entry in self._get_prefix_entries(field_name)
+            if entry[0] == folded_field_name
+            or entry[0].startswith(f"{folded_field_name}.")
+        )
+
+
 class ConfigMaker:
     _main_config_model: PluginConfigType = {}
     _plugins_config_model: _PluginsConfigType = {}
     # Pycharm interprets the union type as if the assigned value must also be of a union type!
 
+    # Flattened dotted field name -> FieldInfo, kept up to date on model registration.
+    # The main model fields come first, then each plugin's in registration order.
+    _main_flattened_schema: dict[str, FieldInfo] = {}
+    _plugins_flattened_schema: dict[str, dict[str, FieldInfo]] = {}
+    _flattened_schema: dict[str, FieldInfo] = {}
+    _flattened_schema_view: Mapping[str, FieldInfo] = MappingProxyType(_flattened_schema)
+    # Built on first lookup after the flattened schema changes
+    _flattened_schema_index: Optional[FlattenedSchemaIndex] = None
+    # Lazily loaded plugins register their models only once they are imported.
+    # Plugin name -> callable that imports the plugin (see load_deferred_models).
+    _deferred_model_loaders: dict[str, Callable[[], object]] = {}
+
+    @classmethod
+    def add_deferred_model_loader(
+        cls, plugin_name: str, loader: Callable[[], object]
+    ) -> None:
+        cls._deferred_model_loaders[plugin_name] = loader
+
+    @classmethod
+    def remove_deferred_model_loader(cls, plugin_name: str) -> None:
+        cls._deferred_model_loaders.pop(plugin_name, None)
+
+    @classmethod
+    def load_deferred_models(cls) -> None:
+        # For when every configuration model is needed (e.g., to display the
+        # whole configuration), not only those of the plugins imported so far.
+        while cls._deferred_model_loaders:
+            plugin_name = next(iter(cls._deferred_model_loaders))
+            loader = cls._deferred_model_loaders.pop(plugin_name)
+            logger.debug(
+                f"Importing lazily loaded plugin '{plugin_name}' "
+                f"for its configuration model."
+            )
+            loader()
+
     @classmethod
     def get_plugin_model(cls, plugin_name: str) -> PluginConfigType:
         try:
@@ -61,6 +157,27 @@ class ConfigMaker:
     def get_all_models(cls) -> AllConfigModelsType:
         return {"main": cls._main_config_model, "plugins": cls._plugins_config_model}
 
+    @classmethod
+    def get_flattened_schema(cls) -> Mapping[str, FieldInfo]:
+        # Read-only live view, so it can be held on to across registrations
+        return cls._flattened_schema_view
+
+    @classmethod
+    def get_flattened_schema_index(cls) -> FlattenedSchemaIndex:
+        if cls._flattened_schema_index is None:
+            cls._flattened_schema_index = FlattenedSchemaIndex(cls._flattened_schema)
+        return cls._flattened_schema_index
+
+    @classmethod
+    def _rebuild_flattened_schema(cls) -> None:
+        # Only re-joins the already flattened parts; models are not parsed again.
+        # The dict is updated in place so that the read-only view stays valid.
+        cls._flattened_schema.clear()
+        cls._flattened_schema.update(cls._main_flattened_schema)
+        for plugin_flattened_schema in cls._plugins_flattened_schema.values():
+            cls._flattened_schema.update(plugin_flattened_schema)
+        cls._flattened_schema_index = None
+
     @staticmethod
     def _check_reserved_names(config_model: type[BaseModel]) -> None:
         if (
@@ -93,10 +210,22 @@ class ConfigMaker:
             logger.debug(
                 f"Re-registering plugin '{plugin_name}' configuration model {config_model}."
             )
+        fields = get_pydantic_nested_model_fields(config_model)
         cls._plugins_config_model[plugin_name] = {
             "model": config_model,
-            "fields": get_pydantic_nested_model_fields(config_model),
+            "fields": fields,
         }
+        plugin_flattened_schema = _flatten_config_fields(
+            fields, f"{Pdf.config_section_name}.{plugin_name}"
+        )
+        if plugin_name in cls._plugins_flattened_schema:
+            cls._plugins_flattened_schema[plugin_name] = plugin_flattened_schema
+            cls._rebuild_flattened_schema()
+        else:
+            # A new plugin's fields always go last, so they can simply be appended
+            cls._plugins_flattened_schema[plugin_name] = plugin_flattened_schema
+            cls._flattened_schema.update(plugin_flattened_schema)
+            cls._flattened_schema_index = None
 
     @classmethod
     def _register_main_model(
@@ -111,10 +240,13 @@ class ConfigMaker:
             return
         if force_reregister:
             logger.debug(f"Re-registering main configuration model {config_model}.")
+        fields = get_pydantic_nested_model_fields(config_model)
         cls._main_config_model = {
             "model": config_model,
-            "fields": get_pydantic_nested_model_fields(config_model),
+            "fields": fields,
         }
+        cls._main_flattened_schema = _flatten_config_fields(fields)
+        cls._rebuild_flattened_schema()
 
     @classmethod
     def add_model(
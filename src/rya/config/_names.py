@@ -1,4 +1,5 @@
-from dataclasses import dataclass
+import os
+from dataclasses import dataclass, field
 from typing import ClassVar, Optional
 
 from properpath import P
@@ -69,6 +70,12 @@ class PluginDefinitions:
     typer_app_file_name: str = f"{typer_app_file_name_prefix}.py"
     typer_app_var_name: str = "app"
     config_section_name: ClassVar[str] = PublicLayerNames.plugins
+    # When enabled, plugins already known from the plugin index are only
+    # imported once their command is invoked (or when all configuration models
+    # are needed, see ConfigMaker.load_deferred_models). Callbacks that a plugin
+    # registers at import time are not available before that. Opt in with the
+    # <APP_PREFIX>_LAZY_PLUGINS environment variable (see PluginLoaderEnvVars).
+    lazy_load: bool = False
 
 
 @dataclass
@@ -86,6 +93,26 @@ class ExternalPluginLoaderDefinitions(PluginDefinitions):
     file_name_prefix: str = "plugin_metadata"
     file_ext: str = "toml"
     file_name: str = f"{file_name_prefix}.{file_ext}"
+    # Plugin directories are validated in a thread pool when this is more than 1.
+    # This mainly helps when the plugin directory is on a slow (network) file system.
+    # Can be overridden with <APP_PREFIX>_PLUGIN_DISCOVERY_WORKERS
+    # (see PluginLoaderEnvVars); 1 validates plugin directories sequentially.
+    discovery_max_workers: int = field(
+        default_factory=lambda: min(8, os.cpu_count() or 1)
+    )
+    # Plugin metadata files are read with tomllib. Dynaconf can be used instead
+    # when its features (e.g., "@format" or "@jinja" interpolation) are needed.
+    dynaconf_metadata_reader: bool = False
+
+
+@dataclass(frozen=True)
+class SettingsSnapshotDefinitions:
+    # Settings with matching names are treated as secrets, even if no
+    # registered configuration model declares them as such.
+    secret_name_pattern: ClassVar[str] = (
+        r"secret|token|passw(or)?d|passphrase|credential|api_?key|private_?key"
+    )
+    secret_file_name_prefix: ClassVar[str] = ".secrets"
 
 
 @dataclass
@@ -1,13 +1,27 @@
+import glob
+import hashlib
+import json
+import os
+import re
 import types
+import typing
 from collections.abc import Callable
 from types import EllipsisType
-from typing import Literal, Optional
+from typing import Any, Literal, NamedTuple, Optional, cast
 
 from dynaconf import Dynaconf
 from dynaconf.vendor.ruamel.yaml.scanner import ScannerError
 # tomllib.TOMLDecodeError will not work since dynaconf uses vendored tomllib
 from dynaconf.vendor.tomllib import TOMLDecodeError
-from pydantic import BaseModel, ValidationError, create_model
+from properpath import P
+from pydantic import (
+    BaseModel,
+    Secret,
+    SecretBytes,
+    SecretStr,
+    ValidationError,
+    create_model,
+)
 
 from ._model_handler import (
     ConfigMaker,
@@ -17,8 +31,15 @@ from ._model_handler import (
 )
 from ._names import DynaConfArgs
 from ._names import PluginDefinitions as Pdf
+from ._names import SettingsSnapshotDefinitions as Ssd
 from .exceptions import BadConfigurationFile, IncompleteConfigModelAccessError
+from ..kernel import (
+    SettingsSnapshotCacheModel,
+    get_path_fingerprint,
+    is_missing,
+)
 from ..loggers import get_logger
+from ..pre_init import get_cached_data, update_meta_cache
 
 logger = get_logger()
 
@@ -30,6 +51,62 @@ def get_dynaconf_settings(dynaconf_args_: DynaConfArgs, /) -> Dynaconf:
 AppConfigErrorRaiseType = Literal["raise", "ignore", "ignore+"]
 
 
+class ValidatedPluginModel(NamedTuple):
+    model: type[BaseModel]
+    settings_fingerprint: str
+    validated: Optional[BaseModel]
+
+
+def get_settings_fingerprint(settings_data: dict, /) -> str:
+    return hashlib.sha1(
+        json.dumps(settings_data, sort_keys=True, default=repr).encode()
+    ).hexdigest()
+
+
+def _is_secret_annotation(annotation: Any, /) -> bool:
+    if isinstance(annotation, type) and issubclass(
+        annotation, (Secret, SecretStr, SecretBytes)
+    ):
+        return True
+    # E.g., Secret[int] or Optional[SecretStr]
+    return typing.get_origin(annotation) is Secret or any(
+        _is_secret_annotation(arg) for arg in typing.get_args(annotation)
+    )
+
+
+def _has_secret_names(settings_data: Any, /) -> bool:
+    match settings_data:
+        case dict():
+            return any(
+                re.search(Ssd.secret_name_pattern, str(key), re.IGNORECASE)
+                or _has_secret_names(value)
+                for key, value in settings_data.items()
+            )
+        case list():
+            return any(_has_secret_names(item) for item in settings_data)
+    return False
+
+
+def _get_plugin_settings_data(plugins_settings_data: dict, plugin_name: str, /) -> dict:
+    # Plugin tables are matched case-insensitively,
+    # like Dynaconf does for attribute and get() lookups.
+    if plugin_name in plugins_settings_data:
+        return plugins_settings_data[plugin_name]
+    for name, plugin_settings_data in plugins_settings_data.items():
+        if isinstance(name, str) and plugin_name.lower() in (
+            name.lower(),
+            name.replace(" ", "_").lower(),
+        ):
+            return plugin_settings_data
+    return {}
+
+
+class ValidationSessionKey(NamedTuple):
+    errors: AppConfigErrorRaiseType
+    settings_sources_fingerprint: str
+    main_model: Optional[type[BaseModel]]
+
+
 class IncompleteConfigPlaceholder(BaseModel):
     def __getattr__(self, item):
         raise IncompleteConfigModelAccessError(
@@ -57,12 +134,51 @@ class AppConfig:
         __base__=ConfigModel,
     )()
     exceptions: list[Exception] = []
+    _session_key: Optional[ValidationSessionKey] = None
+    _session_main_model: Optional[BaseModel] = None
+    _session_plugin_models: dict[str, ValidatedPluginModel] = {}
+    _model_classes: dict[tuple, type[BaseModel]] = {}
+    _settings_data: Optional[dict[str, Any]] = None
+    # When enabled, the merged settings are stored in the cache file along with
+    # the fingerprints of their sources (see get_settings_sources_fingerprint),
+    # and are read from there instead of being loaded by Dynaconf as long as the
+    # sources do not change. Settings that depend on other sources (e.g.,
+    # "@format" with environment variables without the app prefix) would not be
+    # refreshed, hence, this is disabled by default.
+    # The snapshot is stored in plain text, so it is never stored when the settings
+    # contain secrets (see _has_secrets): Dynaconf secrets files, secret fields
+    # (pydantic Secret types) of the registered configuration models, or settings
+    # with secret-like names (e.g., "token"). Configuration models registered after
+    # the settings are loaded are not taken into account.
+    use_settings_snapshot: bool = False
+
+    @classmethod
+    def _create_model(
+        cls,
+        model_name: str,
+        base: type[BaseModel],
+        /,
+        **fields: type[BaseModel] | tuple[type[BaseModel], EllipsisType],
+    ) -> type[BaseModel]:
+        # Building a pydantic model class (schema and core validator) is expensive,
+        # so identical composite/placeholder classes are reused across validations.
+        model_key = (model_name, base, tuple(fields.items()))
+        try:
+            return cls._model_classes[model_key]
+        except KeyError:
+            # create_model's field definitions are annotated as type forms,
+            # which type checkers do not match with model classes yet.
+            model = cls._model_classes[model_key] = create_model(
+                model_name, __base__=base, **cast(dict[str, Any], fields)
+            )
+            return model
 
     @classmethod
     def load_settings(cls, reload: bool = False) -> None:
         if not hasattr(cls, "_dynaconf_settings"):
             cls._dynaconf_settings = get_dynaconf_settings(cls.dynaconf_args)
         if reload is True:
+            cls._settings_data = None
             cls._dynaconf_settings.reload()
 
     @classmethod
@@ -71,12 +187,94 @@ class AppConfig:
         return cls._dynaconf_settings
 
     @classmethod
-    def _handle_config_errors(
+    def _load_settings_data(cls, reload: bool = False) -> dict[str, Any]:
+        settings: Dynaconf = cls.get_settings(reload=reload)
+        return {k.lower(): v for k, v in settings.as_dict().items()}
+
+    @classmethod
+    def _get_settings_snapshot(
+        cls, settings_sources_fingerprint: str
+    ) -> Optional[dict[str, Any]]:
+        cache = get_cached_data()
+        if (
+            is_missing(cache.app_meta)
+            or is_missing(snapshot := cache.app_meta.settings_snapshot)
+            or snapshot.fingerprint != settings_sources_fingerprint
+        ):
+            return None
+        return snapshot.data
+
+    @classmethod
+    def _has_secrets(cls, settings_data: dict[str, Any]) -> bool:
+        return (
+            bool(cls.dynaconf_args.secrets)
+            or any(
+                path.name.startswith(Ssd.secret_file_name_prefix)
+                for path in cls._get_settings_file_paths()
+            )
+            or any(
+                _is_secret_annotation(field_info.annotation)
+                for field_info in ConfigMaker.get_flattened_schema().values()
+            )
+            or _has_secret_names(settings_data)
+        )
+
+    @classmethod
+    def _update_settings_snapshot(
+        cls, settings_sources_fingerprint: str, settings_data: dict[str, Any]
+    ) -> None:
+        if cls._has_secrets(settings_data):
+            logger.warning(
+                "Settings snapshot is enabled, but settings contain secrets, which "
+                "are never stored in the cache file. Settings will be loaded with "
+                "Dynaconf on every run."
+            )
+            return
+        try:
+            # Values that do not survive a JSON round trip (e.g., TOML datetimes)
+            # would be validated differently when read back from the snapshot.
+            is_serializable = json.loads(json.dumps(settings_data)) == settings_data
+        except (TypeError, ValueError):
+            is_serializable = False
+        if not is_serializable:
+            logger.debug(
+                "Settings contain values that cannot be stored in the settings "
+                "snapshot. Settings will be loaded with Dynaconf on every run."
+            )
+            return
+        update_meta_cache(
+            get_cached_data(),
+            settings_snapshot=SettingsSnapshotCacheModel(
+                fingerprint=settings_sources_fingerprint, data=settings_data
+            ),
+        )
+
+    @classmethod
+    def get_settings_data(cls, reload: bool = False) -> dict[str, Any]:
+        if not cls.use_settings_snapshot:
+            return cls._load_settings_data(reload=reload)
+        if cls._settings_data is not None and reload is False:
+            return cls._settings_data
+        # The fingerprint is taken before the settings are loaded, so a file
+        # modified while it is being loaded results in a new snapshot next time.
+        settings_sources_fingerprint = cls.get_settings_sources_fingerprint()
+        if (
+            settings_data := cls._get_settings_snapshot(settings_sources_fingerprint)
+        ) is not None:
+            logger.debug("Settings are loaded from the settings snapshot.")
+        else:
+            settings_data = cls._load_settings_data(reload=reload)
+            cls._update_settings_snapshot(settings_sources_fingerprint, settings_data)
+        cls._settings_data = settings_data
+        return cls._settings_data
+
+    @classmethod
+    def _handle_config_errors[T](
         cls,
-        config_loader_func: Callable,
+        config_loader_func: Callable[[], T],
         source_name: Optional[str],
         errors: AppConfigErrorRaiseType = "raise",
-    ) -> Optional[BaseModel]:
+    ) -> Optional[T]:
         try:
             called_loader = config_loader_func()
         except (ScannerError, TOMLDecodeError) as e:
@@ -106,20 +304,169 @@ class AppConfig:
         else:
             return called_loader
 
+    @classmethod
+    def _get_settings_file_paths(cls) -> list[P]:
+        dynaconf_args = cls.dynaconf_args
+        root_path = P(dynaconf_args.root_path or os.getcwd())
+        file_sources: list = [
+            dynaconf_args.settings_files,
+            dynaconf_args.includes,
+            dynaconf_args.preload,
+            dynaconf_args.secrets,
+        ]
+        if dynaconf_args.envvar:
+            file_sources.append(os.getenv(dynaconf_args.envvar))
+        if dynaconf_args.load_dotenv:
+            dotenv_path = root_path / dynaconf_args.dotenv_path
+            file_sources.append(
+                str(dotenv_path / ".env" if dotenv_path.is_dir() else dotenv_path)
+            )
+        paths: list[P] = []
+        for files in file_sources:
+            if not files:
+                continue
+            if isinstance(files, str):
+                # Same separators as Dynaconf's ensure_a_list
+                files = re.split(r"[,;]", files)
+            for file in filter(None, map(str.strip, files)):
+                file_path = root_path / file
+                if glob.has_magic(file):
+                    paths.extend(
+                        map(P, sorted(glob.glob(str(file_path), recursive=True)))
+                    )
+                else:
+                    paths.append(file_path)
+        return paths
+
+    @classmethod
+    def get_settings_sources_fingerprint(cls) -> str:
+        settings_files: list[tuple[str, Optional[str]]] = []
+        # Settings data depends on the files (and their contents), the Dynaconf
+        # arguments, the working directory (relative paths) and environment variables.
+        for path in cls._get_settings_file_paths():
+            try:
+                fingerprint = get_path_fingerprint(path)
+            except OSError:
+                fingerprint = None
+            settings_files.append((str(path), fingerprint))
+        dynaconf_args = cls.dynaconf_args
+        envvar_prefix = f"{dynaconf_args.envvar_prefix}_"
+        envvars = list(
+            sorted(
+                (name, value)
+                for name, value in os.environ.items()
+                if name.startswith(envvar_prefix)
+                or name.endswith("_FOR_DYNACONF")
+                or name in (dynaconf_args.envvar, dynaconf_args.env_switcher)
+            )
+        )
+        return hashlib.sha1(
+            json.dumps(
+                [os.getcwd(), repr(dynaconf_args), settings_files, envvars]
+            ).encode()
+        ).hexdigest()
+
+    @classmethod
+    def get_validation_session_key(
+        cls, errors: AppConfigErrorRaiseType = "raise"
+    ) -> ValidationSessionKey:
+        return ValidationSessionKey(
+            errors=errors,
+            settings_sources_fingerprint=cls.get_settings_sources_fingerprint(),
+            main_model=ConfigMaker.get_all_models()["main"].get("model"),
+        )
+
+    @classmethod
+    def _get_validated_model(
+        cls,
+        validated_main_model: BaseModel,
+        validated_plugins_models: Optional[BaseModel],
+    ) -> BaseModel:
+        if validated_plugins_models is None:
+            return validated_main_model
+        model = cls._create_model(
+            validated_main_model.__class__.__name__,
+            validated_main_model.__class__,
+            **{Pdf.config_section_name: validated_plugins_models.__class__},
+        )
+        # Both parts are already validated. model_construct() assembles the composite
+        # from the same field values (nested models included) without dumping
+        # the main model to a dict and validating it all over again.
+        validated_model = model.model_construct(
+            validated_main_model.model_fields_set | {Pdf.config_section_name},
+            **validated_main_model.__dict__,
+            **(validated_main_model.__pydantic_extra__ or {}),
+            **{Pdf.config_section_name: validated_plugins_models},
+        )
+        if validated_main_model.__pydantic_private__:
+            object.__setattr__(
+                validated_model,
+                "__pydantic_private__",
+                dict(validated_main_model.__pydantic_private__),
+            )
+        return validated_model
+
+    @classmethod
+    def _validate_session_changes(
+        cls, session_main_model: BaseModel, errors: AppConfigErrorRaiseType
+    ) -> BaseModel:
+        registered_plugins_models = ConfigMaker.get_all_models()["plugins"]
+        session_plugin_models = cls._session_plugin_models
+        if registered_plugins_models.keys() == session_plugin_models.keys() and all(
+            session_plugin_models[plugin_name].model is plugin_model_data["model"]
+            for plugin_name, plugin_model_data in registered_plugins_models.items()
+        ):
+            logger.debug(
+                "Configuration sources and models have not changed since the last "
+                "validation. The previously validated configuration model is used."
+            )
+            return cls.validated
+        logger.debug(
+            "Configuration sources have not changed since the last validation. "
+            "Only newly registered plugin configuration models will be validated."
+        )
+        session_key, cls._session_key = cls._session_key, None
+        try:
+            validated_plugins_models = cls.plugins_validate(errors=errors)
+        except NoConfigModelRegistrationFound:
+            validated_plugins_models = None
+        cls.validated = cls._get_validated_model(
+            session_main_model, validated_plugins_models
+        )
+        cls._session_key = session_key
+        return cls.validated
+
     @classmethod
     def validate(
         cls,
         errors: AppConfigErrorRaiseType = "raise",
         reload: bool = False,
+        use_session: bool = False,
     ) -> BaseModel:
+        session_key: Optional[ValidationSessionKey] = None
+        if use_session:
+            # The key is built before the settings are (re)loaded, so a file
+            # modified while it is being loaded results in a new key next time.
+            session_key = cls.get_validation_session_key(errors)
+            if (
+                session_key == cls._session_key
+                and cls._session_main_model is not None
+            ):
+                return cls._validate_session_changes(cls._session_main_model, errors)
+        cls._session_key = None
         try:
             validated_main_model = cls.main_validate(errors=errors, reload=reload)
         except NoConfigModelRegistrationFound as e:
             cls.exceptions.append(e)
             logger.debug(str(e).replace('"', ""))
-            validated_main_model = create_model(
-                cls.ConfigModel.__name__, __base__=cls.ConfigModel
+            validated_main_model = cls._create_model(
+                cls.ConfigModel.__name__, cls.ConfigModel
             )()
+        else:
+            if not isinstance(validated_main_model, IncompleteConfigPlaceholder):
+                # Settings are (re)loaded only once, by main_validate
+                reload = False
+        cls._session_main_model = validated_main_model
         try:
             validated_plugins_models = cls.plugins_validate(
                 errors=errors, reload=reload
@@ -127,19 +474,12 @@ class AppConfig:
         except NoConfigModelRegistrationFound as e:
             cls.exceptions.append(e)
             logger.debug(str(e).replace('"', ""))
-            cls.validated = validated_main_model
-            return cls.validated
-        else:
-            model = create_model(
-                validated_main_model.__class__.__name__,
-                __base__=validated_main_model.__class__,
-                **{Pdf.config_section_name: validated_plugins_models.__class__},
-            )
-            cls.validated = model(
-                **validated_main_model.model_dump(),
-                **{Pdf.config_section_name: validated_plugins_models},
-            )
-            return cls.validated
+            validated_plugins_models = None
+        cls.validated = cls._get_validated_model(
+            validated_main_model, validated_plugins_models
+        )
+        cls._session_key = session_key
+        return cls.validated
 
     @classmethod
     def _main_validate(
@@ -147,8 +487,7 @@ class AppConfig:
         main_model: type[BaseModel],
         reload: bool = False,
     ) -> BaseModel:
-        settings: Dynaconf = cls.get_settings(reload=reload)
-        settings_data = {k.lower(): v for k, v in settings.as_dict().items()}
+        settings_data = dict(cls.get_settings_data(reload=reload))
         settings_data.pop(Pdf.config_section_name, None)
         validated_main_model = main_model(**settings_data)
         return validated_main_model
@@ -167,9 +506,9 @@ class AppConfig:
             errors=errors,
         )
         if validated_plugin_model is None:
-            return create_model(
+            return cls._create_model(
                 f"Incomplete{main_model.__name__}",
-                __base__=IncompleteConfigPlaceholder,
+                IncompleteConfigPlaceholder,
             )()
         return validated_plugin_model
 
@@ -179,17 +518,63 @@ class AppConfig:
         errors: AppConfigErrorRaiseType = "raise",
         reload: bool = False,
     ) -> BaseModel:
+        previous_plugin_models, cls._session_plugin_models = (
+            cls._session_plugin_models,
+            {},
+        )
         plugins_models_data: _PluginsConfigType = ConfigMaker.get_plugins_models()
+        plugins_settings_data: Optional[dict] = cls._handle_config_errors(
+            lambda: cls.get_settings_data(reload=reload).get(
+                Pdf.config_section_name, {}
+            ),
+            source_name="Plugins configuration",
+            errors=errors,
+        )
+        plugins_validated_model_instances: dict[str, Optional[BaseModel]] = {}
+        for plugin_name, plugin_model_data in plugins_models_data.items():
+            plugin_model = plugin_model_data["model"]
+            if plugins_settings_data is None:
+                # Settings could not be loaded, so no plugin model can be validated
+                cls._session_plugin_models[plugin_name] = ValidatedPluginModel(
+                    plugin_model, "", None
+                )
+                plugins_validated_model_instances[plugin_name] = None
+                continue
+            plugin_settings_user_data: dict = _get_plugin_settings_data(
+                plugins_settings_data, plugin_name
+            )
+            settings_fingerprint = get_settings_fingerprint(plugin_settings_user_data)
+            previous_plugin_model = previous_plugin_models.get(plugin_name)
+            if (
+                previous_plugin_model is not None
+                and previous_plugin_model.validated is not None
+                and previous_plugin_model.model is plugin_model
+                and previous_plugin_model.settings_fingerprint == settings_fingerprint
+            ):
+                validated_plugin_model: Optional[BaseModel] = (
+                    previous_plugin_model.validated
+                )
+            else:
+                validated_plugin_model = cls._handle_config_errors(
+                    lambda: plugin_model(**plugin_settings_user_data),
+                    source_name=f"Plugin '{plugin_name}'",
+                    errors=errors,
+                )
+            plugins_validated_model_instances[plugin_name] = validated_plugin_model
+            cls._session_plugin_models[plugin_name] = ValidatedPluginModel(
+                plugin_model, settings_fingerprint, validated_plugin_model
+            )
+        return cls._get_plugins_model(plugins_validated_model_instances)
+
+    @classmethod
+    def _get_plugins_model(
+        cls, plugins_validated_model_instances: dict[str, Optional[BaseModel]]
+    ) -> BaseModel:
         plugins_validated_models: dict[str, tuple[type[BaseModel], EllipsisType]] = {}
-        plugins_validated_model_instances: dict[str, BaseModel] = {}
-        plugin_model_shell: type[BaseModel] = cls.PluginConfigModel
         incomplete_model: bool = False
-        for plugin_name in plugins_models_data:
-            validated_plugin_model = cls._handle_config_errors(
-                lambda: cls.plugin_validate(plugin_name, reload=reload),
-                source_name=f"Plugin '{plugin_name}'",
-                errors=errors,
-            )
+        for plugin_name, validated_plugin_model in (
+            plugins_validated_model_instances.items()
+        ):
             if validated_plugin_model is None:
                 incomplete_model = True
             else:
@@ -197,18 +582,25 @@ class AppConfig:
                     validated_plugin_model.__class__,
                     ...,
                 )
-                plugins_validated_model_instances[plugin_name] = validated_plugin_model
         plugin_model_name = (
             f"Incomplete{cls.PluginConfigModel.__name__}"
             if incomplete_model
             else cls.PluginConfigModel.__name__
         )
-        plugin_model_shell = create_model(
+        plugin_model_shell = cls._create_model(
             plugin_model_name,
-            __base__=plugin_model_shell,
+            cls.PluginConfigModel,
             **plugins_validated_models,
         )
-        return plugin_model_shell(**plugins_validated_model_instances)
+        return plugin_model_shell(
+            **{
+                plugin_name: validated_plugin_model
+                for plugin_name, validated_plugin_model in (
+                    plugins_validated_model_instances.items()
+                )
+                if validated_plugin_model is not None
+            }
+        )
 
     @classmethod
     def plugin_validate(
@@ -216,11 +608,13 @@ class AppConfig:
         plugin_name: str,
         reload: bool = False,
     ) -> BaseModel:
-        plugins_settings_data: dict = getattr(
-            cls.get_settings(reload=reload), Pdf.config_section_name, {}
+        plugins_settings_data: dict = cls.get_settings_data(reload=reload).get(
+            Pdf.config_section_name, {}
         )
         plugin_model_data = ConfigMaker.get_plugin_model(plugin_name)
         plugin_model: type[BaseModel] = plugin_model_data["model"]
-        plugin_settings_user_data: dict = plugins_settings_data.get(plugin_name, {})
+        plugin_settings_user_data: dict = _get_plugin_settings_data(
+            plugins_settings_data, plugin_name
+        )
         validated_plugin_model = plugin_model(**plugin_settings_user_data)
         return validated_plugin_model
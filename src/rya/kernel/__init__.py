@@ -1,52 +1,15 @@
-import logging
+import time
 
-from ._app_location import AppLocations
-from ._cache_models import AppMetaCacheModel, BaseCacheModel, CacheFileProperties
-from ._callbacks import (
-    global_cli_graceful_callback,
-    global_cli_result_callback,
-    global_cli_super_startup_callback,
-)
-from ._data_list import DataObjectList
-from ._debug_builtins import BuiltInDebugModeShortcuts
-from ._debug_mode import DebugMode, get_debug_mode_envvar
-from ._exit import Exit
-from ._layer_loader import LayerLoader, PublicLayerNames
-from ._logger_state import LoggerState
-from ._logger_state_utils import LoggerStateFlags, LoggerStateTuple, LoggerUpdateRel
-from ._loggers import (
-    AppRichHandler,
-    AppRichHandlerArgs,
-    LoggerDefaults,
-    LoggerMaker,
-    LogItemList,
-    LogMessageData,
-    ResultCallbackHandler,
-    app_rich_handler_args,
-    get_logger,
-    get_simple_logger,
-    global_log_record_container,
-)
-from ._missing import Missing
-from ._name_containers import (
-    ConfigFileModel,
-    FileModel,
-    FileModelContainer,
-    LogFileModel,
-    RunEarlyList,
-    FallbackLogFileModel,
-)
-from ._utils import (
-    SafeCWD,
-    detected_click_feedback,
-    generate_pydantic_model_from_abstract_cls,
-    get_dynaconf_core_loader,
-    get_local_imports,
-    is_platform_unix,
-)
-from ._validator_helpers import MultiValidator
-from .._vendor import haggis
-from .._vendor.haggis.logs import add_logging_level
+# Taken before anything else is imported: the startup profiler measures from here.
+# StartupProfiler itself is only imported lazily (when the CLI starts up).
+_import_origin_ns: int = time.perf_counter_ns()
+
+import logging  # noqa: E402
+from typing import TYPE_CHECKING  # noqa: E402
+
+from ._lazy_exports import get_lazy_exports  # noqa: E402
+from .._vendor import haggis  # noqa: E402
+from .._vendor.haggis.logs import add_logging_level  # noqa: E402
 
 haggis.logs.logging = logging
 
@@ -60,10 +23,145 @@ try:
 except AttributeError:
     ...
 
+if TYPE_CHECKING:
+    from ._app_location import AppLocations
+    from ._cache_models import (
+        AppMetaCacheModel,
+        BaseCacheModel,
+        CacheFileProperties,
+        CacheStoreEntryModel,
+        CacheStoreNamespaceModel,
+        CacheStoreProperties,
+        ExternalPluginIndexCacheModel,
+        PluginTyperAppCacheModel,
+        PythonVersionCacheModel,
+        SettingsSnapshotCacheModel,
+    )
+    from ._callbacks import (
+        global_cli_graceful_callback,
+        global_cli_result_callback,
+        global_cli_super_startup_callback,
+    )
+    from ._data_list import DataObjectList
+    from ._debug_builtins import BuiltInDebugModeShortcuts
+    from ._debug_mode import DebugMode, get_debug_mode_envvar
+    from ._exit import Exit
+    from ._layer_loader import LayerLoader, PublicLayerNames
+    from ._logger_state import LoggerState
+    from ._logger_state_utils import LoggerStateFlags, LoggerStateTuple, LoggerUpdateRel
+    from ._loggers import (
+        AppRichHandler,
+        AppRichHandlerArgs,
+        LoggerDefaults,
+        LoggerMaker,
+        LogItemList,
+        LogMessageData,
+        ResultCallbackHandler,
+        app_rich_handler_args,
+        get_logger,
+        get_simple_logger,
+        global_log_record_container,
+    )
+    from ._missing import Missing
+    from ._missing_sentinel import MissingType, is_missing
+    from ._name_containers import (
+        ConfigFileModel,
+        FileModel,
+        FileModelContainer,
+        LogFileModel,
+        RunEarlyList,
+        FallbackLogFileModel,
+    )
+    from ._utils import (
+        SafeCWD,
+        detected_click_feedback,
+        generate_pydantic_model_from_abstract_cls,
+        get_dynaconf_core_loader,
+        get_local_imports,
+        get_path_fingerprint,
+        is_platform_unix,
+    )
+    from ._profiler import ProfileSpan, StartupProfiler
+    from ._validator_helpers import MultiValidator
+
+__getattr__, __dir__ = get_lazy_exports(
+    __name__,
+    globals(),
+    {
+        "._app_location": ("AppLocations",),
+        "._cache_models": (
+            "AppMetaCacheModel",
+            "BaseCacheModel",
+            "CacheFileProperties",
+            "CacheStoreEntryModel",
+            "CacheStoreNamespaceModel",
+            "CacheStoreProperties",
+            "ExternalPluginIndexCacheModel",
+            "PluginTyperAppCacheModel",
+            "PythonVersionCacheModel",
+            "SettingsSnapshotCacheModel",
+        ),
+        "._callbacks": (
+            "global_cli_graceful_callback",
+            "global_cli_result_callback",
+            "global_cli_super_startup_callback",
+        ),
+        "._data_list": ("DataObjectList",),
+        "._debug_builtins": ("BuiltInDebugModeShortcuts",),
+        "._debug_mode": ("DebugMode", "get_debug_mode_envvar"),
+        "._exit": ("Exit",),
+        "._layer_loader": ("LayerLoader", "PublicLayerNames"),
+        "._logger_state": ("LoggerState",),
+        "._logger_state_utils": (
+            "LoggerStateFlags",
+            "LoggerStateTuple",
+            "LoggerUpdateRel",
+        ),
+        "._loggers": (
+            "AppRichHandler",
+            "AppRichHandlerArgs",
+            "LoggerDefaults",
+            "LoggerMaker",
+            "LogItemList",
+            "LogMessageData",
+            "ResultCallbackHandler",
+            "app_rich_handler_args",
+            "get_logger",
+            "get_simple_logger",
+            "global_log_record_container",
+        ),
+        "._missing": ("Missing",),
+        "._missing_sentinel": ("MissingType", "is_missing"),
+        "._name_containers": (
+            "ConfigFileModel",
+            "FileModel",
+            "FileModelContainer",
+            "LogFileModel",
+            "RunEarlyList",
+            "FallbackLogFileModel",
+        ),
+        "._utils": (
+            "SafeCWD",
+            "detected_click_feedback",
+            "generate_pydantic_model_from_abstract_cls",
+            "get_dynaconf_core_loader",
+            "get_local_imports",
+            "get_path_fingerprint",
+            "is_platform_unix",
+        ),
+        "._profiler": ("ProfileSpan", "StartupProfiler"),
+        "._validator_helpers": ("MultiValidator",),
+    },
+)
+
 __all__ = [
     "DataObjectList",
     "Missing",
+    "MissingType",
+    "is_missing",
+    "get_lazy_exports",
     "is_platform_unix",
+    "get_path_fingerprint",
     "generate_pydantic_model_from_abstract_cls",
     "get_local_imports",
     "LayerLoader",
@@ -96,6 +194,8 @@ __all__ = [
     "SafeCWD",
     "BuiltInDebugModeShortcuts",
     "DebugMode",
+    "StartupProfiler",
+    "ProfileSpan",
     "LoggerStateTuple",
     "LoggerUpdateRel",
     "LoggerStateFlags",
@@ -105,4 +205,11 @@ __all__ = [
     "AppMetaCacheModel",
     "BaseCacheModel",
     "CacheFileProperties",
+    "CacheStoreEntryModel",
+    "CacheStoreNamespaceModel",
+    "CacheStoreProperties",
+    "ExternalPluginIndexCacheModel",
+    "PluginTyperAppCacheModel",
+    "PythonVersionCacheModel",
+    "SettingsSnapshotCacheModel",
 ]
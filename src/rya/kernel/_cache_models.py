@@ -1,22 +1,62 @@
 from dataclasses import dataclass
 from datetime import datetime
-from typing import ClassVar
+from typing import Any, ClassVar
 
 from properpath import P
 from pydantic import BaseModel, ConfigDict, Field
 from pydantic.experimental.missing_sentinel import MISSING
 
+from ._missing_sentinel import MissingType
+
+
+class PluginTyperAppCacheModel(BaseModel):
+    fingerprint: str
+    name: str
+    help: str | None = None
+    rich_help_panel: str | None = None
+
+
+class ExternalPluginIndexCacheModel(BaseModel):
+    fingerprint: str
+    plugin_name: str
+    cli_script: P
+    project_dir: P
+    venv_dir: P | None = None
+    metadata_file_exists: bool
+    typer_app: PluginTyperAppCacheModel | MissingType = MISSING
+
+
+class PythonVersionCacheModel(BaseModel):
+    fingerprint: str
+    version: tuple[str, str, str]
+
+
+class SettingsSnapshotCacheModel(BaseModel):
+    fingerprint: str
+    data: dict[str, Any]
+
 
 class AppMetaCacheModel(BaseModel):
-    log_file_path: P | MISSING = MISSING
-    internal_plugins: list[str] | MISSING = MISSING
-    external_plugins: list[str] | MISSING = MISSING
+    log_file_path: P | MissingType = MISSING
+    internal_plugins: list[str] | MissingType = MISSING
+    internal_plugins_index: dict[str, PluginTyperAppCacheModel] | MissingType = (
+        MISSING
+    )
+    external_plugins: list[str] | MissingType = MISSING
+    external_plugins_index: (
+        dict[str, ExternalPluginIndexCacheModel] | MissingType
+    ) = MISSING
+    external_python_versions: dict[str, PythonVersionCacheModel] | MissingType = (
+        MISSING
+    )
+    venv_site_packages: dict[str, P] | MissingType = MISSING
+    settings_snapshot: SettingsSnapshotCacheModel | MissingType = MISSING
 
 
 class BaseCacheModel(BaseModel):
     model_config = ConfigDict(serialize_by_alias=True, validate_assignment=True)
     date: datetime = datetime.now()
-    app_meta: AppMetaCacheModel | MISSING = Field(MISSING, alias="_app_meta")
+    app_meta: AppMetaCacheModel | MissingType = Field(MISSING, alias="_app_meta")
 
     @classmethod
     def __init_subclass__(cls, **kwargs) -> None:
@@ -31,8 +71,38 @@ class BaseCacheModel(BaseModel):
                 )
 
 
+class CacheStoreEntryModel(BaseModel):
+    value: Any
+    created: datetime
+    last_accessed: datetime
+    expires: datetime | None = None
+
+
+class CacheStoreNamespaceModel(BaseModel):
+    namespace: str
+    schema_version: int
+    entries: dict[str, CacheStoreEntryModel] = {}
+
+
 @dataclass(frozen=True)
 class CacheFileProperties:
     expires_in_days: ClassVar[int] = 30
     encoding: ClassVar[str] = "utf-8"
     indent: ClassVar[int] = 4
+    # Cache files are locked with an empty sidecar file ("<cache file><suffix>",
+    # e.g., "rya.json.lock") next to them. The sidecar is left in place on
+    # purpose: deleting it while another process waits for its lock would let
+    # a third process lock a newly created file, and both would "hold" the lock.
+    # It is safe to delete when no app process is running.
+    lock_file_suffix: ClassVar[str] = ".lock"
+    lock_timeout_seconds: ClassVar[float] = 2.0
+
+
+@dataclass(frozen=True)
+class CacheStoreProperties:
+    dir_name: ClassVar[str] = "store"
+    namespace_pattern: ClassVar[str] = r"^[A-Za-z0-9][A-Za-z0-9_.-]*$"
+    default_schema_version: ClassVar[int] = 1
+    default_max_entries: ClassVar[int] = 256
+    default_max_size_bytes: ClassVar[int] = 1024 * 1024
+    access_time_resolution_seconds: ClassVar[int] = 60
@@ -0,0 +1,33 @@
+from collections.abc import Callable, Iterable, Mapping
+from importlib import import_module
+from typing import Any
+
+
+def get_lazy_exports(
+    package_name: str, globals_: dict, /, exports: Mapping[str, Iterable[str]]
+) -> tuple[Callable[[str], Any], Callable[[], list[str]]]:
+    """
+    Returns a module-level ``__getattr__`` and ``__dir__`` pair for a package
+    ``__init__`` module. ``exports`` maps a (relative) module name to the names
+    it exports; a module is only imported when one of its names is first accessed.
+    """
+    export_table: dict[str, str] = {
+        name: module_name for module_name, names in exports.items() for name in names
+    }
+
+    def __getattr__(name: str) -> Any:
+        try:
+            module_name = export_table[name]
+        except KeyError:
+            raise AttributeError(
+                f"module '{package_name}' has no attribute '{name}'"
+            ) from None
+        value = getattr(import_module(module_name, package_name), name)
+        # Later lookups will not go through __getattr__ again
+        globals_[name] = value
+        return value
+
+    def __dir__() -> list[str]:
+        return sorted({*globals_, *export_table})
+
+    return __getattr__, __dir__
@@ -0,0 +1,17 @@
+from typing import TYPE_CHECKING, Any
+
+from pydantic.experimental.missing_sentinel import MISSING
+
+if TYPE_CHECKING:
+    from typing_extensions import Sentinel, TypeIs
+
+    # Type checkers do not accept the MISSING sentinel itself as a type (yet)
+    MissingType = Sentinel
+else:
+    # Pydantic only recognizes the MISSING sentinel itself in model annotations
+    MissingType = MISSING
+
+
+def is_missing(value: Any, /) -> "TypeIs[Sentinel]":
+    # "value is MISSING" does not narrow the type of value for type checkers
+    return value is MISSING
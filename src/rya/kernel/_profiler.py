@@ -0,0 +1,200 @@
+import atexit
+import json
+import os
+import sys
+import threading
+import time
+from collections.abc import Generator
+from contextlib import contextmanager
+from typing import ClassVar, NamedTuple, Optional
+
+from . import _import_origin_ns
+from ._loggers import get_logger
+
+logger = get_logger()
+
+
+class ProfileSpan(NamedTuple):
+    name: str
+    category: str
+    start_ns: int
+    duration_ns: int
+    depth: int
+    thread_id: int
+
+
+class StartupProfiler:
+    envvar_suffix: ClassVar[str] = "PROFILE"
+    output_envvar_suffix: ClassVar[str] = "PROFILE_FILE"
+    output_formats: ClassVar[tuple[str, ...]] = ("table", "json", "trace")
+    _output_format: ClassVar[Optional[str]] = None
+    _output_file: ClassVar[Optional[str]] = None
+    _spans: ClassVar[list[ProfileSpan]] = []
+    _span_depth: ClassVar[threading.local] = threading.local()
+    # Time origin is when the kernel layer is first imported, not this module
+    _origin_ns: ClassVar[int] = _import_origin_ns
+
+    def __init__(self, envvar_prefix: str) -> None:
+        # Same as Dynaconf's envvar_prefix handling for the debug mode variable
+        self.envvar_prefix = envvar_prefix.upper()
+
+    def load(self) -> None:
+        if StartupProfiler._output_format is not None:
+            return
+        profile_envvar = f"{self.envvar_prefix}_{self.envvar_suffix}"
+        output_format = os.getenv(profile_envvar, "").strip().lower()
+        if output_format in ("", "0", "false", "off"):
+            return
+        if output_format in ("1", "true", "on"):
+            output_format = "table"
+        if output_format not in self.output_formats:
+            logger.warning(
+                f"Environment variable value '{output_format}' for "
+                f"'{profile_envvar}' is not recognized. Supported values are: "
+                f"{', '.join(self.output_formats)}. Startup profiling is disabled."
+            )
+            return
+        StartupProfiler._output_format = output_format
+        StartupProfiler._output_file = os.getenv(
+            f"{self.envvar_prefix}_{self.output_envvar_suffix}"
+        )
+        StartupProfiler._spans.append(
+            ProfileSpan(
+                name="imports",
+                category="import",
+                start_ns=0,
+                duration_ns=time.perf_counter_ns() - StartupProfiler._origin_ns,
+                depth=0,
+                thread_id=threading.get_ident(),
+            )
+        )
+        atexit.register(StartupProfiler.report)
+
+    @classmethod
+    def is_enabled(cls) -> bool:
+        return cls._output_format is not None
+
+    @classmethod
+    @contextmanager
+    def span(cls, name: str, category: str = "startup") -> Generator[None, None, None]:
+        if cls._output_format is None:
+            yield
+            return
+        depth: int = getattr(cls._span_depth, "value", 0)
+        cls._span_depth.value = depth + 1
+        start_ns = time.perf_counter_ns()
+        try:
+            yield
+        finally:
+            end_ns = time.perf_counter_ns()
+            cls._span_depth.value = depth
+            cls._spans.append(
+                ProfileSpan(
+                    name=name,
+                    category=category,
+                    start_ns=start_ns - cls._origin_ns,
+                    duration_ns=end_ns - start_ns,
+                    depth=depth,
+                    thread_id=threading.get_ident(),
+                )
+            )
+
+    @classmethod
+    def get_spans(cls) -> list[ProfileSpan]:
+        return sorted(cls._spans, key=lambda span: (span.start_ns, span.depth))
+
+    @classmethod
+    def get_total_ns(cls) -> int:
+        return time.perf_counter_ns() - cls._origin_ns
+
+    @classmethod
+    def to_table(cls) -> str:
+        total_ns = cls.get_total_ns()
+        rows = [
+            (
+                f"{'  ' * span.depth}{span.name}",
+                span.category,
+                f"{span.start_ns / 1e6:.2f}",
+                f"{span.duration_ns / 1e6:.2f}",
+                f"{span.duration_ns / total_ns * 100:.1f}",
+            )
+            for span in cls.get_spans()
+        ]
+        rows.append(("total", "", "0.00", f"{total_ns / 1e6:.2f}", "100.0"))
+        header = ("Phase", "Category", "Start (ms)", "Duration (ms)", "%")
+        widths = [
+            max(len(row[i]) for row in (header, *rows)) for i in range(len(header))
+        ]
+        lines = [
+            "  ".join(
+                cell.ljust(width) if i < 2 else cell.rjust(width)
+                for i, (cell, width) in enumerate(zip(row, widths))
+            )
+            for row in (header, *rows)
+        ]
+        lines.insert(1, "  ".join("-" * width for width in widths))
+        return "\n".join(lines)
+
+    @classmethod
+    def to_json(cls) -> str:
+        return json.dumps(
+            {
+                "total_ms": cls.get_total_ns() / 1e6,
+                "spans": [
+                    {
+                        "name": span.name,
+                        "category": span.category,
+                        "start_ms": span.start_ns / 1e6,
+                        "duration_ms": span.duration_ns / 1e6,
+                        "depth": span.depth,
+                    }
+                    for span in cls.get_spans()
+                ],
+            },
+            indent=4,
+        )
+
+    @classmethod
+    def to_trace(cls) -> str:
+        # Chrome trace event format. Can be opened with chrome://tracing or Perfetto.
+        pid = os.getpid()
+        return json.dumps(
+            {
+                "traceEvents": [
+                    {
+                        "name": span.name,
+                        "cat": span.category,
+                        "ph": "X",
+                        "ts": span.start_ns / 1e3,
+                        "dur": span.duration_ns / 1e3,
+                        "pid": pid,
+                        "tid": span.thread_id,
+                    }
+                    for span in cls.get_spans()
+                ],
+                "displayTimeUnit": "ms",
+            }
+        )
+
+    @classmethod
+    def report(cls) -> None:
+        match cls._output_format:
+            case "table":
+                report = cls.to_table()
+            case "json":
+                report = cls.to_json()
+            case "trace":
+                report = cls.to_trace()
+            case _:
+                return
+        if cls._output_file is None:
+            print(report, file=sys.stderr)
+            return
+        try:
+            with open(cls._output_file, "w", encoding="utf-8") as f:
+                f.write(report)
+        except OSError as e:
+            logger.warning(
+                f"Startup profile could not be written to {cls._output_file}. "
+                f"Exception details: {e}"
+            )
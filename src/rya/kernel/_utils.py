@@ -4,6 +4,7 @@ import sys
 from abc import ABC
 from dataclasses import dataclass
 from enum import StrEnum
+from pathlib import Path
 from types import ModuleType
 from typing import Callable, Optional, get_type_hints
 
@@ -38,6 +39,11 @@ def is_platform_unix() -> bool:
     return sys.platform in ("linux", "darwin")
 
 
+def get_path_fingerprint(path: Path, /) -> str:
+    path_stat = path.stat()
+    return f"{path_stat.st_ino}:{path_stat.st_mtime_ns}:{path_stat.st_size}"
+
+
 def generate_pydantic_model_from_abstract_cls(
     abs_cls: type[ABC], /, exclude: Optional[tuple[str]] = None
 ) -> type[BaseModel]:
@@ -1,3 +1,7 @@
+from typing import TYPE_CHECKING
+
+from ..kernel import get_lazy_exports
+
 __all__ = [
     "LogMessageData",
     "get_simple_logger",
@@ -17,19 +21,43 @@ __all__ = [
     "LogFileNotGivenError",
 ]
 
-
+# Imported eagerly: base registers get_main_logger as the main logger caller,
+# which get_logger relies on.
 from .base import get_file_logger, get_main_logger, LogFileNotGivenError
-from .handlers import AppFileHandler, AppFileHandlerArgs
-from .log_file import get_log_file_path
-from ..kernel import (
-    AppRichHandler,
-    AppRichHandlerArgs,
-    LoggerMaker,
-    LogItemList,
-    LogMessageData,
-    ResultCallbackHandler,
-    add_logging_level,
-    get_logger,
-    get_simple_logger,
-    global_log_record_container,
+
+if TYPE_CHECKING:
+    from .handlers import AppFileHandler, AppFileHandlerArgs
+    from .log_file import get_log_file_path
+    from ..kernel import (
+        AppRichHandler,
+        AppRichHandlerArgs,
+        LoggerMaker,
+        LogItemList,
+        LogMessageData,
+        ResultCallbackHandler,
+        add_logging_level,
+        get_logger,
+        get_simple_logger,
+        global_log_record_container,
+    )
+
+__getattr__, __dir__ = get_lazy_exports(
+    __name__,
+    globals(),
+    {
+        ".handlers": ("AppFileHandler", "AppFileHandlerArgs"),
+        ".log_file": ("get_log_file_path",),
+        "..kernel": (
+            "AppRichHandler",
+            "AppRichHandlerArgs",
+            "LoggerMaker",
+            "LogItemList",
+            "LogMessageData",
+            "ResultCallbackHandler",
+            "add_logging_level",
+            "get_logger",
+            "get_simple_logger",
+            "global_log_record_container",
+        ),
+    },
 )
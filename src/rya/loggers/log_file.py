@@ -5,7 +5,7 @@ from properpath.validators import PathValidationError, PathWriteValidator
 from pydantic import ValidationError
 from pydantic.experimental.missing_sentinel import MISSING
 
-from ..kernel import LoggerDefaults, get_logger
+from ..kernel import LoggerDefaults, get_logger, is_missing
 from ..names import AppIdentity, CacheModel, app_locations
 from ..pre_init import get_cached_data, update_meta_cache
 
@@ -23,8 +23,12 @@ def get_log_file_path() -> P:
         )
     if LoggerDefaults.will_cache_log_path:
         cached_data = get_cached_data()
-        if getattr(cached_data.app_meta, "log_file_path", MISSING) is not MISSING:
-            return cached_data.app_meta.log_file_path
+        if not is_missing(
+            cached_log_file_path := getattr(
+                cached_data.app_meta, "log_file_path", MISSING
+            )
+        ):
+            return cached_log_file_path
     else:
         cached_data = None
     log_paths = (
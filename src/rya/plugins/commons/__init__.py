@@ -1,8 +1,23 @@
+from typing import TYPE_CHECKING
+
+from ...kernel import get_lazy_exports
+
 __all__ = [
     "Typer",
     "Export",
+    "CacheStore",
 ]
 
-
+# Imported eagerly: cli_helpers patches typer with rich-click (if enabled)
+# at import time, which must happen before any plugin creates its Typer app.
 from .cli_helpers import Typer
-from .export import Export
+
+if TYPE_CHECKING:
+    from .export import Export
+    from ...pre_init import CacheStore
+
+__getattr__, __dir__ = get_lazy_exports(
+    __name__,
+    globals(),
+    {".export": ("Export",), "...pre_init": ("CacheStore",)},
+)
@@ -1,4 +1,5 @@
-from typing import Any
+from collections.abc import Callable
+from typing import Any, Optional
 
 from dynaconf import LazySettings
 from pydantic.experimental.missing_sentinel import MISSING
@@ -20,35 +21,27 @@ from .models import (
     ConfigDisplayValues,
 )
 from .utils import (
+    DynaconfSettingsHistoryIndex,
     _is_field_secret,
     _is_value_from_dynaconf_env,
     get_dynaconf_settings_history,
     partial_mask_secret,
 )
 from ...config import AllConfigModelsType, AppConfig, FieldsConfigType
+from ...config._model_handler import _flatten_config_fields
 from ...config._names import PluginDefinitions as Pdf
 from ...kernel import Missing
 
 
 def flatten_config_schema(config_model: AllConfigModelsType) -> dict[str, FieldInfo]:
-    def _get_val_by_field_name(fields: FieldsConfigType | dict, origin_key: str | None):
-        flattened_data: dict[str, FieldInfo] = {}
-        for field_name, field_val in fields.items():
-            flattened_data[f"{f'{origin_key}.' if origin_key else ''}{field_name}"] = (
-                field_val["field_info"]
-            )
-        return flattened_data
-
-    all_flattened_data: dict[str, FieldInfo] = {}
-    all_flattened_data.update(
-        _get_val_by_field_name(
-            config_model.get("main", {}).get("fields", {}),
-            None,
-        )
+    # ConfigMaker.get_flattened_schema() is the incrementally maintained
+    # equivalent for the registered models
+    all_flattened_data: dict[str, FieldInfo] = _flatten_config_fields(
+        config_model.get("main", {}).get("fields", {})
     )
     for plugin_name, plugin_config_model_val in config_model.get("plugins", {}).items():
         all_flattened_data.update(
-            _get_val_by_field_name(
+            _flatten_config_fields(
                 plugin_config_model_val.get("fields", {}),
                 f"{Pdf.config_section_name}.{plugin_name}",
             )
@@ -56,241 +49,120 @@ def flatten_config_schema(config_model: AllConfigModelsType) -> dict[str, FieldI
     return all_flattened_data
 
 
-def _can_pass_conf_display_filter(
+def _passes_nondef_filter(
     dynaconf_settings: LazySettings,
     *,
     field_name: str,
     field_value: Any,
     field_info: FieldInfo,
     config_description: ConfigDescriptionModel | None,
-    filter_: ConfigDisplayFilters,
+    history_index: Optional[DynaconfSettingsHistoryIndex] = None,
 ) -> bool:
-    match filter_:
-        case ConfigDisplayFilters(nondef=False, secret=False, env=False):
-            return True
-        case ConfigDisplayFilters(nondef=True, secret=False, env=False):
-            if field_value != field_info.default:
-                return True
-            return False
-        case ConfigDisplayFilters(nondef=False, secret=True, env=False):
-            if _is_field_secret(
-                field_info,
-                config_description,
-            ):
-                return True
-            return False
-        case ConfigDisplayFilters(nondef=True, secret=True, env=False):
-            if _is_field_secret(
-                field_info,
-                config_description,
-            ):
-                # Here even for secrets, field_value is a string and not a pydantic Secret!
-                # That's because we fetch the value directly from dynaconf.
-                if field_value != field_info.default:
-                    return True
-            return False
-        case ConfigDisplayFilters(nondef=False, secret=False, env=True):
-            if _is_value_from_dynaconf_env(
-                dynaconf_settings,
-                field_name=field_name,
-            ):
-                return True
-            return False
-        case ConfigDisplayFilters(nondef=True, secret=False, env=True):
-            if _is_value_from_dynaconf_env(
-                dynaconf_settings,
-                field_name=field_name,
-            ):
-                if field_value != field_info.default:
-                    return True
-            return False
-        case ConfigDisplayFilters(nondef=False, secret=True, env=True):
-            if _is_value_from_dynaconf_env(
-                dynaconf_settings,
-                field_name=field_name,
-            ):
-                if _is_field_secret(
-                    field_info,
-                    config_description,
-                ):
-                    return True
-            return False
-        case ConfigDisplayFilters(nondef=True, secret=True, env=True):
-            if _is_value_from_dynaconf_env(
-                dynaconf_settings,
-                field_name=field_name,
-            ):
-                if _is_field_secret(
-                    field_info,
-                    config_description,
-                ):
-                    if field_value != field_info.default:
-                        return True
-            return False
-        case _:
-            raise UnknownConfigDisplayFilterError(
-                f"An unexpected {filter_} instance was passed."
-            )
+    return field_value != field_info.default
 
 
-def _add_include_options_to_display_values(
+def _passes_secret_filter(
+    dynaconf_settings: LazySettings,
     *,
+    field_name: str,
+    field_value: Any,
+    field_info: FieldInfo,
+    config_description: ConfigDescriptionModel | None,
+    history_index: Optional[DynaconfSettingsHistoryIndex] = None,
+) -> bool:
+    # Here even for secrets, field_value is a string and not a pydantic Secret!
+    # That's because we fetch the value directly from dynaconf.
+    return _is_field_secret(field_info, config_description)
+
+
+def _passes_env_filter(
+    dynaconf_settings: LazySettings,
+    *,
+    field_name: str,
+    field_value: Any,
+    field_info: FieldInfo,
+    config_description: ConfigDescriptionModel | None,
+    history_index: Optional[DynaconfSettingsHistoryIndex] = None,
+) -> bool:
+    return _is_value_from_dynaconf_env(
+        dynaconf_settings, field_name=field_name, history_index=history_index
+    )
+
+
+ConfigDisplayFilterPredicate = Callable[..., bool]
+
+
+def compile_conf_display_filter(
+    filter_: ConfigDisplayFilters,
+) -> ConfigDisplayFilterPredicate:
+    if not isinstance(filter_, ConfigDisplayFilters):
+        raise UnknownConfigDisplayFilterError(
+            f"An unexpected {filter_} instance was passed."
+        )
+    # Filters are applied with an 'AND' relationship.
+    # Cheaper predicates come first.
+    predicates: list[ConfigDisplayFilterPredicate] = []
+    if filter_.nondef:
+        predicates.append(_passes_nondef_filter)
+    if filter_.secret:
+        predicates.append(_passes_secret_filter)
+    if filter_.env:
+        predicates.append(_passes_env_filter)
+
+    def can_pass_conf_display_filter(
+        dynaconf_settings: LazySettings, /, **field_kwargs: Any
+    ) -> bool:
+        return all(
+            predicate(dynaconf_settings, **field_kwargs) for predicate in predicates
+        )
+
+    return can_pass_conf_display_filter
+
+
+def _get_value_with_unit(display_values: ConfigDisplayValues) -> str:
+    if display_values.unit:
+        return f"{display_values.value} {escape(f'[{display_values.unit}]')}"
+    return display_values.value
+
+
+ConfigDisplayRowProjector = Callable[[ConfigDisplayValues], tuple[Any, ...]]
+
+
+def compile_conf_display_columns(
     include_options: ConfigDisplayIncludes,
-    display_values: ConfigDisplayValues,
-) -> tuple[tuple[str, ...], tuple[Any, ...]]:
-    match include_options:
-        case ConfigDisplayIncludes(desc=True, loc=True, unit=True):
-            match display_values:
-                case ConfigDisplayValues(description=None, unit=None):
-                    return ("Field name", "Description", "Location", "Value"), (
-                        f"[green]{display_values.key}[/green]",
-                        None,
-                        f"{display_values.location}",
-                        display_values.value,
-                    )
-                case ConfigDisplayValues(description=None, unit=_):
-                    value = f"{display_values.value}{
-                        f' {escape(f"[{display_values.unit}]")}'
-                        if display_values.unit
-                        else ''
-                    }"
-                    return ("Field name", "Description", "Location", "Value"), (
-                        f"[green]{display_values.key}[/green]",
-                        None,
-                        f"{display_values.location}",
-                        value,
-                    )
-                case ConfigDisplayValues(description=_, unit=None):
-                    return ("Field name", "Description", "Location", "Value"), (
-                        f"[green]{display_values.key}[/green]",
-                        display_values.description,
-                        f"{display_values.location}",
-                        display_values.value,
-                    )
-                case ConfigDisplayValues(description=_, unit=_):
-                    value = f"{display_values.value}{
-                        f' {escape(f"[{display_values.unit}]")}'
-                    }"
-                    return ("Field name", "Description", "Location", "Value"), (
-                        f"[green]{display_values.key}[/green]",
-                        display_values.description,
-                        display_values.location,
-                        value,
-                    )
-        case ConfigDisplayIncludes(desc=True, loc=True, unit=False):
-            match display_values:
-                case ConfigDisplayValues(description=None):
-                    return ("Field name", "Description", "Location", "Value"), (
-                        f"[green]{display_values.key}[/green]",
-                        None,
-                        f"{display_values.location}",
-                        display_values.value,
-                    )
-                case ConfigDisplayValues(description=_):
-                    return ("Field name", "Description", "Location", "Value"), (
-                        f"[green]{display_values.key}[/green]",
-                        display_values.description,
-                        f"{display_values.location}",
-                        display_values.value,
-                    )
-        case ConfigDisplayIncludes(desc=True, loc=False, unit=True):
-            match display_values:
-                case ConfigDisplayValues(description=None, unit=None):
-                    return ("Field name", "Description", "Value"), (
-                        f"[green]{display_values.key}[/green]",
-                        None,
-                        display_values.value,
-                    )
-                case ConfigDisplayValues(description=None, unit=_):
-                    value = f"{display_values.value}{
-                        f' {escape(f"[{display_values.unit}]")}'
-                        if display_values.unit
-                        else ''
-                    }"
-                    return ("Field name", "Description", "Value"), (
-                        f"[green]{display_values.key}[/green]",
-                        None,
-                        value,
-                    )
-                case ConfigDisplayValues(description=_, unit=None):
-                    return ("Field name", "Description", "Value"), (
-                        f"[green]{display_values.key}[/green]",
-                        display_values.description,
-                        display_values.value,
-                    )
-                case ConfigDisplayValues(description=_, unit=_):
-                    value = f"{display_values.value}{
-                        f' {escape(f"[{display_values.unit}]")}'
-                    }"
-                    return ("Field name", "Description", "Value"), (
-                        f"[green]{display_values.key}[/green]",
-                        display_values.description,
-                        value,
-                    )
-        case ConfigDisplayIncludes(desc=True, loc=False, unit=False):
-            match display_values:
-                case ConfigDisplayValues(description=None):
-                    return ("Field name", "Description", "Value"), (
-                        f"[green]{display_values.key}[/green]",
-                        None,
-                        display_values.value,
-                    )
-                case ConfigDisplayValues(description=_):
-                    return ("Field name", "Description", "Value"), (
-                        f"[green]{display_values.key}[/green]",
-                        display_values.description,
-                        display_values.value,
-                    )
-        case ConfigDisplayIncludes(desc=False, loc=True, unit=True):
-            match display_values:
-                case ConfigDisplayValues(unit=None):
-                    return ("Field name", "Location", "Value"), (
-                        f"[green]{display_values.key}[/green]",
-                        f"{display_values.location}",
-                        display_values.value,
-                    )
-                case ConfigDisplayValues(unit=_):
-                    value = f"{display_values.value}{
-                        f' {escape(f"[{display_values.unit}]")}'
-                        if display_values.unit
-                        else ''
-                    }"
-                    return ("Field name", "Location", "Value"), (
-                        f"[green]{display_values.key}[/green]",
-                        f"{display_values.location}",
-                        value,
-                    )
-        case ConfigDisplayIncludes(desc=False, loc=True, unit=False):
-            return ("Field name", "Location", "Value"), (
-                f"[green]{display_values.key}[/green]",
-                f"{display_values.location}",
-                display_values.value,
-            )
-        case ConfigDisplayIncludes(desc=False, loc=False, unit=True):
-            value = f"{display_values.value}{
-                f' {escape(f"[{display_values.unit}]")}' if display_values.unit else ''
-            }"
-            return ("Field name", "Value"), (
-                f"[green]{display_values.key}[/green]",
-                value,
-            )
-        case ConfigDisplayIncludes(desc=False, loc=False, unit=False):
-            return ("Field name", "Value"), (
-                f"[green]{display_values.key}[/green]",
-                display_values.value,
-            )
-    return ("Field name", "Value"), (
-        f"[green]{display_values.key}[/green]",
-        display_values.value,
+) -> tuple[tuple[str, ...], ConfigDisplayRowProjector]:
+    # Configuration field names and values are always included
+    columns: list[tuple[str, Callable[[ConfigDisplayValues], Any]]] = [
+        ("Field name", lambda values: f"[green]{values.key}[/green]")
+    ]
+    if include_options.desc:
+        columns.append(("Description", lambda values: values.description))
+    if include_options.loc:
+        columns.append(("Location", lambda values: f"{values.location}"))
+    columns.append(
+        (
+            "Value",
+            _get_value_with_unit
+            if include_options.unit
+            else (lambda values: values.value),
+        )
     )
+    column_names = tuple(column_name for column_name, _ in columns)
+    column_getters = tuple(column_getter for _, column_getter in columns)
+
+    def project_row(display_values: ConfigDisplayValues) -> tuple[Any, ...]:
+        return tuple(column_getter(display_values) for column_getter in column_getters)
+
+    return column_names, project_row
 
 
 def _get_field_config_result(
     field_name: str,
     field_info: FieldInfo,
     *,
-    filters: ConfigDisplayFilters,
+    filters: ConfigDisplayFilters | ConfigDisplayFilterPredicate,
     reload: bool = False,
+    history_index: Optional[DynaconfSettingsHistoryIndex] = None,
 ) -> ConfigDisplayValues | None:
     def _default_or_missing(_field_info: FieldInfo) -> Any:
         if _field_info.default is PydanticUndefined:
@@ -300,20 +172,27 @@ def _get_field_config_result(
     field_value = (dynaconf_settings := AppConfig.get_settings(reload=reload)).get(
         field_name, _default_or_missing(field_info)
     )
-    field_location = get_dynaconf_settings_history(
-        dynaconf_settings,
-        field_name=field_name,
-        default=[
-            {
-                "identifier": str(
-                    Missing(
-                        "LOCATION NOT FOUND",
-                        rich_color="red",
-                    )
-                )
-            }
-        ],
-    )[-1]["identifier"]
+    can_pass_conf_display_filter = (
+        filters if callable(filters) else compile_conf_display_filter(filters)
+    )
+    location_not_found = {
+        "identifier": str(
+            Missing(
+                "LOCATION NOT FOUND",
+                rich_color="red",
+            )
+        )
+    }
+    if history_index is not None:
+        field_location = history_index.get_last_entry(
+            field_name, default=location_not_found
+        )["identifier"]
+    else:
+        field_location = get_dynaconf_settings_history(
+            dynaconf_settings,
+            field_name=field_name,
+            default=[location_not_found],
+        )[-1]["identifier"]
     match field_info.json_schema_extra:
         case dict():
             match config_description := field_info.json_schema_extra.get(
@@ -324,13 +203,13 @@ def _get_field_config_result(
                     # A false positive. All return cases are already handled.
                     match config_description.include:
                         case True:
-                            if _can_pass_conf_display_filter(
+                            if can_pass_conf_display_filter(
                                 dynaconf_settings,
                                 field_name=field_name,
                                 field_value=field_value,
                                 field_info=field_info,
                                 config_description=config_description,
-                                filter_=filters,
+                                history_index=history_index,
                             ):
                                 if field_value is MISSING:
                                     return ConfigDisplayValues(
@@ -371,13 +250,13 @@ def _get_field_config_result(
                         f"type {type(config_description)} with value {config_description}. "
                     )
         case _:
-            if _can_pass_conf_display_filter(
+            if can_pass_conf_display_filter(
                 dynaconf_settings,
                 field_name=field_name,
                 field_value=field_value,
                 field_info=field_info,
                 config_description=None,
-                filter_=filters,
+                history_index=history_index,
             ):
                 if field_value is MISSING:
                     return ConfigDisplayValues(
@@ -1,40 +1,117 @@
-import re
+import json
+import sys
 from collections import defaultdict
+from collections.abc import Generator, Iterable
+from pathlib import Path
 from typing import Annotated, Optional
 
 import typer
+from properpath import P
 from rich import box
 from rich.table import Table
+from rich.text import Text
 
 from ._meta import get_app_meta_info
 from ._names import ConfigDisplayOptionDefaults, _ConfigInternalDisplayOptionDefaults
 from ._parse_schema import (
-    _add_include_options_to_display_values,
     _get_field_config_result,
-    flatten_config_schema,
+    compile_conf_display_columns,
+    compile_conf_display_filter,
 )
 from .exceptions import ConfigDisplayFilterNotSupportedError
-from .models import ConfigDisplayFilters, ConfigDisplayIncludes
+from .models import ConfigDisplayFilters, ConfigDisplayIncludes, ConfigDisplayValues
 from .utils import (
+    DynaconfSettingsHistoryIndex,
     _MultiOptionsParserParams,
     _parse_config_disp_user_multi_options,
 )
-from ..commons import Typer
-from ...config import ConfigMaker
+from ..commons import Export, Typer
+from ...config import AppConfig, ConfigMaker
 from ...kernel import Exit
 from ...names import AppIdentity
-from ...styles import print_typer_error, stdout_console
+from ...styles import (
+    BaseFormat,
+    FormatError,
+    get_formatter,
+    print_typer_error,
+    stderr_console,
+    stdout_console,
+)
 
 app = Typer(name="config", help="Manage configuration.", no_args_is_help=True)
 
 
+def _iter_field_config_results(
+    field_name: Optional[str], filters: ConfigDisplayFilters
+) -> Generator[ConfigDisplayValues, None, None]:
+    # Lazily loaded plugins that have not been invoked yet
+    # have not registered their configuration models.
+    ConfigMaker.load_deferred_models()
+    history_index = DynaconfSettingsHistoryIndex(AppConfig.get_settings())
+    can_pass_conf_display_filter = compile_conf_display_filter(filters)
+    flattened_schema = ConfigMaker.get_flattened_schema()
+    field_names: Iterable[str] = (
+        flattened_schema
+        if field_name is None
+        else ConfigMaker.get_flattened_schema_index().get_by_dotted_name(field_name)
+    )
+    for key in field_names:
+        val = flattened_schema[key]
+        result = _get_field_config_result(
+            key,
+            val,
+            filters=can_pass_conf_display_filter,
+            history_index=history_index,
+        )
+        if result is not None:
+            yield result
+
+
+def _complete_field_name(incomplete: str) -> list[str]:
+    ConfigMaker.load_deferred_models()
+    return ConfigMaker.get_flattened_schema_index().get_prefixed(incomplete)
+
+
+def _get_plain_display_values(
+    *,
+    include_options: ConfigDisplayIncludes,
+    display_values: ConfigDisplayValues,
+) -> dict[str, Optional[str]]:
+    # Values can have Rich markup (e.g., for missing values) that is
+    # rendered in the table view. Streamed and exported values are plain text.
+    def _plain(value: Optional[str]) -> Optional[str]:
+        return None if value is None else Text.from_markup(value).plain
+
+    plain_values: dict[str, Optional[str]] = {
+        "key": display_values.key,
+        "value": _plain(display_values.value),
+    }
+    if include_options.desc:
+        plain_values["description"] = display_values.description
+    if include_options.unit:
+        plain_values["unit"] = display_values.unit
+    if include_options.loc:
+        plain_values["location"] = _plain(display_values.location)
+    return plain_values
+
+
+def _print_unique_config_files(
+    unique_config_files: dict[str | None, int], *, to_stderr: bool = False
+) -> None:
+    console = stderr_console if to_stderr else stdout_console
+    console.print("\n[bold]Unique Configuration Files:[/bold]")
+    for k, v in unique_config_files.items():
+        console.print(f"- {k}: {v} matched")
+
+
 @app.command(name="show", help="Display configuration values.")
 def show(
     field_name: Annotated[
         Optional[str],
         typer.Argument(
             help="Configuration field name (a.k.a. the key). "
-            "Dot notation is also supported. E.g.: [green]plugins.foo[/green]"
+            "Dot notation is also supported. E.g.: [green]plugins.foo[/green]",
+            autocompletion=_complete_field_name,
         ),
     ] = None,
     short_view: Annotated[
@@ -87,16 +164,38 @@ def show(
             f"filter all fields that are secrets and are loaded from environment variables.",
         ),
     ] = ConfigDisplayOptionDefaults.filter_cli_default,
+    stream: Annotated[
+        bool,
+        typer.Option(
+            "--stream",
+            help="Print each configuration field as a JSON line (NDJSON) as soon as "
+            "it is resolved, instead of a table. The unique configuration files "
+            "summary is printed to stderr.",
+        ),
+    ] = False,
+    data_format: Annotated[
+        Optional[str],
+        typer.Option(
+            "--format",
+            "-F",
+            help="Print the configuration fields in a machine-readable format "
+            "instead of a table. Supported formats: "
+            f"{', '.join(BaseFormat.get_supported_formatter_names(AppIdentity.app_name))}. "
+            "The unique configuration files summary is printed to stderr.",
+            show_default=False,
+        ),
+    ] = None,
+    export_destination: Annotated[
+        Optional[Path],
+        typer.Option(
+            "--export",
+            "-e",
+            help="Write the '--format' output to a file instead of stdout. If the "
+            "path is a directory, a timestamped file name is created inside it.",
+            show_default=False,
+        ),
+    ] = None,
 ):
-    def _create_columns(table_: Table, column_names_: tuple[str, ...]):
-        if len(table_.columns) != len(column_names_):
-            for _ in column_names_:
-                table_.add_column(
-                    "",
-                    overflow="fold",
-                    no_wrap=False,
-                )
-
     if short_view:
         include_options = "key val unit"
     if long_view:
@@ -124,53 +223,91 @@ def show(
         print_typer_error(str(e))
         raise Exit(1)
 
+    formatter: Optional[BaseFormat] = None
+    if data_format is not None:
+        try:
+            formatter = get_formatter(data_format, identifier=AppIdentity.app_name)
+        except FormatError as e:
+            print_typer_error(str(e))
+            raise Exit(1)
+    elif export_destination is not None:
+        print_typer_error("'--export' can only be used with '--format'.")
+        raise Exit(1)
+
     unique_config_files: dict[str | None, int] = defaultdict(int)
+    if formatter is not None:
+        # Rich rendering is skipped entirely for machine-readable formats
+        plain_values: list[dict[str, Optional[str]]] = []
+        for result in _iter_field_config_results(field_name, filters_struct):
+            unique_config_files[result.location] += 1
+            plain_values.append(
+                _get_plain_display_values(
+                    include_options=include_struct, display_values=result
+                )
+            )
+        if not plain_values:
+            raise Exit(1)
+        formatted_values: str = formatter(plain_values)
+        if export_destination is None:
+            sys.stdout.write(
+                formatted_values
+                if formatted_values.endswith("\n")
+                else f"{formatted_values}\n"
+            )
+            sys.stdout.flush()
+        else:
+            try:
+                Export(
+                    destination=P(export_destination),
+                    file_name_stub="config",
+                    file_extension=(
+                        formatter.conventions[0]
+                        if formatter.conventions and formatter.conventions[0]
+                        else formatter.name
+                    ),
+                )(formatted_values, verbose=True)
+            except OSError as e:
+                print_typer_error(
+                    f"Configuration could not be exported to {export_destination}. "
+                    f"Exception details: {e}"
+                )
+                raise Exit(1)
+        _print_unique_config_files(unique_config_files, to_stderr=True)
+        return
+    if stream:
+        for result in _iter_field_config_results(field_name, filters_struct):
+            unique_config_files[result.location] += 1
+            stdout_console.out(
+                json.dumps(
+                    _get_plain_display_values(
+                        include_options=include_struct, display_values=result
+                    ),
+                    ensure_ascii=False,
+                ),
+                highlight=False,
+            )
+        if not unique_config_files:
+            raise Exit(1)
+        # stdout only has JSON lines, so the summary goes to stderr
+        _print_unique_config_files(unique_config_files, to_stderr=True)
+        return
     table = Table(
         box=box.HEAVY_HEAD if show_borders else None,
         show_header=True,
         show_lines=True,  # Doesn't show anyway when box=None
     )
-    for key, val in flatten_config_schema(ConfigMaker.get_all_models()).items():
-        match field_name:
-            case None:
-                result = _get_field_config_result(key, val, filters=filters_struct)
-                if result is not None:
-                    unique_config_files[result.location] += 1
-                    column_names, rows = _add_include_options_to_display_values(
-                        include_options=include_struct, display_values=result
-                    )
-                    _create_columns(table, column_names)
-                    for _i, _c in enumerate(column_names):
-                        table.columns[_i].header = _c
-                    table.add_row(*rows)
-            case _:
-                pattern_appr_key = (field_name or "").replace(".", r"\.")
-                pattern = re.compile(
-                    (
-                        rf"^({pattern_appr_key}(?=\.))|"
-                        rf"^{pattern_appr_key}$"
-                    ),
-                    re.IGNORECASE,
-                )
-                if re.match(pattern, key):
-                    result = _get_field_config_result(key, val, filters=filters_struct)
-                    if result is not None:
-                        unique_config_files[result.location] += 1
-                        column_names, rows = _add_include_options_to_display_values(
-                            include_options=include_struct, display_values=result
-                        )
-                        _create_columns(table, column_names)
-                        for _i, _c in enumerate(column_names):
-                            table.columns[_i].header = _c
-                        table.add_row(*rows)
+    column_names, project_row = compile_conf_display_columns(include_struct)
+    for column_name in column_names:
+        table.add_column(column_name, overflow="fold", no_wrap=False)
+    for result in _iter_field_config_results(field_name, filters_struct):
+        unique_config_files[result.location] += 1
+        table.add_row(*project_row(result))
     if table.row_count > 0:
         stdout_console.print(table)
     else:
         raise Exit(1)
     if unique_config_files:
-        stdout_console.print("\n[bold]Unique Configuration Files:[/bold]")
-        for k, v in unique_config_files.items():
-            stdout_console.print(f"- {k}: {v} matched")
+        _print_unique_config_files(unique_config_files)
 
 
 @app.command(name="meta", help=f"Show {AppIdentity.app_fancy_name} meta information.")
@@ -1,10 +1,12 @@
 import re
 import typing
 from enum import StrEnum
-from typing import Generic
+from typing import Any, Generic, Optional
 
 from dynaconf import LazySettings
 from dynaconf.utils import inspect
+from dynaconf.utils.functional import empty
+from dynaconf.utils.parse_conf import Lazy
 from pydantic import BaseModel, Secret
 from pydantic.fields import FieldInfo
 
@@ -31,14 +33,22 @@ def _is_field_secret(
 
 
 def _is_value_from_dynaconf_env(
-    dynaconf_settings: LazySettings, /, field_name: str
+    dynaconf_settings: LazySettings,
+    /,
+    field_name: str,
+    history_index: Optional["DynaconfSettingsHistoryIndex"] = None,
 ) -> bool:
-    history = get_dynaconf_settings_history(
-        dynaconf_settings, field_name=field_name, default=None
-    )
-    if not history:
-        return False
-    actual_value_history = history[-1]
+    if history_index is not None:
+        actual_value_history = history_index.get_last_entry(field_name, default=None)
+        if actual_value_history is None:
+            return False
+    else:
+        history = get_dynaconf_settings_history(
+            dynaconf_settings, field_name=field_name, default=None
+        )
+        if not history:
+            return False
+        actual_value_history = history[-1]
     match actual_value_history.get("value"):
         # See dynaconf interpolation: https://www.dynaconf.com/dynamic/?h=%40format#format-token
         # Environment variable approved characters regex: ([a-zA-Z_]+[a-zA-Z0-9_]*)
@@ -84,6 +94,49 @@ def get_dynaconf_settings_history[AnyDefault](
         return history
 
 
+class DynaconfSettingsHistoryIndex:
+    """
+    Maps every dotted key path found in the Dynaconf loader history to its last
+    (i.e., effective) history entry. Same entries as the last item of
+    get_dynaconf_settings_history, but the history is only scanned once.
+    """
+
+    def __init__(self, dynaconf_settings: LazySettings, /) -> None:
+        self.dynaconf_settings = dynaconf_settings
+        self._index: dict[str, dict] = {}
+        # loaded_by_loaders is in loading order, so later sources overwrite
+        for source_metadata, data in dynaconf_settings.loaded_by_loaders.items():
+            self._add_source_data(source_metadata._asdict(), data, key_prefix=None)
+
+    def _add_source_data(
+        self, source_metadata: dict, data: Any, *, key_prefix: Optional[str]
+    ) -> None:
+        if not isinstance(data, dict):
+            return
+        for key, value in data.items():
+            dotted_key = f"{f'{key_prefix}.' if key_prefix else ''}{key}".lower()
+            if isinstance(value, Lazy):
+                # Lazy values must not be evaluated for inspecting
+                value = value._dynaconf_encode()
+            self._index[dotted_key] = {**source_metadata, "value": value}
+            self._add_source_data(source_metadata, value, key_prefix=dotted_key)
+
+    def get_last_entry[AnyDefault](
+        self, field_name: str, /, default: AnyDefault
+    ) -> dict | AnyDefault:
+        try:
+            return self._index[field_name.lower()]
+        except KeyError:
+            # The key may be set without being tracked in the history
+            if (value := self.dynaconf_settings.get(field_name, empty)) is not empty:
+                return {
+                    "loader": "undefined",
+                    "identifier": "undefined",
+                    "value": value,
+                }
+            return default
+
+
 _UserOptionsType = typing.TypeVar(
     "_UserOptionsType", ConfigDisplayFilters, ConfigDisplayIncludes
 )
@@ -1,3 +1,7 @@
+from typing import TYPE_CHECKING
+
+from ..kernel import get_lazy_exports
+
 __all__ = [
     "get_app_version",
     "PatternNotFoundError",
@@ -5,11 +9,26 @@ __all__ = [
     "update_cache",
     "AppVersionNotFound",
     "update_meta_cache",
+    "flush_cache",
+    "CacheStore",
 ]
 
-from ._cache import get_cached_data, update_cache, update_meta_cache
-from ._utils import (
-    AppVersionNotFound,
-    PatternNotFoundError,
-    get_app_version,
+if TYPE_CHECKING:
+    from ._cache import flush_cache, get_cached_data, update_cache, update_meta_cache
+    from ._cache_store import CacheStore
+    from ._utils import AppVersionNotFound, PatternNotFoundError, get_app_version
+
+__getattr__, __dir__ = get_lazy_exports(
+    __name__,
+    globals(),
+    {
+        "._cache": (
+            "flush_cache",
+            "get_cached_data",
+            "update_cache",
+            "update_meta_cache",
+        ),
+        "._cache_store": ("CacheStore",),
+        "._utils": ("AppVersionNotFound", "PatternNotFoundError", "get_app_version"),
+    },
 )
@@ -1,35 +1,269 @@
+import atexit
 import json
+import os
+import stat
+import tempfile
+import time
+from collections.abc import Generator
+from contextlib import contextmanager, suppress
 from datetime import datetime
+from typing import Any, ClassVar, Optional
 
+from properpath import P
 from pydantic import ValidationError
-from pydantic.experimental.missing_sentinel import MISSING
 
-from ..kernel import get_logger, CacheFileProperties, AppMetaCacheModel
+from ..kernel import (
+    AppMetaCacheModel,
+    CacheFileProperties,
+    get_logger,
+    global_cli_result_callback,
+    is_missing,
+    is_platform_unix,
+)
 from ..names import CacheModel, app_locations
 
 logger = get_logger()
 
 
+@contextmanager
+def lock_file(path: P, /, *, exclusive: bool = False) -> Generator[bool, None, None]:
+    # Advisory lock on a separate lock file next to path: cache files are replaced
+    # on every write, so a lock on the file itself would not be seen by the next
+    # process. Yields whether the lock was acquired. Both the readers and the
+    # writer still work without the lock (writes are atomic), so waiting is bounded.
+    if not is_platform_unix():
+        yield False
+        return
+    import fcntl
+
+    lock_path = f"{path}{CacheFileProperties.lock_file_suffix}"
+    try:
+        os.makedirs(path.parent, exist_ok=True)
+        fd = os.open(lock_path, os.O_RDWR | os.O_CREAT, 0o666)
+    except OSError as e:
+        logger.debug(f"Cache lock file '{lock_path}' could not be opened: {e}")
+        yield False
+        return
+    try:
+        operation = (fcntl.LOCK_EX if exclusive else fcntl.LOCK_SH) | fcntl.LOCK_NB
+        deadline = time.monotonic() + CacheFileProperties.lock_timeout_seconds
+        delay: float = 0.001
+        while True:
+            try:
+                fcntl.flock(fd, operation)
+            except BlockingIOError:
+                if time.monotonic() >= deadline:
+                    logger.debug(
+                        f"Timed out waiting for the cache lock '{lock_path}'. "
+                        f"Cache file will be accessed without the lock."
+                    )
+                    locked = False
+                    break
+                time.sleep(delay)
+                delay = min(delay * 2, 0.05)
+            else:
+                locked = True
+                break
+        try:
+            yield locked
+        finally:
+            if locked:
+                fcntl.flock(fd, fcntl.LOCK_UN)
+    finally:
+        os.close(fd)
+
+
+def _get_umask() -> int:
+    # The umask can only be read by setting it
+    umask = os.umask(0)
+    os.umask(umask)
+    return umask
+
+
+def write_file_atomically(path: P, content: str, /) -> None:
+    os.makedirs(path.parent, exist_ok=True)
+    fd, temp_path = tempfile.mkstemp(
+        dir=path.parent, prefix=f".{path.name}.", suffix=".tmp"
+    )
+    try:
+        try:
+            mode = stat.S_IMODE(os.stat(path).st_mode)
+        except FileNotFoundError:
+            # Same mode as a file newly created with open(path, "w")
+            mode = 0o666 & ~_get_umask()
+        # mkstemp creates the file with 0o600
+        os.chmod(temp_path, mode)
+        with os.fdopen(fd, "w", encoding=CacheFileProperties.encoding) as f:
+            f.write(content)
+            f.flush()
+            os.fsync(f.fileno())
+        # Readers never see a partially written cache file
+        os.replace(temp_path, path)
+    except BaseException:
+        with suppress(OSError):
+            os.unlink(temp_path)
+        raise
+
+
+def _read_cache_file_unlocked(
+    file_stat: Optional[tuple[int, int]],
+) -> tuple[Optional[tuple[int, int]], Optional[dict[str, Any]]]:
+    if file_stat is None:
+        return None, {}
+    try:
+        return file_stat, json.loads(
+            app_locations.cache_path.get_text(
+                encoding=CacheFileProperties.encoding,
+            )
+            or "{}"
+        )
+    except (OSError, ValueError):
+        return file_stat, None
+
+
+def _read_cache_file() -> tuple[Optional[tuple[int, int]], Optional[dict[str, Any]]]:
+    # Returns the file stat (taken before reading, so a change made in between
+    # is caught on the next call) and the parsed JSON (None if it is not valid JSON)
+    with lock_file(app_locations.cache_path):
+        return _read_cache_file_unlocked(CacheManager.get_cache_file_stat())
+
+
+class CacheManager:
+    # Process-level view of the cache. get_cached_data() returns the same model
+    # until the cache file changes on disk, so changes to it must still go
+    # through update_cache() to be written.
+    _cache: ClassVar[Optional[CacheModel]] = None
+    # (st_mtime_ns, st_size) of the cache file the view was read from or written to
+    _cache_file_stat: ClassVar[Optional[tuple[int, int]]] = None
+    # Cache updates are batched during a run and written once, when the
+    # global CLI result callbacks are called (or at interpreter exit at the latest).
+    _has_pending_update: ClassVar[bool] = False
+    # What the cache file is known to contain (without "date"), to skip no-op writes
+    _file_data: ClassVar[Optional[dict[str, Any]]] = None
+    _file_date: ClassVar[Optional[datetime]] = None
+    _atexit_registered: ClassVar[bool] = False
+
+    @staticmethod
+    def get_cache_file_stat() -> Optional[tuple[int, int]]:
+        try:
+            file_stat = os.stat(app_locations.cache_path)
+        except OSError:
+            return None
+        return file_stat.st_mtime_ns, file_stat.st_size
+
+    @classmethod
+    def get_cache(cls) -> Optional[CacheModel]:
+        if cls._cache is None or cls._has_pending_update:
+            return cls._cache
+        if cls.get_cache_file_stat() != cls._cache_file_stat:
+            logger.debug(
+                f"Cache file '{app_locations.cache_path}' has changed since "
+                f"it was last read. Cache will be read again."
+            )
+            cls._cache = None
+        return cls._cache
+
+    @classmethod
+    def set_cache(
+        cls,
+        cache: CacheModel,
+        /,
+        *,
+        file_data: dict[str, Any],
+        file_stat: Optional[tuple[int, int]],
+    ) -> None:
+        cls._cache = cache
+        cls._cache_file_stat = file_stat
+        cls._file_data = {k: v for k, v in file_data.items() if k != "date"}
+        cls._file_date = cache.date
+
+    @classmethod
+    def add_update(cls, cache: CacheModel) -> None:
+        cls._cache = cache
+        cls._has_pending_update = True
+        if cls.flush not in global_cli_result_callback.get_callbacks():
+            global_cli_result_callback.add_callback(cls.flush)
+        if not cls._atexit_registered:
+            atexit.register(cls.flush)
+            cls._atexit_registered = True
+
+    @classmethod
+    def _is_file_up_to_date(cls, data: dict[str, Any], date: datetime) -> bool:
+        if cls._file_data is None or cls._file_date is None:
+            return False
+        # "date" is refreshed at most once a day, so the expiry
+        # still counts from the last run (give or take a day)
+        return (date - cls._file_date).days < 1 and cls._file_data == {
+            k: v for k, v in data.items() if k != "date"
+        }
+
+    @classmethod
+    def flush(cls) -> None:
+        if not cls._has_pending_update or cls._cache is None:
+            return
+        cache, cls._has_pending_update = cls._cache, False
+        data: dict[str, Any] = cache.model_dump(mode="json")
+        if cls._is_file_up_to_date(data, cache.date):
+            logger.debug(
+                f"Cache in '{app_locations.cache_path}' is unchanged. "
+                f"Cache file will not be written."
+            )
+            return
+        with lock_file(app_locations.cache_path, exclusive=True):
+            if (file_stat := cls.get_cache_file_stat()) != cls._cache_file_stat:
+                # Another process has written the cache since it was read here.
+                # If it has written the same data, there is nothing left to do.
+                _, file_data = _read_cache_file_unlocked(file_stat)
+                if isinstance(file_data, dict):
+                    with suppress(KeyError, TypeError, ValueError):
+                        cls._file_data = {
+                            k: v for k, v in file_data.items() if k != "date"
+                        }
+                        cls._file_date = datetime.fromisoformat(file_data["date"])
+                    if cls._is_file_up_to_date(data, cache.date):
+                        logger.debug(
+                            f"Cache in '{app_locations.cache_path}' has already "
+                            f"been updated by another process. Cache file will "
+                            f"not be written."
+                        )
+                        cls._cache_file_stat = file_stat
+                        return
+            try:
+                write_file_atomically(
+                    app_locations.cache_path,
+                    json.dumps(
+                        data, indent=CacheFileProperties.indent, ensure_ascii=False
+                    ),
+                )
+            except OSError as e:
+                logger.warning(
+                    f"Cache could not be written to '{app_locations.cache_path}'. "
+                    f"Exception details: {e}"
+                )
+                return
+            cls.set_cache(cache, file_data=data, file_stat=cls.get_cache_file_stat())
+
+
 def get_cached_data() -> CacheModel:
     def _new_cache() -> CacheModel:
         update_cache(cache_ := CacheModel())
         return cache_
 
-    raw_cache = json.loads(
-        app_locations.cache_path.get_text(
-            encoding=CacheFileProperties.encoding,
-        )
-        or "{}"
-    )
+    if (cache := CacheManager.get_cache()) is not None:
+        return cache
+    file_stat, raw_cache = _read_cache_file()
     try:
+        if not isinstance(raw_cache, dict):
+            raise ValueError("Cache file is not a valid JSON object.")
         cache = CacheModel(**raw_cache)
-    except ValidationError:
+    except (ValidationError, ValueError):
         logger.debug(
             f"Cache found in '{app_locations.cache_path}' is either empty or invalid. "
             f"New cache will be created."
         )
         return _new_cache()
     else:
+        CacheManager.set_cache(cache, file_data=raw_cache, file_stat=file_stat)
         if (datetime.now() - cache.date).days > CacheFileProperties.expires_in_days:
             logger.debug(
                 f"Cache found in '{app_locations.cache_path}' is older than "
@@ -42,17 +276,20 @@ def get_cached_data() -> CacheModel:
 
 
 def update_cache(cache: CacheModel) -> None:
-    if not app_locations.cache_path.exists():
-        app_locations.cache_path.create(verbose=False)
+    # The cache file is not written here. All updates of a run are written
+    # once by CacheManager.flush, which is called with the global CLI result
+    # callbacks (also when Exit is raised) or at interpreter exit at the latest.
+    # Use flush_cache() if the cache file must be written right away.
     cache.date = datetime.now()
-    app_locations.cache_path.write_text(
-        cache.model_dump_json(indent=CacheFileProperties.indent),
-        encoding=CacheFileProperties.encoding,
-    )
+    CacheManager.add_update(cache)
+
+
+def flush_cache() -> None:
+    CacheManager.flush()
 
 
 def update_meta_cache(cache: CacheModel, /, **kwargs) -> None:
-    if cache.app_meta is MISSING:
+    if is_missing(cache.app_meta):
         app_meta_dump = kwargs
     else:
         app_meta_dump = {
@@ -0,0 +1,244 @@
+import atexit
+import re
+from datetime import datetime, timedelta
+from typing import Any, Optional
+
+from properpath import P
+from pydantic import ValidationError
+from pydantic.experimental.missing_sentinel import MISSING
+from pydantic_core import to_jsonable_python
+
+from ._cache import lock_file, write_file_atomically
+from ..kernel import (
+    CacheFileProperties,
+    CacheStoreEntryModel,
+    CacheStoreNamespaceModel,
+    CacheStoreProperties,
+    MissingType,
+    get_logger,
+    global_cli_result_callback,
+    is_missing,
+)
+from ..names import app_locations
+
+logger = get_logger()
+
+
+class CacheStore:
+    # A namespaced key-value cache (e.g., one namespace per plugin) stored in its
+    # own file in the cache directory. Entries expire individually, and the
+    # least recently used entries are evicted beyond max_entries (number of
+    # entries) or max_size_bytes (size of the entries as compact JSON). Changes
+    # are written once per run, merged with what other processes have written.
+    def __init__(
+        self,
+        namespace: str,
+        /,
+        *,
+        schema_version: int = CacheStoreProperties.default_schema_version,
+        max_entries: int = CacheStoreProperties.default_max_entries,
+        max_size_bytes: int = CacheStoreProperties.default_max_size_bytes,
+        ttl: Optional[timedelta] = None,
+    ) -> None:
+        if not re.match(CacheStoreProperties.namespace_pattern, namespace):
+            raise ValueError(
+                f"Cache store namespace '{namespace}' is not valid. Namespace must "
+                f"match the pattern '{CacheStoreProperties.namespace_pattern}'."
+            )
+        if max_entries < 1:
+            raise ValueError(
+                f"Cache store 'max_entries' must be at least 1, got {max_entries}."
+            )
+        if max_size_bytes < 1:
+            raise ValueError(
+                f"Cache store 'max_size_bytes' must be at least 1, "
+                f"got {max_size_bytes}."
+            )
+        self.namespace = namespace
+        # Bumping the schema version discards the entries stored with another version
+        self.schema_version = schema_version
+        self.max_entries = max_entries
+        self.max_size_bytes = max_size_bytes
+        self.ttl = ttl
+        self.path: P = (
+            app_locations.cache_path.parent
+            / CacheStoreProperties.dir_name
+            / f"{namespace}.json"
+        )
+        self._entries: Optional[dict[str, CacheStoreEntryModel]] = None
+        # Set (entry) or deleted (None) keys since the store was last written
+        self._changed_entries: dict[str, Optional[CacheStoreEntryModel]] = {}
+        self._accessed_entries: dict[str, datetime] = {}
+        self._is_cleared: bool = False
+        self._atexit_registered: bool = False
+
+    def __repr__(self) -> str:
+        return (
+            f"{self.__class__.__name__}({self.namespace!r}, "
+            f"schema_version={self.schema_version})"
+        )
+
+    def _read(self) -> dict[str, CacheStoreEntryModel]:
+        try:
+            content = self.path.read_text(encoding=CacheFileProperties.encoding)
+        except FileNotFoundError:
+            return {}
+        except OSError as e:
+            logger.debug(f"Cache store file '{self.path}' could not be read: {e}")
+            return {}
+        try:
+            namespace_model = CacheStoreNamespaceModel.model_validate_json(content)
+        except ValidationError:
+            logger.debug(
+                f"Cache store file '{self.path}' is invalid. "
+                f"Its entries will be discarded."
+            )
+            return {}
+        if namespace_model.schema_version != self.schema_version:
+            logger.debug(
+                f"Cache store '{self.namespace}' has schema version "
+                f"{namespace_model.schema_version}, but {self.schema_version} is "
+                f"expected. Its entries will be discarded."
+            )
+            return {}
+        return namespace_model.entries
+
+    def _get_entries(self) -> dict[str, CacheStoreEntryModel]:
+        if self._entries is None:
+            with lock_file(self.path):
+                self._entries = self._read()
+        return self._entries
+
+    def _get_live_entry(self, key: str) -> Optional[CacheStoreEntryModel]:
+        entry = self._get_entries().get(key)
+        if entry is None or (
+            entry.expires is not None and entry.expires <= datetime.now()
+        ):
+            return None
+        return entry
+
+    def _prune(
+        self, entries: dict[str, CacheStoreEntryModel]
+    ) -> dict[str, CacheStoreEntryModel]:
+        now = datetime.now()
+        entries = {
+            key: entry
+            for key, entry in entries.items()
+            if entry.expires is None or entry.expires > now
+        }
+        # Least recently used first
+        lru_entries = sorted(entries.items(), key=lambda item: item[1].last_accessed)
+        if len(lru_entries) > self.max_entries:
+            lru_entries = lru_entries[-self.max_entries :]
+        entry_sizes = [
+            len(key.encode()) + len(entry.model_dump_json().encode())
+            for key, entry in lru_entries
+        ]
+        size, evicted_count = sum(entry_sizes), 0
+        while size > self.max_size_bytes:
+            size -= entry_sizes[evicted_count]
+            evicted_count += 1
+        if evicted_count:
+            logger.debug(
+                f"{evicted_count} entries are evicted from cache store "
+                f"'{self.namespace}' to keep it under {self.max_size_bytes} bytes."
+            )
+        return dict(lru_entries[evicted_count:])
+
+    def _schedule_flush(self) -> None:
+        if self.flush not in global_cli_result_callback.get_callbacks():
+            global_cli_result_callback.add_callback(self.flush)
+        if not self._atexit_registered:
+            atexit.register(self.flush)
+            self._atexit_registered = True
+
+    def __contains__(self, key: str) -> bool:
+        return self._get_live_entry(key) is not None
+
+    def get(self, key: str, default: Any = None) -> Any:
+        if (entry := self._get_live_entry(key)) is None:
+            return default
+        now = datetime.now()
+        # Access times are only recorded (and written) at a coarse resolution,
+        # so read-mostly usage does not rewrite the store file on every run.
+        if (now - entry.last_accessed).total_seconds() >= (
+            CacheStoreProperties.access_time_resolution_seconds
+        ):
+            entry.last_accessed = now
+            self._accessed_entries[key] = now
+            self._schedule_flush()
+        return entry.value
+
+    def set(
+        self,
+        key: str,
+        value: Any,
+        /,
+        *,
+        ttl: Optional[timedelta] | MissingType = MISSING,
+    ) -> None:
+        # ttl=None stores the entry without an expiry even if the store has a ttl
+        if is_missing(ttl):
+            ttl = self.ttl
+        now = datetime.now()
+        entry = CacheStoreEntryModel(
+            # Same value as it will be read back from the store file
+            value=to_jsonable_python(value),
+            created=now,
+            last_accessed=now,
+            expires=None if ttl is None else now + ttl,
+        )
+        entries = self._get_entries()
+        entries[key] = entry
+        self._changed_entries[key] = entry
+        if len(entries) > self.max_entries:
+            self._entries = self._prune(entries)
+        self._schedule_flush()
+
+    def delete(self, key: str) -> None:
+        if self._get_entries().pop(key, None) is not None:
+            self._changed_entries[key] = None
+            self._schedule_flush()
+
+    def clear(self) -> None:
+        self._entries = {}
+        self._changed_entries.clear()
+        self._accessed_entries.clear()
+        self._is_cleared = True
+        self._schedule_flush()
+
+    def flush(self) -> None:
+        if not (self._changed_entries or self._accessed_entries or self._is_cleared):
+            return
+        with lock_file(self.path, exclusive=True):
+            # Only this store's changes are applied on top of the current file,
+            # so entries written by other processes in the meantime are kept.
+            entries = {} if self._is_cleared else self._read()
+            for key, entry in self._changed_entries.items():
+                if entry is None:
+                    entries.pop(key, None)
+                else:
+                    entries[key] = entry
+            for key, accessed in self._accessed_entries.items():
+                if (entry := entries.get(key)) is not None:
+                    entry.last_accessed = max(entry.last_accessed, accessed)
+            entries = self._prune(entries)
+            try:
+                write_file_atomically(
+                    self.path,
+                    CacheStoreNamespaceModel(
+                        namespace=self.namespace,
+                        schema_version=self.schema_version,
+                        entries=entries,
+                    ).model_dump_json(indent=CacheFileProperties.indent),
+                )
+            except OSError as e:
+                logger.warning(
+                    f"Cache store '{self.namespace}' could not be written to "
+                    f"'{self.path}'. Exception details: {e}"
+                )
+                return
+        self._entries = entries
+        self._changed_entries.clear()
+        self._accessed_entries.clear()
+        self._is_cleared = False
@@ -1,11 +1,32 @@
-from .base import stderr_console, stdout_console
-from .formats import BaseFormat, FormatError, _FormatterDeterminer, get_formatter
-from .highlight import color_text, make_noted_text, print_typer_error
-from .rich_utils import (
-    click_format_help_with_callback,
-    get_rich_inline_code_text,
-    rich_format_help_with_callback,
-    update_rich_click_cli_theme,
+from typing import TYPE_CHECKING
+
+from ..kernel import get_lazy_exports
+
+if TYPE_CHECKING:
+    from .base import stderr_console, stdout_console
+    from .formats import BaseFormat, FormatError, _FormatterDeterminer, get_formatter
+    from .highlight import color_text, make_noted_text, print_typer_error
+    from .rich_utils import (
+        click_format_help_with_callback,
+        get_rich_inline_code_text,
+        rich_format_help_with_callback,
+        update_rich_click_cli_theme,
+    )
+
+__getattr__, __dir__ = get_lazy_exports(
+    __name__,
+    globals(),
+    {
+        ".base": ("stderr_console", "stdout_console"),
+        ".formats": ("BaseFormat", "FormatError", "_FormatterDeterminer", "get_formatter"),
+        ".highlight": ("color_text", "make_noted_text", "print_typer_error"),
+        ".rich_utils": (
+            "click_format_help_with_callback",
+            "get_rich_inline_code_text",
+            "rich_format_help_with_callback",
+            "update_rich_click_cli_theme",
+        ),
+    },
 )
 
 __all__ = [
@@ -2,11 +2,9 @@ import json
 import re
 from abc import ABC, abstractmethod
 from collections.abc import Iterable
-from csv import DictWriter
 from io import StringIO
 from typing import Any, Optional, Self
 
-import yaml
 from pydantic import BaseModel
 
 from ..names import AppIdentity
@@ -122,6 +120,8 @@ class YAMLFormat(BaseFormat):
     identifier: str = AppIdentity.app_name
 
     def __call__(self, data: Any) -> str:
+        import yaml
+
         return yaml.dump(data, indent=2, allow_unicode=True, sort_keys=False)
 
 
@@ -132,6 +132,8 @@ class CSVFormat(BaseFormat):
     identifier: str = AppIdentity.app_name
 
     def __call__(self, data: Any) -> str:
+        from csv import DictWriter
+
         with StringIO() as csv_buffer:
             writer: DictWriter = DictWriter(csv_buffer, fieldnames=[])
             if isinstance(data, dict):
@@ -2,7 +2,6 @@ import click
 from colorama import Fore
 from rich.padding import Padding
 from rich.text import Text
-from typer.rich_utils import rich_format_error
 
 
 def make_noted_text(
@@ -19,6 +18,8 @@ def color_text(text: str, /, ansi_color: str) -> str:
 
 
 def print_typer_error(error_message: str) -> None:
+    from typer.rich_utils import rich_format_error
+
     exception = click.ClickException(error_message)
     exception.ctx = click.get_current_context()
     rich_format_error(exception)
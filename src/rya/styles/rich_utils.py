@@ -1,5 +1,5 @@
 import operator
-from typing import Callable, Iterable, Optional
+from typing import TYPE_CHECKING, Callable, Iterable, Optional
 
 import click
 import rich_click.rich_click as rc
@@ -7,10 +7,12 @@ from click import Context, HelpFormatter
 from pydantic import BaseModel
 from rich.text import Text
 from rich_click.rich_click_theme import RichClickThemeNotFound
-from typer.rich_utils import rich_format_help, MarkupModeStrict
 
 from ..kernel import get_logger
 
+if TYPE_CHECKING:
+    from typer.rich_utils import MarkupModeStrict
+
 logger = get_logger()
 
 
@@ -18,14 +20,22 @@ def rich_format_help_with_callback(
     *,
     obj: click.Command | click.Group,
     ctx: Context,
-    markup_mode: MarkupModeStrict,
+    markup_mode: "MarkupModeStrict",
     callback: Optional[Iterable[Callable]] = None,
     result_callback: Optional[Iterable[Callable]] = None,
+    original_rich_format_help: Optional[Callable] = None,
 ) -> None:
+    if original_rich_format_help is None:
+        # typer.rich_utils pulls in rich.markdown and markdown-it,
+        # so it is only imported when a help page is actually rendered.
+        from typer.rich_utils import rich_format_help
+
+        original_rich_format_help = rich_format_help
+
     if callback is not None:
         for func in callback:
             func()
-    rich_format_help(obj=obj, ctx=ctx, markup_mode=markup_mode)
+    original_rich_format_help(obj=obj, ctx=ctx, markup_mode=markup_mode)
     if result_callback is not None:
         for func in result_callback:
             func()
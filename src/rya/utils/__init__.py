@@ -1,23 +1,58 @@
-from ..pre_init import PatternNotFoundError, get_app_version
-from ..kernel import (
-    DataObjectList,
-    Missing,
-    detected_click_feedback,
-    generate_pydantic_model_from_abstract_cls,
-    get_dynaconf_core_loader,
-    get_local_imports,
-    global_cli_graceful_callback,
-    global_cli_result_callback,
-    global_cli_super_startup_callback,
-)
-from .messages import add_message, messages_list
-from .utils import (
-    PreventiveWarning,
-    PythonVersionCheckFailed,
-    check_reserved_keyword,
-    get_external_python_version,
-    get_sub_package_name,
-    update_kwargs_with_defaults,
+from typing import TYPE_CHECKING
+
+from ..kernel import get_lazy_exports
+
+if TYPE_CHECKING:
+    from ..pre_init import PatternNotFoundError, get_app_version
+    from ..kernel import (
+        DataObjectList,
+        Missing,
+        detected_click_feedback,
+        generate_pydantic_model_from_abstract_cls,
+        get_dynaconf_core_loader,
+        get_local_imports,
+        global_cli_graceful_callback,
+        global_cli_result_callback,
+        global_cli_super_startup_callback,
+    )
+    from .messages import add_message, messages_list
+    from .utils import (
+        PreventiveWarning,
+        PythonVersionCheckFailed,
+        check_reserved_keyword,
+        get_external_python_version,
+        get_python_version_index,
+        get_sub_package_name,
+        update_kwargs_with_defaults,
+    )
+
+__getattr__, __dir__ = get_lazy_exports(
+    __name__,
+    globals(),
+    {
+        "..pre_init": ("PatternNotFoundError", "get_app_version"),
+        "..kernel": (
+            "DataObjectList",
+            "Missing",
+            "detected_click_feedback",
+            "generate_pydantic_model_from_abstract_cls",
+            "get_dynaconf_core_loader",
+            "get_local_imports",
+            "global_cli_graceful_callback",
+            "global_cli_result_callback",
+            "global_cli_super_startup_callback",
+        ),
+        ".messages": ("add_message", "messages_list"),
+        ".utils": (
+            "PreventiveWarning",
+            "PythonVersionCheckFailed",
+            "check_reserved_keyword",
+            "get_external_python_version",
+            "get_python_version_index",
+            "get_sub_package_name",
+            "update_kwargs_with_defaults",
+        ),
+    },
 )
 
 __all__ = [
@@ -27,6 +62,7 @@ __all__ = [
     "PythonVersionCheckFailed",
     "check_reserved_keyword",
     "get_external_python_version",
+    "get_python_version_index",
     "get_sub_package_name",
     "update_kwargs_with_defaults",
     "get_app_version",
@@ -1,9 +1,20 @@
 import re
 import subprocess
 from pathlib import Path
-from typing import Tuple
+from typing import Optional, Tuple
 
-from ..kernel import Missing
+from pydantic.experimental.missing_sentinel import MISSING
+
+from ..kernel import (
+    Missing,
+    PythonVersionCacheModel,
+    get_path_fingerprint,
+    is_missing,
+)
+from ..pre_init import get_cached_data
+
+_cached_python_versions: Optional[dict[str, PythonVersionCacheModel]] = None
+_probed_python_versions: dict[str, PythonVersionCacheModel] = {}
 
 
 class PreventiveWarning(RuntimeWarning): ...
@@ -53,6 +64,25 @@ def _get_venv_relative_python_binary_path() -> Path:
     return Path("bin/python")
 
 
+def _get_cached_python_versions() -> dict[str, PythonVersionCacheModel]:
+    global _cached_python_versions
+    if _cached_python_versions is None:
+        cached_python_versions = getattr(
+            get_cached_data().app_meta, "external_python_versions", MISSING
+        )
+        if is_missing(cached_python_versions):
+            _cached_python_versions = {}
+        else:
+            _cached_python_versions = dict(cached_python_versions)
+    return _cached_python_versions
+
+
+def get_python_version_index() -> dict[str, PythonVersionCacheModel]:
+    # Only the interpreters probed in this run are returned,
+    # so entries for removed virtual environments are dropped from the cache.
+    return _probed_python_versions
+
+
 def get_external_python_version(venv_dir: Path) -> Tuple[str, str, str]:
     external_python_path: Path = (
         external_python_path_unresolved := (
@@ -64,6 +94,15 @@ def get_external_python_version(venv_dir: Path) -> Tuple[str, str, str]:
             f"Resolved Python binary path {external_python_path_unresolved} -> "
             f"{external_python_path} does not exist"
         )
+    python_path_key = str(external_python_path)
+    python_path_fingerprint = get_path_fingerprint(external_python_path)
+    cached_python_version = _get_cached_python_versions().get(python_path_key)
+    if (
+        cached_python_version is not None
+        and cached_python_version.fingerprint == python_path_fingerprint
+    ):
+        _probed_python_versions[python_path_key] = cached_python_version
+        return cached_python_version.version
     try:
         external_python_version_call = subprocess.run(
             [str(external_python_path), "--version"],
@@ -74,7 +113,7 @@ def get_external_python_version(venv_dir: Path) -> Tuple[str, str, str]:
         )
     except subprocess.CalledProcessError as e:
         raise PythonVersionCheckFailed(e) from e
-    except TimeoutError as e:
+    except subprocess.TimeoutExpired as e:
         raise PythonVersionCheckFailed(e) from e
     else:
         external_python_version_match = re.search(
@@ -84,6 +123,9 @@ def get_external_python_version(venv_dir: Path) -> Tuple[str, str, str]:
         )
         if external_python_version_match is not None:
             major, micro, patch = external_python_version_match.groups()
+            _probed_python_versions[python_path_key] = PythonVersionCacheModel(
+                fingerprint=python_path_fingerprint, version=(major, micro, patch)
+            )
             return major, micro, patch
         raise PythonVersionCheckFailed(
             "Matching Python version not found in output string"
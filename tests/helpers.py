@@ -0,0 +1,96 @@
+import tempfile
+import unittest
+from types import MappingProxyType
+from typing import Any
+
+from properpath import P
+
+from rya.config import AppConfig, ConfigMaker
+from rya.config._names import DynaConfArgs
+from rya.names import app_locations
+from rya.pre_init._cache import CacheManager
+
+_ABSENT = object()
+
+
+class TempCacheTestCase(unittest.TestCase):
+    # The cache file (and everything next to it) is written
+    # to a temporary directory, and the in-process cache is reset.
+    def setUp(self) -> None:
+        temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(temp_dir.cleanup)
+        self.temp_dir = P(temp_dir.name)
+        self.patch_attributes(
+            app_locations, cache_path=self.temp_dir / "cache" / "cache.json"
+        )
+        self.patch_attributes(
+            CacheManager,
+            _cache=None,
+            _cache_file_stat=None,
+            _has_pending_update=False,
+            _file_data=None,
+            _file_date=None,
+        )
+
+    def patch_attributes(self, obj: Any, /, **attributes: Any) -> None:
+        # Attributes set to _ABSENT are removed for the duration of the test
+        for name, value in attributes.items():
+            if isinstance(obj, type):
+                # Only the class' own attributes are restored, not inherited ones
+                original = vars(obj).get(name, _ABSENT)
+            else:
+                original = getattr(obj, name, _ABSENT)
+            if value is _ABSENT:
+                if original is not _ABSENT:
+                    delattr(obj, name)
+            else:
+                setattr(obj, name, value)
+            self.addCleanup(self._restore_attribute, obj, name, original)
+
+    @staticmethod
+    def _restore_attribute(obj: Any, name: str, original: Any) -> None:
+        if original is _ABSENT:
+            if name in vars(obj):
+                delattr(obj, name)
+        else:
+            setattr(obj, name, original)
+
+    def write_file(self, name: str, content: str) -> P:
+        path = self.temp_dir / name
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(content, encoding="utf-8")
+        return path
+
+
+class ConfigTestCase(TempCacheTestCase):
+    # Registered configuration models and validation state are isolated per test
+    def setUp(self) -> None:
+        super().setUp()
+        flattened_schema: dict = {}
+        self.patch_attributes(
+            ConfigMaker,
+            _main_config_model={},
+            _plugins_config_model={},
+            _main_flattened_schema={},
+            _plugins_flattened_schema={},
+            _flattened_schema=flattened_schema,
+            _flattened_schema_view=MappingProxyType(flattened_schema),
+            _flattened_schema_index=None,
+        )
+        self.patch_attributes(
+            AppConfig,
+            _dynaconf_settings=_ABSENT,
+            dynaconf_args=DynaConfArgs(
+                root_path=str(self.temp_dir), settings_files=["settings.toml"]
+            ),
+            exceptions=[],
+            _session_key=None,
+            _session_main_model=None,
+            _session_plugin_models={},
+            _model_classes={},
+            _settings_data=None,
+            use_settings_snapshot=False,
+        )
+
+    def write_settings(self, content: str) -> P:
+        return self.write_file("settings.toml", content)
@@ -0,0 +1,61 @@
+import importlib.util
+import sys
+import textwrap
+import tomllib
+import unittest
+from pathlib import Path
+
+_STARTUP_BENCHMARK_FILE = Path(__file__).parents[1] / "benchmarks" / "startup.py"
+
+
+def _load_startup_benchmark():
+    # The benchmarks are scripts, not an importable package
+    spec = importlib.util.spec_from_file_location(
+        "rya_startup_benchmark", _STARTUP_BENCHMARK_FILE
+    )
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[spec.name] = module
+    try:
+        spec.loader.exec_module(module)
+    finally:
+        del sys.modules[spec.name]
+    return module
+
+
+startup = _load_startup_benchmark()
+
+
+class StartupBenchmarkTestCase(unittest.TestCase):
+    def test_only_top_level_imports_are_summed(self) -> None:
+        stderr = textwrap.dedent(
+            """\
+            import time: self [us] | cumulative | imported package
+            import time:       100 |        100 |   _nested
+            import time:       200 |        300 | rya.kernel
+            import time:        50 |         50 |     _deeply_nested
+            import time:       400 |        700 | rya.names
+            unrelated output
+            """
+        )
+        self.assertEqual(startup._parse_importtime_ms(stderr), 1.0)
+        self.assertEqual(startup._parse_importtime_ms(""), 0)
+
+    def test_every_benchmark_has_a_budget(self) -> None:
+        with startup.DEFAULT_BUDGETS_FILE.open("rb") as f:
+            budgets = tomllib.load(f)
+        self.assertEqual(set(budgets["layers"]), set(startup.LAYERS))
+        self.assertEqual(
+            set(budgets["commands"]),
+            {f"plugins_{count}" for count in startup.PLUGIN_COUNTS},
+        )
+        for command_budgets in budgets["commands"].values():
+            self.assertEqual(
+                set(command_budgets),
+                {" ".join(command) for command in startup.COMMANDS},
+            )
+
+    def test_only_warm_time_is_checked_against_budget(self) -> None:
+        Measurement = startup.Measurement
+        self.assertTrue(Measurement("import", "rya.cli", 5, 11, 10).over_budget)
+        self.assertFalse(Measurement("import", "rya.cli", 50, 10, 10).over_budget)
+        self.assertFalse(Measurement("import", "rya.cli", 50, 50, None).over_budget)
@@ -0,0 +1,168 @@
+import json
+import os
+import stat
+import unittest
+from datetime import datetime, timedelta
+from unittest import mock
+
+from rya.kernel import CacheFileProperties, Exit, global_cli_result_callback
+from rya.names import CacheModel, app_locations
+from rya.pre_init import _cache, flush_cache, get_cached_data, update_cache
+from rya.pre_init._cache import CacheManager, lock_file, write_file_atomically
+
+from helpers import TempCacheTestCase
+
+
+class CacheManagerTestCase(TempCacheTestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        # Pending updates must not be written at interpreter exit,
+        # after the temporary cache directory is removed.
+        self.patch_attributes(CacheManager, _atexit_registered=True)
+        self.addCleanup(self._remove_flush_callback)
+
+    @staticmethod
+    def _remove_flush_callback() -> None:
+        if CacheManager.flush in global_cli_result_callback.get_callbacks():
+            global_cli_result_callback.remove_callback(CacheManager.flush)
+
+    def test_updates_are_written_once_on_flush(self) -> None:
+        with mock.patch.object(
+            _cache, "write_file_atomically", wraps=write_file_atomically
+        ) as write:
+            update_cache(CacheModel())
+            update_cache(CacheModel())
+            self.assertFalse(app_locations.cache_path.exists())
+            flush_cache()
+            write.assert_called_once()
+            self.assertIn("date", json.loads(app_locations.cache_path.read_text()))
+            # Nothing is pending anymore, and unchanged data is not written again
+            flush_cache()
+            update_cache(CacheModel())
+            flush_cache()
+            write.assert_called_once()
+
+    def test_exit_flushes_pending_update(self) -> None:
+        update_cache(CacheModel())
+        self.assertIn(CacheManager.flush, global_cli_result_callback.get_callbacks())
+        with (
+            self.assertRaises(SystemExit),
+            mock.patch.object(Exit, "SYSTEM_EXIT", True),
+        ):
+            raise Exit(1)
+        self.assertTrue(app_locations.cache_path.exists())
+        self.assertFalse(CacheManager._has_pending_update)
+
+
+class CachedDataTestCase(TempCacheTestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        self.patch_attributes(CacheManager, _atexit_registered=True)
+        self.addCleanup(CacheManagerTestCase._remove_flush_callback)
+        self.write_cache(datetime.now() - timedelta(hours=1))
+
+    @staticmethod
+    def write_cache(date: datetime) -> None:
+        app_locations.cache_path.parent.mkdir(parents=True, exist_ok=True)
+        app_locations.cache_path.write_text(json.dumps({"date": date.isoformat()}))
+
+    def test_cache_file_is_read_once(self) -> None:
+        with mock.patch.object(
+            _cache, "_read_cache_file", wraps=_cache._read_cache_file
+        ) as read_cache_file:
+            cache = get_cached_data()
+            self.assertIs(get_cached_data(), cache)
+        read_cache_file.assert_called_once()
+
+    def test_cache_file_changed_on_disk_is_read_again(self) -> None:
+        cache = get_cached_data()
+        new_date = datetime.now() - timedelta(minutes=1)
+        self.write_cache(new_date)
+        # The modification time alone tells that the file has changed
+        file_stat = os.stat(app_locations.cache_path)
+        os.utime(
+            app_locations.cache_path,
+            ns=(file_stat.st_atime_ns, file_stat.st_mtime_ns + 10**9),
+        )
+        new_cache = get_cached_data()
+        self.assertIsNot(new_cache, cache)
+        self.assertEqual(new_cache.date, new_date)
+        self.assertIs(get_cached_data(), new_cache)
+
+    def test_pending_update_is_returned_until_flushed(self) -> None:
+        cache = get_cached_data()
+        update_cache(cache)
+        new_date = datetime.now()
+        self.write_cache(new_date)
+        self.assertIs(get_cached_data(), cache)
+        # Another process has written the same data, which is read after the flush
+        flush_cache()
+        self.assertEqual(get_cached_data().date, new_date)
+
+
+@unittest.skipUnless(os.name == "posix", "File modes are only meaningful on POSIX")
+class WriteFileAtomicallyTestCase(TempCacheTestCase):
+    def get_mode(self, path) -> int:
+        return stat.S_IMODE(os.stat(path).st_mode)
+
+    def test_new_file_mode_follows_umask(self) -> None:
+        path = self.temp_dir / "new.json"
+        umask = os.umask(0o027)
+        try:
+            write_file_atomically(path, "{}")
+        finally:
+            os.umask(umask)
+        self.assertEqual(path.read_text(), "{}")
+        self.assertEqual(self.get_mode(path), 0o640)
+
+    def test_existing_file_mode_is_kept(self) -> None:
+        path = self.write_file("existing.json", "")
+        os.chmod(path, 0o604)
+        write_file_atomically(path, "{}")
+        self.assertEqual(path.read_text(), "{}")
+        self.assertEqual(self.get_mode(path), 0o604)
+        self.assertEqual(list(self.temp_dir.iterdir()), [path])
+
+
+
+@unittest.skipUnless(os.name == "posix", "Cache files are only locked on POSIX")
+class LockFileTestCase(TempCacheTestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        self.path = self.temp_dir / "cache.json"
+        self.lock_path = self.temp_dir / (
+            f"cache.json{CacheFileProperties.lock_file_suffix}"
+        )
+        self.patch_attributes(CacheFileProperties, lock_timeout_seconds=0.01)
+
+    def hold_lock(self, exclusive: bool) -> None:
+        import fcntl
+
+        # flock locks belong to the open file description,
+        # so a second descriptor conflicts even in the same process.
+        fd = os.open(self.lock_path, os.O_RDWR | os.O_CREAT)
+        self.addCleanup(os.close, fd)
+        fcntl.flock(fd, fcntl.LOCK_EX if exclusive else fcntl.LOCK_SH)
+
+    def test_lock_uses_sidecar_file_that_is_kept(self) -> None:
+        with lock_file(self.path, exclusive=True) as locked:
+            self.assertTrue(locked)
+            self.assertTrue(self.lock_path.exists())
+        self.assertTrue(self.lock_path.exists())
+        self.assertFalse(self.path.exists())
+
+    def test_shared_locks_do_not_block_each_other(self) -> None:
+        self.hold_lock(exclusive=False)
+        with lock_file(self.path) as locked:
+            self.assertTrue(locked)
+
+    def test_lock_times_out_without_raising(self) -> None:
+        self.hold_lock(exclusive=True)
+        with lock_file(self.path) as locked:
+            self.assertFalse(locked)
+        with lock_file(self.path, exclusive=True) as locked:
+            self.assertFalse(locked)
+
+
+if __name__ == "__main__":
+    unittest.main()
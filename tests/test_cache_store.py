@@ -0,0 +1,126 @@
+import tempfile
+import unittest
+from datetime import timedelta
+from unittest import mock
+
+from properpath import P
+
+from rya.kernel import CacheStoreNamespaceModel, CacheStoreProperties
+from rya.names import app_locations
+from rya.pre_init import CacheStore
+
+
+class CacheStoreTestCase(unittest.TestCase):
+    def setUp(self) -> None:
+        temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(temp_dir.cleanup)
+        cache_path_patch = mock.patch.object(
+            app_locations, "cache_path", P(temp_dir.name) / "cache.json"
+        )
+        cache_path_patch.start()
+        self.addCleanup(cache_path_patch.stop)
+
+    def get_store(self, **kwargs) -> CacheStore:
+        store = CacheStore("test-namespace", **kwargs)
+        # Pending changes must not be written at interpreter exit,
+        # after the temporary cache directory is removed.
+        self.addCleanup(store.flush)
+        return store
+
+    def test_get_set_delete(self) -> None:
+        store = self.get_store()
+        store.set("key", {"value": [1, 2]})
+        self.assertIn("key", store)
+        self.assertEqual(store.get("key"), {"value": [1, 2]})
+        store.delete("key")
+        self.assertNotIn("key", store)
+        self.assertEqual(store.get("key", "default"), "default")
+
+    def test_flush_persists_entries(self) -> None:
+        store = self.get_store()
+        store.set("key", "value")
+        store.flush()
+        self.assertEqual(self.get_store().get("key"), "value")
+
+    def test_expired_entries_are_not_returned_or_written(self) -> None:
+        store = self.get_store(ttl=timedelta(0))
+        store.set("expired", "value")
+        store.set("kept", "value", ttl=None)
+        self.assertNotIn("expired", store)
+        self.assertIsNone(store.get("expired"))
+        store.flush()
+        entries = CacheStoreNamespaceModel.model_validate_json(
+            store.path.read_text()
+        ).entries
+        self.assertEqual(list(entries), ["kept"])
+
+    def test_least_recently_used_entries_are_evicted_beyond_max_entries(self) -> None:
+        with mock.patch.object(
+            CacheStoreProperties, "access_time_resolution_seconds", 0
+        ):
+            store = self.get_store(max_entries=2)
+            store.set("first", 1)
+            store.set("second", 2)
+            store.get("first")
+            store.set("third", 3)
+        self.assertNotIn("second", store)
+        self.assertEqual(store.get("first"), 1)
+        self.assertEqual(store.get("third"), 3)
+
+    def test_least_recently_used_entries_are_evicted_beyond_max_size_bytes(
+        self,
+    ) -> None:
+        store = self.get_store()
+        store.set("first", "x" * 100)
+        store.set("second", "x" * 100)
+        entry_size = len(store._get_entries()["second"].model_dump_json()) + len(
+            "second"
+        )
+        store.max_size_bytes = entry_size
+        store.flush()
+        reloaded_store = self.get_store()
+        self.assertNotIn("first", reloaded_store)
+        self.assertEqual(reloaded_store.get("second"), "x" * 100)
+
+    def test_schema_version_bump_discards_entries(self) -> None:
+        store = self.get_store(schema_version=1)
+        store.set("key", "value")
+        store.flush()
+        self.assertEqual(self.get_store(schema_version=1).get("key"), "value")
+        bumped_store = self.get_store(schema_version=2)
+        self.assertNotIn("key", bumped_store)
+        bumped_store.set("other_key", "value")
+        bumped_store.flush()
+        self.assertEqual(
+            CacheStoreNamespaceModel.model_validate_json(
+                bumped_store.path.read_text()
+            ).schema_version,
+            2,
+        )
+
+    def test_concurrent_flushes_are_merged(self) -> None:
+        store = self.get_store()
+        other_store = self.get_store()
+        # Both stores have read the (empty) store file before either is written
+        self.assertNotIn("key", store)
+        self.assertNotIn("other_key", other_store)
+        store.set("key", "value")
+        other_store.set("other_key", "other_value")
+        store.flush()
+        other_store.flush()
+        reloaded_store = self.get_store()
+        self.assertEqual(reloaded_store.get("key"), "value")
+        self.assertEqual(reloaded_store.get("other_key"), "other_value")
+
+    def test_clear_discards_entries_of_other_processes(self) -> None:
+        store = self.get_store()
+        other_store = self.get_store()
+        store.set("key", "value")
+        store.flush()
+        other_store.clear()
+        other_store.flush()
+        self.assertNotIn("key", self.get_store())
+
+
+if __name__ == "__main__":
+    unittest.main()
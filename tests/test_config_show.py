@@ -0,0 +1,196 @@
+import json
+from unittest import mock
+
+from pydantic import BaseModel, Secret
+from typer.testing import CliRunner
+
+from rya.config import ConfigMaker
+from rya.plugins.config import _parse_schema
+from rya.plugins.config._parse_schema import (
+    compile_conf_display_columns,
+    compile_conf_display_filter,
+)
+from rya.plugins.config.cli import app
+from rya.plugins.config.exceptions import UnknownConfigDisplayFilterError
+from rya.plugins.config.models import (
+    ConfigDisplayFilters,
+    ConfigDisplayIncludes,
+    ConfigDisplayValues,
+)
+
+from helpers import ConfigTestCase
+
+
+class MainModel(BaseModel):
+    name: str = "default"
+    speed: int = 5
+
+
+class ConfigShowTestCase(ConfigTestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        ConfigMaker.add_model(MainModel)
+        self.settings_file = self.write_settings('name = "x"\n')
+
+    def invoke(self, *args: str):
+        return CliRunner().invoke(app, ["show", *args], catch_exceptions=False)
+
+    def test_table_is_printed_when_output_is_not_a_terminal(self) -> None:
+        result = self.invoke()
+        self.assertEqual(result.exit_code, 0)
+        self.assertIn("Field name", result.stdout)
+        self.assertIn("Unique Configuration Files", result.stdout)
+        self.assertEqual(result.stderr, "")
+
+    def test_stream_prints_json_lines(self) -> None:
+        result = self.invoke("--stream")
+        self.assertEqual(result.exit_code, 0)
+        self.assertEqual(
+            [json.loads(line) for line in result.stdout.splitlines()],
+            [
+                {"key": "name", "value": "x", "description": None, "unit": None},
+                {"key": "speed", "value": "5", "description": None, "unit": None},
+            ],
+        )
+        self.assertIn(str(self.settings_file), result.stderr)
+
+    def test_stream_without_results_fails(self) -> None:
+        result = self.invoke("--stream", "--filter", "secret")
+        self.assertEqual(result.exit_code, 1)
+        self.assertEqual(result.stdout, "")
+
+
+class FilteredModel(BaseModel):
+    name: str = "default"
+    speed: int = 5
+    password: Secret[str] = Secret("hidden")
+    home: str = "default"
+
+
+class ConfigShowFilterTestCase(ConfigTestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        ConfigMaker.add_model(FilteredModel)
+        self.write_settings(
+            'name = "x"\nspeed = 5\npassword = "secret"\n'
+            'home = "@format {env[HOME]}/path"\n'
+        )
+
+    def get_keys(self, *args: str) -> list[str]:
+        result = CliRunner().invoke(
+            app, ["show", "--stream", *args], catch_exceptions=False
+        )
+        return [json.loads(line)["key"] for line in result.stdout.splitlines()]
+
+    def test_filters_are_applied_with_and_relationship(self) -> None:
+        self.assertEqual(self.get_keys(), ["name", "speed", "password", "home"])
+        self.assertEqual(
+            self.get_keys("--filter", "nondef"), ["name", "password", "home"]
+        )
+        self.assertEqual(self.get_keys("--filter", "secret"), ["password"])
+        self.assertEqual(self.get_keys("--filter", "env"), ["home"])
+        self.assertEqual(self.get_keys("--filter", "nondef env"), ["home"])
+        self.assertEqual(self.get_keys("--filter", "secret env"), [])
+
+    def test_cheaper_predicates_are_evaluated_first(self) -> None:
+        with mock.patch.object(
+            _parse_schema, "_passes_env_filter", return_value=True
+        ) as passes_env_filter:
+            can_pass_filter = compile_conf_display_filter(
+                ConfigDisplayFilters(nondef=True, env=True)
+            )
+        field_info = FilteredModel.model_fields["name"]
+        self.assertFalse(
+            can_pass_filter(
+                None,
+                field_name="name",
+                field_value="default",
+                field_info=field_info,
+                config_description=None,
+            )
+        )
+        passes_env_filter.assert_not_called()
+        self.assertTrue(
+            can_pass_filter(
+                None,
+                field_name="name",
+                field_value="x",
+                field_info=field_info,
+                config_description=None,
+            )
+        )
+        passes_env_filter.assert_called_once()
+
+    def test_unknown_filter_instance_is_rejected(self) -> None:
+        with self.assertRaises(UnknownConfigDisplayFilterError):
+            compile_conf_display_filter(ConfigDisplayIncludes())
+
+    def test_columns(self) -> None:
+        values = ConfigDisplayValues(
+            key="speed", value=5, description="Speed", unit="m/s", location="here"
+        )
+        column_names, project_row = compile_conf_display_columns(
+            ConfigDisplayIncludes()
+        )
+        self.assertEqual(column_names, ("Field name", "Value"))
+        self.assertEqual(project_row(values), ("[green]speed[/green]", "5"))
+        column_names, project_row = compile_conf_display_columns(
+            ConfigDisplayIncludes(desc=True, loc=True, unit=True)
+        )
+        self.assertEqual(
+            column_names, ("Field name", "Description", "Location", "Value")
+        )
+        self.assertEqual(
+            project_row(values),
+            ("[green]speed[/green]", "Speed", "here", "5 \\[m/s]"),
+        )
+
+
+class ConfigShowFormatTestCase(ConfigTestCase):
+    expected_values = [
+        {"key": "name", "value": "x", "description": None, "unit": None},
+        {"key": "speed", "value": "5", "description": None, "unit": None},
+    ]
+
+    def setUp(self) -> None:
+        super().setUp()
+        ConfigMaker.add_model(MainModel)
+        self.settings_file = self.write_settings('name = "x"\n')
+
+    def invoke(self, *args: str):
+        return CliRunner().invoke(app, ["show", *args], catch_exceptions=False)
+
+    def test_json_format(self) -> None:
+        result = self.invoke("--format", "json")
+        self.assertEqual(result.exit_code, 0)
+        self.assertEqual(json.loads(result.stdout), self.expected_values)
+        # The summary does not mix with the formatted output
+        self.assertIn(str(self.settings_file), result.stderr)
+
+    def test_csv_format_with_included_columns(self) -> None:
+        result = self.invoke("--format", "csv", "--include", "loc")
+        self.assertEqual(result.exit_code, 0)
+        self.assertEqual(
+            result.stdout.splitlines(),
+            [
+                "key,value,location",
+                f"name,x,{self.settings_file}",
+                "speed,5,LOCATION NOT FOUND",
+            ],
+        )
+
+    def test_export_writes_formatted_file(self) -> None:
+        export_dir = self.temp_dir / "export"
+        export_dir.mkdir()
+        result = self.invoke("--format", "json", "--export", str(export_dir))
+        self.assertEqual(result.exit_code, 0)
+        (exported_file,) = export_dir.iterdir()
+        self.assertTrue(exported_file.name.endswith("_config.json"))
+        self.assertEqual(json.loads(exported_file.read_text()), self.expected_values)
+
+    def test_invalid_options(self) -> None:
+        for args in (("--format", "unknown"), ("--export", str(self.temp_dir))):
+            with self.subTest(args=args):
+                result = self.invoke(*args)
+                self.assertEqual(result.exit_code, 1)
+                self.assertEqual(result.stdout, "")
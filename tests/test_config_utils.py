@@ -0,0 +1,99 @@
+import textwrap
+
+from rya.config import get_dynaconf_settings
+from rya.config._names import DynaConfArgs
+from rya.plugins.config.utils import (
+    DynaconfSettingsHistoryIndex,
+    _is_value_from_dynaconf_env,
+    get_dynaconf_settings_history,
+)
+
+from helpers import TempCacheTestCase
+
+
+class DynaconfSettingsHistoryIndexTestCase(TempCacheTestCase):
+    field_names = (
+        "name",
+        "NAME",
+        "formatted",
+        "nested",
+        "nested.value",
+        "Nested.Kept",
+        "nested.inner",
+        "nested.inner.deep",
+        "runtime",
+        "absent",
+        "nested.absent",
+    )
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.write_file(
+            "first.toml",
+            textwrap.dedent(
+                """\
+                name = "first"
+                formatted = "@format {env[HOME]}/path"
+
+                [nested]
+                value = 1
+                kept = "first"
+
+                [nested.inner]
+                deep = true
+                """
+            ),
+        )
+        self.write_file("second.toml", 'name = "second"\n[nested]\nvalue = 2\n')
+        self.settings = get_dynaconf_settings(
+            DynaConfArgs(
+                root_path=str(self.temp_dir),
+                settings_files=["first.toml", "second.toml"],
+            )
+        )
+        self.settings.reload()
+        # Set without being loaded from a file
+        self.settings.set("runtime", 5)
+
+    def get_last_history_entry(self, field_name: str):
+        history = get_dynaconf_settings_history(
+            self.settings, field_name=field_name, default=None
+        )
+        return history[-1] if history else None
+
+    def test_entries_match_last_history_entries(self) -> None:
+        history_index = DynaconfSettingsHistoryIndex(self.settings)
+        for field_name in self.field_names:
+            with self.subTest(field_name=field_name):
+                self.assertEqual(
+                    history_index.get_last_entry(field_name, default=None),
+                    self.get_last_history_entry(field_name),
+                )
+
+    def test_entries_of_overridden_and_lazy_values(self) -> None:
+        history_index = DynaconfSettingsHistoryIndex(self.settings)
+        self.assertEqual(
+            history_index.get_last_entry("nested.kept", default=None)["identifier"],
+            str(self.temp_dir / "second.toml"),
+        )
+        self.assertEqual(
+            history_index.get_last_entry("formatted", default=None)["value"],
+            "@format {env[HOME]}/path",
+        )
+        self.assertEqual(history_index.get_last_entry("absent", default=[]), [])
+
+    def test_env_detection_is_the_same_with_and_without_index(self) -> None:
+        history_index = DynaconfSettingsHistoryIndex(self.settings)
+        for field_name in self.field_names:
+            with self.subTest(field_name=field_name):
+                self.assertEqual(
+                    _is_value_from_dynaconf_env(
+                        self.settings, field_name, history_index=history_index
+                    ),
+                    _is_value_from_dynaconf_env(self.settings, field_name),
+                )
+        self.assertTrue(
+            _is_value_from_dynaconf_env(
+                self.settings, "formatted", history_index=history_index
+            )
+        )
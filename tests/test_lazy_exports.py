@@ -0,0 +1,85 @@
+import importlib
+import sys
+import textwrap
+import unittest
+
+from rya.kernel import get_lazy_exports
+
+from helpers import TempCacheTestCase
+
+
+class GetLazyExportsTestCase(TempCacheTestCase):
+    package_name = "rya_test_lazy_package"
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.write_file(
+            f"{self.package_name}/__init__.py",
+            textwrap.dedent(
+                """\
+                from rya.kernel import get_lazy_exports
+
+                EAGER = "eager"
+
+                __getattr__, __dir__ = get_lazy_exports(
+                    __name__, globals(), {"._heavy": ("VALUE", "function")}
+                )
+                """
+            ),
+        )
+        self.write_file(
+            f"{self.package_name}/_heavy.py",
+            "VALUE = 'lazy'\n\n\ndef function():\n    return VALUE\n",
+        )
+        sys.path.insert(0, str(self.temp_dir))
+        self.addCleanup(sys.path.remove, str(self.temp_dir))
+        for module_name in (self.package_name, f"{self.package_name}._heavy"):
+            self.addCleanup(sys.modules.pop, module_name, None)
+
+    def test_module_is_imported_on_first_access(self) -> None:
+        package = importlib.import_module(self.package_name)
+        self.assertNotIn(f"{self.package_name}._heavy", sys.modules)
+        self.assertEqual(package.VALUE, "lazy")
+        self.assertIn(f"{self.package_name}._heavy", sys.modules)
+        # The value is bound in the package, so __getattr__ is not used again
+        self.assertEqual(vars(package)["VALUE"], "lazy")
+        self.assertEqual(package.function(), "lazy")
+
+    def test_dir_lists_exports_before_they_are_imported(self) -> None:
+        package = importlib.import_module(self.package_name)
+        self.assertLessEqual({"EAGER", "VALUE", "function"}, set(dir(package)))
+        self.assertNotIn(f"{self.package_name}._heavy", sys.modules)
+
+    def test_unknown_name_raises_attribute_error(self) -> None:
+        package = importlib.import_module(self.package_name)
+        with self.assertRaisesRegex(
+            AttributeError, f"module '{self.package_name}' has no attribute 'missing'"
+        ):
+            getattr(package, "missing")
+        self.assertFalse(hasattr(package, "missing"))
+
+
+class PackageExportsTestCase(unittest.TestCase):
+    def test_all_names_of_lazy_packages_can_be_imported(self) -> None:
+        for package_name in (
+            "rya.cli",
+            "rya.config",
+            "rya.kernel",
+            "rya.loggers",
+            "rya.plugins.commons",
+            "rya.pre_init",
+            "rya.styles",
+            "rya.utils",
+        ):
+            package = importlib.import_module(package_name)
+            for name in package.__all__:
+                with self.subTest(package=package_name, name=name):
+                    self.assertIsNotNone(getattr(package, name, None))
+
+    def test_get_lazy_exports_returns_module_hooks(self) -> None:
+        globals_: dict = {"__name__": "package"}
+        getattr_, dir_ = get_lazy_exports(
+            "json", globals_, {".decoder": ("JSONDecodeError",)}
+        )
+        self.assertEqual(dir_(), ["JSONDecodeError", "__name__"])
+        self.assertIs(getattr_("JSONDecodeError"), globals_["JSONDecodeError"])
@@ -0,0 +1,196 @@
+import sys
+import textwrap
+from functools import partial
+from unittest import mock
+
+import typer
+from typer.testing import CliRunner
+
+from rya.cli import _plugin_handler, _venv_state_manager
+from rya.cli._lazy_group import LazyTyperGroup
+from rya.cli._plugin_handler import (
+    ExternalPluginHandler,
+    PluginInfo,
+    PluginLoaderEnvVars,
+    ext_plugin_def,
+    int_plugin_def,
+)
+from rya.cli._plugin_loader import PluginLoader, disable_plugin
+from rya.config import ConfigMaker
+from rya.plugins.commons import Typer
+
+from helpers import TempCacheTestCase
+
+
+class LazyPluginDispatchTestCase(TempCacheTestCase):
+    plugin_name = "VenvPlugin"
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.patch_attributes(LazyTyperGroup, _lazy_loaders={})
+        self.patch_attributes(ConfigMaker, _deferred_model_loaders={})
+        self.patch_attributes(
+            PluginLoader, loaded_internal_plugins={}, loaded_external_plugins={}
+        )
+        self.patch_attributes(
+            _venv_state_manager,
+            _cached_site_packages_dirs=None,
+            _site_packages_dirs={},
+        )
+        self.write_file("venv/pyvenv.cfg", "version = 3.12.0\n")
+        self.write_file(
+            "venv/lib/python3.12/site-packages/rya_test_venv_dependency.py",
+            "VALUE = 'from venv'\n",
+        )
+        self.addCleanup(sys.modules.pop, "rya_test_venv_dependency", None)
+        self.addCleanup(sys.modules.pop, self.plugin_name, None)
+        cli_script = self.write_file(
+            f"project/{self.plugin_name}.py",
+            textwrap.dedent(
+                """
+                import typer
+                from rya_test_venv_dependency import VALUE
+
+                app = typer.Typer()
+
+
+                @app.command()
+                def greet():
+                    print(VALUE)
+
+
+                @app.command()
+                def bye():
+                    print("bye")
+                """
+            ),
+        )
+        self.lazy_loader = mock.Mock(
+            wraps=partial(
+                ExternalPluginHandler.load_typer_app,
+                self.plugin_name,
+                cli_script,
+                self.temp_dir / "project",
+                self.temp_dir / "venv",
+            )
+        )
+        self.typer_app = Typer(name="main")
+        self.assertTrue(LazyTyperGroup.enable_for(self.typer_app))
+        self.sys_path = list(sys.path)
+        PluginLoader(
+            typer_app=self.typer_app,
+            internal_plugins_panel_name=None,
+            external_plugins_panel_name=None,
+        )._add_lazy_external_plugin(
+            PluginInfo(
+                typer.Typer(name=self.plugin_name, help="Indexed plugin help"),
+                self.temp_dir / "project",
+                self.temp_dir / "venv",
+                self.temp_dir / "project",
+                self.lazy_loader,
+            ),
+            callback=None,
+            result_callback=None,
+        )
+
+    def invoke(self, *args: str):
+        return CliRunner().invoke(self.typer_app, list(args), catch_exceptions=False)
+
+    def test_help_lists_placeholder_without_loading_plugin(self) -> None:
+        result = self.invoke("--help")
+        self.assertEqual(result.exit_code, 0)
+        self.assertIn(self.plugin_name, result.output)
+        self.assertIn("Indexed plugin help", result.output)
+        self.lazy_loader.assert_not_called()
+        self.assertTrue(LazyTyperGroup.is_lazy_command(self.plugin_name))
+
+    def test_site_packages_index_has_venv_of_undispatched_plugin(self) -> None:
+        self.assertEqual(
+            _venv_state_manager.get_site_packages_index(),
+            {
+                str(self.temp_dir / "venv"): (
+                    self.temp_dir / "venv" / "lib" / "python3.12" / "site-packages"
+                )
+            },
+        )
+        self.lazy_loader.assert_not_called()
+
+    def test_dispatch_loads_plugin_from_its_venv(self) -> None:
+        result = self.invoke(self.plugin_name, "greet")
+        self.assertEqual(result.exit_code, 0)
+        self.assertEqual(result.output.strip(), "from venv")
+        self.lazy_loader.assert_called_once_with()
+        self.assertEqual(sys.path, self.sys_path)
+        self.assertFalse(LazyTyperGroup.is_lazy_command(self.plugin_name))
+        self.assertIn(self.plugin_name.lower(), PluginLoader.loaded_external_plugins)
+
+    def test_lazy_commands_are_looked_up_case_insensitively(self) -> None:
+        self.assertTrue(LazyTyperGroup.is_lazy_command(self.plugin_name.upper()))
+        self.assertIn(self.plugin_name.lower(), LazyTyperGroup._lazy_loaders)
+        disable_plugin(
+            self.typer_app,
+            plugin_name=self.plugin_name.lower(),
+            err_msg="Disabled for testing.",
+            panel_name=None,
+        )
+        self.assertFalse(LazyTyperGroup.is_lazy_command(self.plugin_name))
+        self.assertNotIn(self.plugin_name.lower(), ConfigMaker._deferred_model_loaders)
+
+    def test_deferred_models_and_dispatch_import_plugin_once(self) -> None:
+        ConfigMaker.load_deferred_models()
+        self.lazy_loader.assert_called_once_with()
+        self.assertEqual(ConfigMaker._deferred_model_loaders, {})
+        result = self.invoke(self.plugin_name, "bye")
+        self.assertEqual(result.exit_code, 0)
+        self.assertEqual(result.output.strip(), "bye")
+        self.lazy_loader.assert_called_once_with()
+
+    def test_dispatch_removes_deferred_model_loader(self) -> None:
+        self.invoke(self.plugin_name, "greet")
+        self.assertEqual(ConfigMaker._deferred_model_loaders, {})
+        ConfigMaker.load_deferred_models()
+        self.lazy_loader.assert_called_once_with()
+
+
+class PluginLoaderEnvVarsTestCase(TempCacheTestCase):
+    envvar = "RYA_TEST_LAZY_PLUGINS"
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.patch_attributes(int_plugin_def, lazy_load=False)
+        self.patch_attributes(ext_plugin_def, lazy_load=False)
+
+    def load(self, value: str) -> tuple[bool, bool]:
+        with mock.patch.dict("os.environ", {self.envvar: value}):
+            PluginLoaderEnvVars("rya_test").load()
+        return int_plugin_def.lazy_load, ext_plugin_def.lazy_load
+
+    def test_all_plugins(self) -> None:
+        for value in ("1", "true", "ON", " all "):
+            with self.subTest(value=value):
+                self.assertEqual(self.load(value), (True, True))
+
+    def test_plugin_kinds(self) -> None:
+        self.assertEqual(self.load("external"), (False, True))
+        self.assertEqual(self.load("Internal"), (True, False))
+        self.assertEqual(self.load("internal, external"), (True, True))
+
+    def test_disabled(self) -> None:
+        for value in ("", "0", "false", "off"):
+            with self.subTest(value=value):
+                self.load("all")
+                self.assertEqual(self.load(value), (False, False))
+
+    def test_unrecognized_value_keeps_definitions(self) -> None:
+        self.load("external")
+        with mock.patch.object(_plugin_handler, "logger") as logger:
+            self.assertEqual(self.load("external,plugins"), (False, True))
+        logger.warning.assert_called_once()
+
+    def test_unset_variable_keeps_definitions(self) -> None:
+        self.load("internal")
+        with mock.patch.dict("os.environ", clear=True):
+            PluginLoaderEnvVars("rya_test").load()
+        self.assertEqual(
+            (int_plugin_def.lazy_load, ext_plugin_def.lazy_load), (True, False)
+        )
@@ -0,0 +1,160 @@
+from typing import ClassVar
+from unittest import mock
+
+from pydantic import BaseModel
+
+from rya.config import ConfigMaker, FlattenedSchemaIndex, _model_handler
+
+from helpers import ConfigTestCase
+
+
+class InnerModel(BaseModel):
+    value: int = 1
+
+
+class MainModel(BaseModel):
+    name: str = "default"
+    inner: InnerModel = InnerModel()
+
+
+class OtherMainModel(BaseModel):
+    title: str = "default"
+
+
+class FirstPluginModel(BaseModel):
+    plugin_name: ClassVar[str] = "first"
+    speed: int = 5
+
+
+class ChangedFirstPluginModel(BaseModel):
+    plugin_name: ClassVar[str] = "first"
+    distance: int = 5
+
+
+class SecondPluginModel(BaseModel):
+    plugin_name: ClassVar[str] = "second"
+    speed: int = 5
+
+
+class FlattenedSchemaTestCase(ConfigTestCase):
+    def test_main_fields_come_before_plugin_fields(self) -> None:
+        ConfigMaker.add_model(FirstPluginModel)
+        ConfigMaker.add_model(MainModel)
+        ConfigMaker.add_model(SecondPluginModel)
+        self.assertEqual(
+            list(ConfigMaker.get_flattened_schema()),
+            ["name", "inner.value", "plugins.first.speed", "plugins.second.speed"],
+        )
+        self.assertIs(
+            ConfigMaker.get_flattened_schema()["plugins.first.speed"],
+            FirstPluginModel.model_fields["speed"],
+        )
+
+    def test_schema_is_a_live_read_only_view(self) -> None:
+        flattened_schema = ConfigMaker.get_flattened_schema()
+        ConfigMaker.add_model(MainModel)
+        self.assertEqual(list(flattened_schema), ["name", "inner.value"])
+        with self.assertRaises(TypeError):
+            flattened_schema["name"] = None  # type: ignore[index]
+
+    def test_reregistration_replaces_only_the_changed_model_fields(self) -> None:
+        ConfigMaker.add_model(MainModel)
+        ConfigMaker.add_model(FirstPluginModel)
+        ConfigMaker.add_model(SecondPluginModel)
+        ConfigMaker.add_model(ChangedFirstPluginModel, force_reregister=True)
+        self.assertEqual(
+            list(ConfigMaker.get_flattened_schema()),
+            [
+                "name",
+                "inner.value",
+                "plugins.first.distance",
+                "plugins.second.speed",
+            ],
+        )
+        ConfigMaker.add_model(OtherMainModel, force_reregister=True)
+        self.assertEqual(
+            list(ConfigMaker.get_flattened_schema()),
+            ["title", "plugins.first.distance", "plugins.second.speed"],
+        )
+
+    def test_models_are_parsed_once_per_registration(self) -> None:
+        with mock.patch.object(
+            _model_handler,
+            "get_pydantic_nested_model_fields",
+            wraps=_model_handler.get_pydantic_nested_model_fields,
+        ) as get_fields:
+            ConfigMaker.add_model(MainModel)
+            ConfigMaker.add_model(FirstPluginModel)
+            ConfigMaker.add_model(SecondPluginModel)
+            ConfigMaker.add_model(ChangedFirstPluginModel, force_reregister=True)
+        self.assertEqual(
+            [call.args[0] for call in get_fields.call_args_list],
+            [MainModel, FirstPluginModel, SecondPluginModel, ChangedFirstPluginModel],
+        )
+
+
+class FlattenedSchemaIndexTestCase(ConfigTestCase):
+    field_names = (
+        "name",
+        "inner.value",
+        "plugins.Zeta.speed",
+        "plugins.alpha.speed",
+        "plugins.alpha.speed_limit",
+        "plugins.alphabet.speed",
+    )
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.index = FlattenedSchemaIndex(self.field_names)
+
+    def test_lookups_are_case_insensitive_and_keep_schema_order(self) -> None:
+        self.assertEqual(len(self.index), len(self.field_names))
+        self.assertEqual(
+            self.index.get_prefixed("PLUGINS."), list(self.field_names[2:])
+        )
+        self.assertEqual(self.index.get_prefixed(""), list(self.field_names))
+        self.assertEqual(self.index.get_prefixed("missing"), [])
+        self.assertEqual(self.index.get_exact("Name"), ["name"])
+        self.assertEqual(self.index.get_exact("nam"), [])
+
+    def test_dotted_name_matches_whole_name_components(self) -> None:
+        self.assertEqual(
+            self.index.get_by_dotted_name("plugins.alpha"),
+            ["plugins.alpha.speed", "plugins.alpha.speed_limit"],
+        )
+        self.assertEqual(
+            self.index.get_by_dotted_name("plugins.alpha.speed"),
+            ["plugins.alpha.speed"],
+        )
+        self.assertEqual(
+            self.index.get_by_dotted_name("plugins.zeta"), ["plugins.Zeta.speed"]
+        )
+        self.assertEqual(self.index.get_by_dotted_name("plugins.alp"), [])
+
+    def test_lookups_match_a_linear_scan(self) -> None:
+        for prefix in ("", "p", "plugins.alpha", "inner.", "plugins.alphabet.speed"):
+            with self.subTest(prefix=prefix):
+                self.assertEqual(
+                    self.index.get_prefixed(prefix),
+                    [
+                        field_name
+                        for field_name in self.field_names
+                        if field_name.casefold().startswith(prefix.casefold())
+                    ],
+                )
+
+    def test_config_maker_index_is_rebuilt_after_registration(self) -> None:
+        ConfigMaker.add_model(MainModel)
+        index = ConfigMaker.get_flattened_schema_index()
+        self.assertIs(ConfigMaker.get_flattened_schema_index(), index)
+        self.assertEqual(index.get_prefixed("plugins."), [])
+        ConfigMaker.add_model(FirstPluginModel)
+        index = ConfigMaker.get_flattened_schema_index()
+        self.assertEqual(index.get_prefixed("plugins."), ["plugins.first.speed"])
+        ConfigMaker.add_model(ChangedFirstPluginModel, force_reregister=True)
+        self.assertEqual(
+            ConfigMaker.get_flattened_schema_index().get_by_dotted_name(
+                "plugins.first"
+            ),
+            ["plugins.first.distance"],
+        )
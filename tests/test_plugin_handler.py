@@ -0,0 +1,271 @@
+import sys
+import textwrap
+from concurrent.futures import ThreadPoolExecutor
+from unittest import mock
+
+from properpath import P
+
+from rya.cli import _plugin_handler, _venv_state_manager
+from rya.cli._plugin_handler import (
+    ExternalPluginHandler,
+    ExternalPluginLocationValidator,
+    InvalidPluginMetadata,
+    PluginLoaderEnvVars,
+    ext_plugin_def,
+    ext_plugin_meta,
+)
+
+from helpers import TempCacheTestCase
+
+
+class ExternalPluginVenvTestCase(TempCacheTestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        self.patch_attributes(
+            _venv_state_manager,
+            _cached_site_packages_dirs=None,
+            _site_packages_dirs={},
+        )
+        self.venv_dir = self.temp_dir / "venv"
+        self.write_file("venv/pyvenv.cfg", "version = 3.12.0\n")
+        self.write_file(
+            "venv/lib/python3.12/site-packages/rya_test_venv_dependency.py",
+            "VALUE = 'from venv'\n",
+        )
+        self.addCleanup(sys.modules.pop, "rya_test_venv_dependency", None)
+        self.project_dir = self.temp_dir / "project"
+        self.sys_path = list(sys.path)
+
+    def load_typer_app(self, plugin_name: str, cli_script_content: str):
+        cli_script = self.write_file(
+            f"project/{plugin_name}.py", textwrap.dedent(cli_script_content)
+        )
+        self.addCleanup(sys.modules.pop, plugin_name, None)
+        return ExternalPluginHandler.load_typer_app(
+            plugin_name, cli_script, self.project_dir, self.venv_dir
+        )
+
+    def test_plugin_imports_from_its_venv(self) -> None:
+        typer_app = self.load_typer_app(
+            "VenvPlugin",
+            """
+            import typer
+            from rya_test_venv_dependency import VALUE
+
+            app = typer.Typer(help=VALUE)
+            """,
+        )
+        self.assertIsNotNone(typer_app)
+        self.assertEqual(typer_app.info.name, "VenvPlugin")
+        self.assertEqual(typer_app.info.help, "from venv")
+        self.assertEqual(sys.path, self.sys_path)
+
+    def test_venv_is_removed_from_sys_path_without_typer_app(self) -> None:
+        self.assertIsNone(self.load_typer_app("no_app_plugin", "VALUE = 1\n"))
+        self.assertEqual(sys.path, self.sys_path)
+
+    def test_venv_is_removed_from_sys_path_when_plugin_fails(self) -> None:
+        with self.assertRaises(ZeroDivisionError):
+            self.load_typer_app("failing_plugin", "1 / 0\n")
+        self.assertEqual(sys.path, self.sys_path)
+
+    def test_site_packages_dir_is_resolved_without_walking_the_venv(self) -> None:
+        # pyvenv.cfg names a version whose directory does not exist
+        self.write_file("other_venv/pyvenv.cfg", "version_info = 3.99.0\n")
+        self.write_file("other_venv/lib/python3.12/site-packages/module.py", "")
+        self.write_file("windows_venv/Lib/site-packages/module.py", "")
+        with mock.patch.object(P, "rglob") as rglob:
+            self.assertEqual(
+                _venv_state_manager.get_site_packages_dir(self.temp_dir / "other_venv"),
+                self.temp_dir / "other_venv" / "lib" / "python3.12" / "site-packages",
+            )
+            self.assertEqual(
+                _venv_state_manager.get_site_packages_dir(
+                    self.temp_dir / "windows_venv"
+                ),
+                self.temp_dir / "windows_venv" / "Lib" / "site-packages",
+            )
+        rglob.assert_not_called()
+
+    def test_site_packages_dir_falls_back_to_walking_the_venv(self) -> None:
+        self.write_file("odd_venv/some/where/site-packages/module.py", "")
+        self.assertEqual(
+            _venv_state_manager.get_site_packages_dir(self.temp_dir / "odd_venv"),
+            self.temp_dir / "odd_venv" / "some" / "where" / "site-packages",
+        )
+        with self.assertRaises(ValueError):
+            _venv_state_manager.get_site_packages_dir(self.temp_dir / "project")
+
+    def test_site_packages_index_only_has_venvs_of_this_run(self) -> None:
+        site_packages_dir = self.venv_dir / "lib" / "python3.12" / "site-packages"
+        self.patch_attributes(
+            _venv_state_manager,
+            _cached_site_packages_dirs={
+                str(self.temp_dir / "removed_venv"): self.temp_dir / "removed",
+                str(self.venv_dir): site_packages_dir,
+            },
+        )
+        with mock.patch.object(
+            _venv_state_manager, "_resolve_site_packages_dir"
+        ) as resolve_site_packages_dir:
+            self.load_typer_app("indexed_plugin", "VALUE = 1\n")
+        resolve_site_packages_dir.assert_not_called()
+        self.assertEqual(
+            _venv_state_manager.get_site_packages_index(),
+            {str(self.venv_dir): site_packages_dir},
+        )
+
+
+class ExternalPluginLocationValidatorTestCase(TempCacheTestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        self.plugin_dir = self.temp_dir / "my_plugin"
+        self.write_file("my_plugin/src/main.py", "")
+        self.write_file("my_plugin/.venv/pyvenv.cfg", "")
+
+    def validate(self, metadata: str) -> dict:
+        self.write_file("my_plugin/plugin_metadata.toml", metadata)
+        return ExternalPluginLocationValidator(self.plugin_dir).validate()
+
+    def test_metadata_paths_are_relative_to_the_plugin_directory(self) -> None:
+        metadata_file = textwrap.dedent(
+            """\
+            Plugin_Name = "my_plugin"
+            CLI_SCRIPT = "src/main.py"
+            venv_dir = ".venv"
+            """
+        )
+        expected_metadata = {
+            ext_plugin_meta.file_exists: True,
+            ext_plugin_meta.plugin_name: "my_plugin",
+            ext_plugin_meta.cli_script_path: self.plugin_dir / "src" / "main.py",
+            ext_plugin_meta.venv_path: self.plugin_dir / ".venv",
+            ext_plugin_meta.project_path: self.plugin_dir / "src",
+        }
+        self.assertEqual(self.validate(metadata_file), expected_metadata)
+        # Dynaconf reads the same metadata file the same way
+        self.patch_attributes(ext_plugin_def, dynaconf_metadata_reader=True)
+        self.assertEqual(self.validate(metadata_file), expected_metadata)
+
+    def test_invalid_metadata_files(self) -> None:
+        for metadata_file, error in (
+            ("cli_script = ", "couldn't be parsed"),
+            ("cli_script = []", "Key 'cli_script'"),
+            ('cli_script = "missing.py"', "'missing.py' does not exist"),
+            ("", "No cli.py script is found"),
+            ('cli_script = "src/main.py"\nvenv_dir = "venv"', "'venv' does not exist"),
+            ('cli_script = "src/main.py"\nplugin_name = "other"', "same name"),
+        ):
+            with (
+                self.subTest(metadata_file=metadata_file),
+                self.assertRaisesRegex(InvalidPluginMetadata, error),
+            ):
+                self.validate(metadata_file)
+
+    def test_directory_without_metadata_or_cli_script_is_not_a_plugin(self) -> None:
+        with self.assertRaisesRegex(ValueError, "not a proper plugin directory"):
+            ExternalPluginLocationValidator(self.plugin_dir).validate()
+
+
+class ExternalPluginDiscoveryTestCase(TempCacheTestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        self.patch_attributes(ExternalPluginHandler, _plugin_index={})
+        self.patch_attributes(ext_plugin_def, dir=self.temp_dir / "plugins")
+        # Directories are created in an order different from the sorted order
+        self.write_file("plugins/c_plugin/cli.py", "")
+        self.write_file(
+            "plugins/c_plugin/plugin_metadata.toml", 'cli_script = "cli.py"'
+        )
+        self.write_file("plugins/D_broken/plugin_metadata.toml", "plugin_name = [")
+        self.write_file("plugins/A_plugin/cli.py", "")
+        self.write_file("plugins/e_not_a_plugin/README.md", "")
+        self.write_file(
+            "plugins/b_missing_script/plugin_metadata.toml",
+            'cli_script = "missing.py"\n',
+        )
+
+    def discover(self, workers: int, loading_errors: bool = False):
+        self.patch_attributes(ext_plugin_def, discovery_max_workers=workers)
+        with (
+            mock.patch.object(
+                _plugin_handler, "ThreadPoolExecutor", wraps=ThreadPoolExecutor
+            ) as executor,
+            mock.patch.object(_plugin_handler, "add_message") as add_message,
+        ):
+            plugin_names = [
+                metadata[ext_plugin_meta.plugin_name]
+                for metadata in ExternalPluginHandler.get_plugin_metadata(
+                    loading_errors
+                )
+            ]
+        self.assertEqual(executor.called, workers > 1)
+        messages = [call.args[0] for call in add_message.call_args_list]
+        return plugin_names, messages
+
+    def test_thread_pool_keeps_sorted_order_and_errors(self) -> None:
+        plugin_names, messages = self.discover(workers=4)
+        self.assertEqual(plugin_names, ["A_plugin", "c_plugin"])
+        self.assertEqual(len(messages), 2)
+        self.assertIn("b_missing_script", messages[0])
+        self.assertIn("D_broken", messages[1])
+        self.assertEqual(
+            sorted(ExternalPluginHandler.get_plugin_index()),
+            [str(self.temp_dir / "plugins" / name) for name in plugin_names],
+        )
+        self.assertEqual(self.discover(workers=1), (plugin_names, messages))
+
+    def test_thread_pool_raises_first_error_in_sorted_order(self) -> None:
+        with self.assertRaisesRegex(InvalidPluginMetadata, "missing.py"):
+            self.discover(workers=4, loading_errors=True)
+
+    @staticmethod
+    def get_called_names(get_validated_metadata: mock.Mock) -> set[str]:
+        return {call.args[0].name for call in get_validated_metadata.call_args_list}
+
+    def test_unchanged_plugin_directories_are_not_validated_again(self) -> None:
+        plugin_names, _ = self.discover(workers=1)
+        with mock.patch.object(
+            ExternalPluginLocationValidator,
+            "_get_validated_metadata",
+            wraps=ExternalPluginLocationValidator._get_validated_metadata,
+        ) as get_validated_metadata:
+            self.assertEqual(self.discover(workers=1)[0], plugin_names)
+            # Only invalid plugin directories (which are not indexed) are validated
+            self.assertEqual(
+                self.get_called_names(get_validated_metadata),
+                {"b_missing_script", "D_broken", "e_not_a_plugin"},
+            )
+            get_validated_metadata.reset_mock()
+            # Editing the metadata file does not change the directory's mtime
+            self.write_file(
+                "plugins/c_plugin/plugin_metadata.toml", 'cli_script = "./cli.py"'
+            )
+            self.assertEqual(self.discover(workers=1)[0], plugin_names)
+            self.assertIn("c_plugin", self.get_called_names(get_validated_metadata))
+            self.assertNotIn("A_plugin", self.get_called_names(get_validated_metadata))
+
+    def test_removed_plugin_directories_are_dropped_from_the_index(self) -> None:
+        self.discover(workers=1)
+        plugin_dir = self.temp_dir / "plugins" / "A_plugin"
+        self.assertIn(str(plugin_dir), ExternalPluginHandler.get_plugin_index())
+        (plugin_dir / "cli.py").unlink()
+        plugin_dir.rmdir()
+        self.assertEqual(self.discover(workers=1)[0], ["c_plugin"])
+        self.assertNotIn(str(plugin_dir), ExternalPluginHandler.get_plugin_index())
+
+    def test_discovery_workers_envvar(self) -> None:
+        self.patch_attributes(ext_plugin_def, discovery_max_workers=8)
+        envvar = f"RYA_TEST_{PluginLoaderEnvVars.discovery_workers_envvar_suffix}"
+        with mock.patch.dict("os.environ", {envvar: "2"}):
+            PluginLoaderEnvVars("rya_test").load()
+        self.assertEqual(ext_plugin_def.discovery_max_workers, 2)
+        for value in ("0", "many"):
+            with (
+                self.subTest(value=value),
+                mock.patch.dict("os.environ", {envvar: value}),
+                mock.patch.object(_plugin_handler, "logger") as logger,
+            ):
+                PluginLoaderEnvVars("rya_test").load()
+                logger.warning.assert_called_once()
+                self.assertEqual(ext_plugin_def.discovery_max_workers, 2)
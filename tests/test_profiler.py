@@ -0,0 +1,89 @@
+import json
+import threading
+from unittest import mock
+
+from rya.kernel import StartupProfiler, _profiler
+
+from helpers import TempCacheTestCase
+
+
+class StartupProfilerTestCase(TempCacheTestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        self.patch_attributes(
+            StartupProfiler,
+            _output_format=None,
+            _output_file=None,
+            _spans=[],
+            _span_depth=threading.local(),
+        )
+        atexit_patch = mock.patch.object(_profiler, "atexit")
+        self.atexit = atexit_patch.start()
+        self.addCleanup(atexit_patch.stop)
+        self.output_file = self.temp_dir / "profile.out"
+
+    def load(self, output_format: str) -> None:
+        with mock.patch.dict(
+            "os.environ",
+            {
+                "RYA_TEST_PROFILE": output_format,
+                "RYA_TEST_PROFILE_FILE": str(self.output_file),
+            },
+        ):
+            StartupProfiler("rya_test").load()
+
+    def record_spans(self) -> None:
+        with StartupProfiler.span("outer"):
+            with StartupProfiler.span("inner", category="plugin_import"):
+                pass
+
+    def test_disabled_profiler_records_nothing(self) -> None:
+        self.load("off")
+        self.record_spans()
+        self.assertFalse(StartupProfiler.is_enabled())
+        self.assertEqual(StartupProfiler.get_spans(), [])
+        self.atexit.register.assert_not_called()
+
+    def test_unrecognized_format_disables_profiler(self) -> None:
+        with mock.patch.object(_profiler, "logger") as logger:
+            self.load("flamegraph")
+        logger.warning.assert_called_once()
+        self.assertFalse(StartupProfiler.is_enabled())
+
+    def test_json_report(self) -> None:
+        self.load("json")
+        self.record_spans()
+        self.atexit.register.assert_called_once_with(StartupProfiler.report)
+        StartupProfiler.report()
+        report = json.loads(self.output_file.read_text())
+        self.assertEqual(
+            [
+                (span["name"], span["category"], span["depth"])
+                for span in report["spans"]
+            ],
+            [
+                ("imports", "import", 0),
+                ("outer", "startup", 0),
+                ("inner", "plugin_import", 1),
+            ],
+        )
+        self.assertGreaterEqual(report["total_ms"], report["spans"][1]["duration_ms"])
+
+    def test_table_report(self) -> None:
+        self.load("1")
+        self.record_spans()
+        StartupProfiler.report()
+        lines = self.output_file.read_text().splitlines()
+        self.assertEqual(lines[0].split()[:2], ["Phase", "Category"])
+        self.assertTrue(lines[4].startswith("  inner"))
+        self.assertTrue(lines[-1].startswith("total"))
+
+    def test_trace_report(self) -> None:
+        self.load("trace")
+        self.record_spans()
+        StartupProfiler.report()
+        events = json.loads(self.output_file.read_text())["traceEvents"]
+        self.assertEqual(
+            [event["name"] for event in events], ["imports", "outer", "inner"]
+        )
+        self.assertEqual({event["ph"] for event in events}, {"X"})
@@ -0,0 +1,70 @@
+import os
+import textwrap
+import unittest
+
+from rya.utils import PythonVersionCheckFailed, get_external_python_version, utils
+
+from helpers import TempCacheTestCase
+
+
+@unittest.skipUnless(os.name == "posix", "The fake interpreter is a shell script")
+class ExternalPythonVersionTestCase(TempCacheTestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        self.patch_attributes(
+            utils, _cached_python_versions={}, _probed_python_versions={}
+        )
+        self.venv_dir = self.temp_dir / "venv"
+        self.probes = self.temp_dir / "probes"
+        self.write_python("Python 3.12.1")
+
+    def write_python(self, version_output: str) -> None:
+        python = self.write_file(
+            "venv/bin/python",
+            textwrap.dedent(
+                f"""\
+                #!/bin/sh
+                echo probed >> '{self.probes}'
+                echo '{version_output}'
+                """
+            ),
+        )
+        python.chmod(0o755)
+
+    def get_probe_count(self) -> int:
+        return len(self.probes.read_text().splitlines())
+
+    def start_next_run(self) -> None:
+        self.patch_attributes(
+            utils,
+            _cached_python_versions=utils.get_python_version_index(),
+            _probed_python_versions={},
+        )
+
+    def test_version_is_probed_once_per_interpreter(self) -> None:
+        self.assertEqual(get_external_python_version(self.venv_dir), ("3", "12", "1"))
+        self.start_next_run()
+        self.assertEqual(get_external_python_version(self.venv_dir), ("3", "12", "1"))
+        self.assertEqual(self.get_probe_count(), 1)
+        self.assertEqual(
+            list(utils.get_python_version_index()),
+            [str((self.venv_dir / "bin" / "python").resolve())],
+        )
+
+    def test_changed_interpreter_is_probed_again(self) -> None:
+        get_external_python_version(self.venv_dir)
+        self.start_next_run()
+        self.write_python("Python 3.13.10")
+        self.assertEqual(get_external_python_version(self.venv_dir), ("3", "13", "10"))
+        self.assertEqual(self.get_probe_count(), 2)
+
+    def test_removed_interpreters_are_dropped_from_the_index(self) -> None:
+        get_external_python_version(self.venv_dir)
+        self.start_next_run()
+        self.assertEqual(utils.get_python_version_index(), {})
+
+    def test_unexpected_version_output_fails(self) -> None:
+        self.write_python("not a version")
+        with self.assertRaises(PythonVersionCheckFailed):
+            get_external_python_version(self.venv_dir)
+        self.assertEqual(utils.get_python_version_index(), {})
@@ -0,0 +1,306 @@
+from typing import ClassVar, Optional
+from unittest import mock
+
+from pydantic import BaseModel, ConfigDict, PrivateAttr, SecretStr, field_validator
+
+from rya.config import AppConfig, ConfigMaker, _validation_handler
+from rya.pre_init import get_cached_data
+
+from helpers import _ABSENT, ConfigTestCase
+
+
+class MainModel(BaseModel):
+    name: str = "default"
+
+
+class PluginModel(BaseModel):
+    plugin_name: ClassVar[str] = "p1"
+    speed: int = 5
+
+
+class MixedCasePluginModel(BaseModel):
+    plugin_name: ClassVar[str] = "MyPlugin"
+    speed: int = 5
+
+
+class PluginSettingsTestCase(ConfigTestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        ConfigMaker.add_model(MainModel)
+
+    def test_plugin_tables_are_matched_case_insensitively(self) -> None:
+        ConfigMaker.add_model(PluginModel)
+        ConfigMaker.add_model(MixedCasePluginModel)
+        self.write_settings(
+            'name = "x"\n[plugins.P1]\nspeed = 77\n[plugins.myplugin]\nspeed = 78\n'
+        )
+        validated = AppConfig.validate()
+        self.assertEqual(validated.plugins.p1.speed, 77)
+        self.assertEqual(validated.plugins.MyPlugin.speed, 78)
+        self.assertEqual(AppConfig.plugin_validate("p1").speed, 77)
+        self.assertEqual(AppConfig.plugin_validate("MyPlugin").speed, 78)
+
+    def test_plugin_tables_are_matched_case_insensitively_from_snapshot(
+        self,
+    ) -> None:
+        self.patch_attributes(AppConfig, use_settings_snapshot=True)
+        ConfigMaker.add_model(PluginModel)
+        self.write_settings("[plugins.P1]\nspeed = 77\n")
+        self.assertEqual(AppConfig.validate().plugins.p1.speed, 77)
+        # Read back from the snapshot in the (in-process) cache
+        self.patch_attributes(AppConfig, _settings_data=None)
+        self.assertEqual(AppConfig.validate(reload=True).plugins.p1.speed, 77)
+
+
+class ValidationSessionTestCase(ConfigTestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        ConfigMaker.add_model(MainModel)
+        ConfigMaker.add_model(PluginModel)
+        self.write_settings('name = "x"\n')
+
+    @staticmethod
+    def validate() -> BaseModel:
+        # Same as the validation at CLI startup
+        return AppConfig.validate(reload=True, use_session=True)
+
+    def test_unchanged_configuration_is_validated_once(self) -> None:
+        with mock.patch.object(
+            AppConfig, "main_validate", wraps=AppConfig.main_validate
+        ) as main_validate:
+            validated = self.validate()
+            self.assertIs(self.validate(), validated)
+            main_validate.assert_called_once()
+
+    def test_changed_settings_file_is_validated_again(self) -> None:
+        self.validate()
+        self.write_settings('name = "changed"\n')
+        self.assertEqual(self.validate().name, "changed")
+
+    def test_changed_environment_variables_are_validated_again(self) -> None:
+        self.patch_attributes(
+            AppConfig,
+            dynaconf_args=AppConfig.dynaconf_args.model_copy(
+                update={"loaders": ["dynaconf.loaders.env_loader"]}
+            ),
+        )
+        self.assertEqual(self.validate().name, "x")
+        envvar = f"{AppConfig.dynaconf_args.envvar_prefix}_NAME"
+        with mock.patch.dict("os.environ", {envvar: "from env"}):
+            self.assertEqual(self.validate().name, "from env")
+
+    def test_validation_without_session_is_not_reused(self) -> None:
+        validated = self.validate()
+        self.assertIsNot(AppConfig.validate(), validated)
+        # Validation without a session also resets the session
+        self.assertIsNot(self.validate(), validated)
+
+
+class ModelClassCacheTestCase(ConfigTestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        ConfigMaker.add_model(MainModel)
+        ConfigMaker.add_model(PluginModel)
+        self.write_settings('name = "x"\n')
+
+    def test_composite_model_classes_are_reused(self) -> None:
+        validated = AppConfig.validate()
+        model_classes = dict(AppConfig._model_classes)
+        revalidated = AppConfig.validate(reload=True)
+        self.assertIsNot(revalidated, validated)
+        self.assertIs(revalidated.__class__, validated.__class__)
+        self.assertIs(revalidated.plugins.__class__, validated.plugins.__class__)
+        self.assertEqual(AppConfig._model_classes, model_classes)
+
+    def test_different_fields_create_different_model_classes(self) -> None:
+        validated = AppConfig.validate()
+        ConfigMaker.add_model(MixedCasePluginModel)
+        revalidated = AppConfig.validate()
+        self.assertIsNot(revalidated.plugins.__class__, validated.plugins.__class__)
+        self.assertEqual(
+            set(revalidated.plugins.__class__.model_fields), {"p1", "MyPlugin"}
+        )
+
+    def test_incomplete_models_use_their_own_classes(self) -> None:
+        complete_plugins_class = AppConfig.validate().plugins.__class__
+        self.write_settings('name = "x"\n[plugins.p1]\nspeed = "fast"\n')
+        with mock.patch.object(_validation_handler, "logger") as logger:
+            incomplete_plugins = AppConfig.validate(
+                errors="ignore", reload=True
+            ).plugins
+        logger.warning.assert_called_once()
+        self.assertIsNot(incomplete_plugins.__class__, complete_plugins_class)
+        self.assertTrue(incomplete_plugins.__class__.__name__.startswith("Incomplete"))
+
+
+class IncrementalPluginValidationTestCase(ConfigTestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        ConfigMaker.add_model(MainModel)
+        ConfigMaker.add_model(PluginModel)
+        self.write_settings('name = "x"\n[plugins.p1]\nspeed = 7\n')
+
+    def test_plugins_with_unchanged_settings_are_not_validated_again(self) -> None:
+        plugin_model = AppConfig.validate().plugins.p1
+        self.assertIs(AppConfig.plugins_validate(reload=True).p1, plugin_model)
+        self.write_settings('name = "x"\n[plugins.p1]\nspeed = 8\n')
+        revalidated_plugin_model = AppConfig.plugins_validate(reload=True).p1
+        self.assertIsNot(revalidated_plugin_model, plugin_model)
+        self.assertEqual(revalidated_plugin_model.speed, 8)
+
+    def test_plugin_with_replaced_model_is_validated_again(self) -> None:
+        plugin_model = AppConfig.validate().plugins.p1
+
+        class ReplacedPluginModel(PluginModel):
+            speed: int = 1
+
+        ConfigMaker.add_model(ReplacedPluginModel, force_reregister=True)
+        revalidated_plugin_model = AppConfig.plugins_validate().p1
+        self.assertIsInstance(revalidated_plugin_model, ReplacedPluginModel)
+        self.assertIsNot(revalidated_plugin_model, plugin_model)
+
+    def test_session_only_validates_newly_registered_plugins(self) -> None:
+        validated = AppConfig.validate(reload=True, use_session=True)
+        ConfigMaker.add_model(MixedCasePluginModel)
+        with (
+            mock.patch.object(
+                AppConfig, "main_validate", wraps=AppConfig.main_validate
+            ) as main_validate,
+            mock.patch.object(
+                PluginModel, "__init__", wraps=PluginModel.__init__
+            ) as plugin_model_init,
+        ):
+            revalidated = AppConfig.validate(reload=True, use_session=True)
+        main_validate.assert_not_called()
+        plugin_model_init.assert_not_called()
+        self.assertIsNot(revalidated, validated)
+        self.assertIs(revalidated.plugins.p1, validated.plugins.p1)
+        self.assertEqual(revalidated.plugins.MyPlugin.speed, 5)
+        self.assertEqual(revalidated.name, "x")
+
+
+class SettingsSnapshotTestCase(ConfigTestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        self.patch_attributes(AppConfig, use_settings_snapshot=True)
+        ConfigMaker.add_model(MainModel)
+
+    @staticmethod
+    def get_snapshot():
+        return getattr(get_cached_data().app_meta, "settings_snapshot", None)
+
+    def start_next_run(self) -> None:
+        self.patch_attributes(
+            AppConfig, _settings_data=None, _dynaconf_settings=_ABSENT
+        )
+
+    def test_snapshot_is_used_until_the_settings_change(self) -> None:
+        self.write_settings('name = "x"\n[nested]\nvalue = [1, 2]\n')
+        settings_data = AppConfig.get_settings_data()
+        self.assertEqual(self.get_snapshot().data, settings_data)
+        self.start_next_run()
+        with mock.patch.object(
+            AppConfig, "_load_settings_data", wraps=AppConfig._load_settings_data
+        ) as load_settings_data:
+            self.assertEqual(AppConfig.get_settings_data(), settings_data)
+            load_settings_data.assert_not_called()
+            self.start_next_run()
+            self.write_settings('name = "changed"\n')
+            settings_data = AppConfig.get_settings_data()
+            self.assertEqual(settings_data["name"], "changed")
+            load_settings_data.assert_called_once()
+        self.assertEqual(self.get_snapshot().data, settings_data)
+
+    def test_settings_with_secret_names_are_not_stored(self) -> None:
+        for settings in (
+            'api_key = "x"\n',
+            '[service]\nPassword = "x"\n',
+            '[[servers]]\ntoken = "x"\n',
+        ):
+            with self.subTest(settings=settings):
+                self.write_settings(settings)
+                self.start_next_run()
+                with mock.patch.object(_validation_handler, "logger") as logger:
+                    AppConfig.get_settings_data()
+                logger.warning.assert_called_once()
+                self.assertIsNone(self.get_snapshot())
+
+    def test_settings_of_secret_fields_are_not_stored(self) -> None:
+        class SecretPluginModel(BaseModel):
+            plugin_name: ClassVar[str] = "secret_plugin"
+            value: Optional[SecretStr] = None
+
+        ConfigMaker.add_model(SecretPluginModel)
+        self.write_settings('[plugins.secret_plugin]\nvalue = "x"\n')
+        with mock.patch.object(_validation_handler, "logger"):
+            AppConfig.get_settings_data()
+        self.assertIsNone(self.get_snapshot())
+
+    def test_settings_with_secrets_files_are_not_stored(self) -> None:
+        self.write_file(".secrets.toml", 'name = "x"\n')
+        self.patch_attributes(
+            AppConfig,
+            dynaconf_args=AppConfig.dynaconf_args.model_copy(
+                update={"settings_files": ["settings.toml", ".secrets.toml"]}
+            ),
+        )
+        self.write_settings("")
+        with mock.patch.object(_validation_handler, "logger"):
+            self.assertEqual(AppConfig.get_settings_data()["name"], "x")
+        self.assertIsNone(self.get_snapshot())
+
+
+class ComposedMainModel(BaseModel):
+    model_config = ConfigDict(extra="allow")
+    validation_count: ClassVar[int] = 0
+
+    name: str = "default"
+    inner: MainModel = MainModel()
+    _token: str = PrivateAttr(default="private")
+
+    @field_validator("name")
+    @classmethod
+    def count_validation(cls, value: str) -> str:
+        ComposedMainModel.validation_count += 1
+        return value
+
+
+class ComposedModelTestCase(ConfigTestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        self.patch_attributes(ComposedMainModel, validation_count=0)
+        ConfigMaker.add_model(ComposedMainModel)
+        ConfigMaker.add_model(PluginModel)
+        self.write_settings('name = "x"\nextra = 1\n[inner]\nname = "y"\n')
+
+    def test_main_model_is_not_validated_again(self) -> None:
+        validated = AppConfig.validate()
+        self.assertEqual(ComposedMainModel.validation_count, 1)
+        self.assertIsInstance(validated, ComposedMainModel)
+        self.assertEqual(
+            validated.model_dump(include={"name", "inner", "extra", "plugins"}),
+            {
+                "name": "x",
+                "inner": {"name": "y"},
+                "extra": 1,
+                "plugins": {"p1": {"speed": 5}},
+            },
+        )
+
+    def test_composed_model_keeps_main_model_state(self) -> None:
+        main_model = ComposedMainModel(name="x", extra=1)
+        main_model._token = "changed"
+        plugins_model = AppConfig.plugins_validate()
+        validated = AppConfig._get_validated_model(main_model, plugins_model)
+        self.assertIs(validated.inner, main_model.inner)
+        self.assertIs(validated.plugins, plugins_model)
+        self.assertEqual(validated.model_fields_set, {"name", "extra", "plugins"})
+        self.assertEqual(validated.model_extra, {"extra": 1})
+        self.assertEqual(validated._token, "changed")
+        # The private attributes are copied, not shared
+        validated._token = "composed"
+        self.assertEqual(main_model._token, "changed")
+        self.assertEqual(
+            validated.model_dump(exclude_unset=True),
+            {"name": "x", "extra": 1, "plugins": {"p1": {}}},
+        )